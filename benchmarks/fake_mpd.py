@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Stand-in MPD server for benchmarks
+
+Speaks the parts of the MPD protocol moode_display.py uses: status,
+currentsong, playlistid, command lists, idle/noidle, albumart/readpicture
+with binarylimit, and the transport/volume commands. The queue is a
+list of generated songs; next_track() advances it and wakes idle clients
+like a real track change would. Standalone, --players N serves several
+independent queues on consecutive ports (multi-player mode).
+"""
+
+import argparse
+import os
+import select
+import socketserver
+import threading
+import time
+
+PROTOCOL_VERSION = "0.23.5"
+DEFAULT_BINARY_LIMIT = 8192
+
+class FakeMPDState:
+    """Queue, player state and cover art shared by all connections"""
+    
+    def __init__(self, songs, covers=None):
+        self.songs = songs  # List of dicts (file, Artist, Title, Album, duration)
+        self.covers = covers or {}  # Album directory -> JPEG bytes
+        self.position = 0
+        self.state = "play"
+        self.volume = 50
+        self.started_at = time.monotonic()
+        self.elapsed_at_start = 0.0
+        self.lock = threading.Lock()
+        self.changed = threading.Condition(self.lock)
+        self.events = []  # (sequence number, subsystem)
+        self.sequence = 0
+        self.commands = 0  # Commands handled (for the benchmark report)
+    
+    def notify(self, *subsystems):
+        """Caller holds the lock"""
+        for subsystem in subsystems:
+            self.sequence += 1
+            self.events.append((self.sequence, subsystem))
+        del self.events[:-100]
+        self.changed.notify_all()
+    
+    def elapsed(self):
+        if self.state == "play":
+            return self.elapsed_at_start + time.monotonic() - self.started_at
+        return self.elapsed_at_start
+    
+    def play(self, position=None):
+        if position is not None:
+            self.position = position % len(self.songs)
+            self.elapsed_at_start = 0.0
+        elif self.state == "pause":
+            self.elapsed_at_start = self.elapsed()
+        self.started_at = time.monotonic()
+        self.state = "play"
+        self.notify("player")
+    
+    def next_track(self, offset=1):
+        with self.lock:
+            self.play(self.position + offset)
+    
+    def set_state(self, state):
+        with self.lock:
+            self.elapsed_at_start = self.elapsed()
+            self.started_at = time.monotonic()
+            self.state = state
+            self.notify("player")
+    
+    def song(self, position):
+        song = dict(self.songs[position % len(self.songs)])
+        song["Pos"] = position % len(self.songs)
+        song["Id"] = song["Pos"] + 1
+        return song
+    
+    def status(self):
+        pairs = [("volume", self.volume), ("repeat", 1), ("random", 0),
+                 ("single", 0), ("consume", 0), ("playlistlength", len(self.songs)),
+                 ("state", self.state)]
+        if self.state != "stop":
+            song = self.song(self.position)
+            following = self.song(self.position + 1)
+            pairs += [("song", song["Pos"]), ("songid", song["Id"]),
+                      ("nextsong", following["Pos"]), ("nextsongid", following["Id"]),
+                      ("elapsed", f"{self.elapsed():.3f}"),
+                      ("duration", song.get("duration", 0)),
+                      ("audio", "44100:16:2")]
+        return pairs
+
+class FakeMPDHandler(socketserver.StreamRequestHandler):
+    """One client connection"""
+    
+    def setup(self):
+        super().setup()
+        self.binary_limit = DEFAULT_BINARY_LIMIT
+        # Changes up to here were reported; like MPD, later ones (also
+        # those made between two idles) are reported by the next idle
+        with self.state.lock:
+            self.reported = self.state.sequence
+    
+    @property
+    def state(self):
+        return self.server.state
+    
+    def handle(self):
+        self.wfile.write(f"OK MPD {PROTOCOL_VERSION}\n".encode())
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode("utf-8").strip()
+            if command in ("command_list_begin", "command_list_ok_begin"):
+                self.run_list(list_ok=command == "command_list_ok_begin")
+            elif command.split(" ", 1)[0] == "idle":
+                if not self.idle():
+                    return
+            elif command == "noidle":
+                continue  # Idle already answered - MPD ignores it too
+            elif command == "close":
+                return
+            else:
+                result = self.run(command)
+                if not (result and result[0].startswith(b"ACK")):
+                    result.append(b"OK\n")
+                self.respond(result)
+    
+    def respond(self, chunks):
+        self.wfile.write(b"".join(chunks))
+    
+    def run_list(self, list_ok):
+        commands = []
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode("utf-8").strip()
+            if command == "command_list_end":
+                break
+            commands.append(command)
+        
+        out = []
+        for index, command in enumerate(commands):
+            result = self.run(command, index)
+            out += result
+            if result and result[0].startswith(b"ACK"):
+                self.respond(out)
+                return
+            if list_ok:
+                out.append(b"list_OK\n")
+        out.append(b"OK\n")
+        self.respond(out)
+    
+    def idle(self):
+        """Wait for a change or noidle; False if the client went away"""
+        while True:
+            with self.state.lock:
+                changed = self.pending_changes()
+                if not changed:
+                    self.state.changed.wait(0.05)
+                    changed = self.pending_changes()
+                if changed:
+                    self.reported = self.state.sequence
+            if changed:
+                self.respond([f"changed: {s}\n".encode() for s in changed] + [b"OK\n"])
+                return True
+            
+            readable, _, _ = select.select([self.connection], [], [], 0)
+            if readable:
+                line = self.rfile.readline()
+                if not line:
+                    return False
+                self.respond([b"OK\n"])  # noidle
+                return True
+    
+    def pending_changes(self):
+        """Subsystems changed since the last report (caller holds the lock)"""
+        return sorted({s for n, s in self.state.events if n > self.reported})
+    
+    def run(self, command, index=0):
+        """Execute one command, return output chunks (without the final OK)"""
+        name, args = parse_command(command)
+        state = self.state
+        with state.lock:
+            state.commands += 1
+            if name == "status":
+                return pairs_out(state.status())
+            if name == "currentsong":
+                if state.state == "stop":
+                    return []
+                return pairs_out(state.song(state.position).items())
+            if name == "playlistid":
+                song_id = int(args[0]) if args else 0
+                if not 1 <= song_id <= len(state.songs):
+                    return [ack(50, index, name, "No such song")]
+                return pairs_out(state.song(song_id - 1).items())
+            if name in ("albumart", "readpicture"):
+                return self.picture(name, args, index)
+            if name == "binarylimit":
+                self.binary_limit = int(args[0])
+                return []
+            if name == "setvol":
+                state.volume = max(0, min(100, int(args[0])))
+                state.notify("mixer")
+                return []
+            if name == "play":
+                state.play(int(args[0]) if args else None)
+                return []
+            if name == "pause":
+                paused = not args or args[0] == "1"
+                state.elapsed_at_start = state.elapsed()
+                state.started_at = time.monotonic()
+                state.state = "pause" if paused else "play"
+                state.notify("player")
+                return []
+            if name == "stop":
+                state.elapsed_at_start = 0.0
+                state.state = "stop"
+                state.notify("player")
+                return []
+            if name in ("next", "previous"):
+                state.play(state.position + (1 if name == "next" else -1))
+                return []
+            if name in ("clear", "add"):
+                state.notify("playlist")
+                return []
+            if name == "ping":
+                return []
+        return [ack(5, index, name, f'unknown command "{name}"')]
+    
+    def picture(self, name, args, index):
+        """Chunked cover art; readpicture of a song without art is empty"""
+        uri, offset = args[0], int(args[1]) if len(args) > 1 else 0
+        data = self.state.covers.get(os.path.dirname(uri))
+        if data is None:
+            return [] if name == "readpicture" else [ack(50, index, name, "No file exists")]
+        chunk = data[offset:offset + self.binary_limit]
+        return [f"size: {len(data)}\nbinary: {len(chunk)}\n".encode(), chunk, b"\n"]
+
+def parse_command(command):
+    """Split a command line into name and (unquoted) arguments"""
+    name, _, rest = command.partition(" ")
+    args = []
+    i = 0
+    while i < len(rest):
+        if rest[i] == " ":
+            i += 1
+        elif rest[i] == '"':
+            value = []
+            i += 1
+            while i < len(rest) and rest[i] != '"':
+                if rest[i] == "\\":
+                    i += 1
+                value.append(rest[i])
+                i += 1
+            args.append("".join(value))
+            i += 1
+        else:
+            end = rest.find(" ", i)
+            end = len(rest) if end < 0 else end
+            args.append(rest[i:end])
+            i = end
+    return name, args
+
+def pairs_out(pairs):
+    return ["".join(f"{k}: {v}\n" for k, v in pairs).encode("utf-8")]
+
+def ack(code, index, name, message):
+    return f"ACK [{code}@{index}] {{{name}}} {message}\n".encode("utf-8")
+
+class FakeMPDServer(socketserver.ThreadingTCPServer):
+    """Fake MPD on 127.0.0.1 (port 0 = any free port)"""
+    
+    daemon_threads = True
+    allow_reuse_address = True
+    
+    def __init__(self, state, port=0):
+        self.state = state
+        super().__init__(("127.0.0.1", port), FakeMPDHandler)
+    
+    @property
+    def port(self):
+        return self.server_address[1]
+    
+    def start(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+    
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+if __name__ == "__main__":
+    # Standalone: serve small queues for manual testing
+    parser = argparse.ArgumentParser(description="Fake MPD server(s)")
+    parser.add_argument("--port", type=int, default=6600, help="first port")
+    parser.add_argument("--players", type=int, default=1,
+                        help="independent servers on consecutive ports, for "
+                             "moode_display.py's multi-player mode")
+    args = parser.parse_args()
+    
+    servers = []
+    for player in range(args.players):
+        songs = [{"file": f"Player {player}/Album {n // 10:02d}/{n % 10:02d}.flac",
+                  "Artist": f"Artist {n // 10}", "Title": f"Track {n} on player {player}",
+                  "Album": f"Album {n // 10}", "duration": 240} for n in range(100)]
+        servers.append(FakeMPDServer(FakeMPDState(songs), port=args.port + player).start())
+    for player, server in enumerate(servers):
+        print(f"Fake MPD listening on 127.0.0.1:{server.port}")
+    if len(servers) > 1:
+        print("python3 moode_display.py " + " ".join(
+            f"--player Room{n}=127.0.0.1:{s.port}" for n, s in enumerate(servers)))
+    print("Ctrl+C to stop")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        for server in servers:
+            server.stop()
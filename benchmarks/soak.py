@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+Benchmark and soak run for moode_display.py
+
+Runs the real MoodeDisplay off-device against:
+- a fake MPD server (fake_mpd.py, in a child process) with generated
+  songs and cover art
+- a temporary spotmeta.txt written like moOde's Spotify renderer does
+- a generated moode-sqlite3.db with --stations radio stations
+
+Needs an X display; without $DISPLAY a private Xvfb is started.
+
+Usage:
+    python3 benchmarks/soak.py                     # 2000 track changes
+    python3 benchmarks/soak.py --tracks 500 --stations 20000
+    python3 benchmarks/soak.py --compare OLD.json NEW.json
+
+Results (time to first frame, tick latency percentiles, CPU per tick,
+art pipeline throughput, radio page-flip time, memory growth) are
+printed and saved to benchmarks/results/<date>-<version>.json.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import random
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from io import BytesIO
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+import moode_display as md
+from fake_mpd import FakeMPDServer, FakeMPDState
+from PIL import Image, ImageDraw, ImageFilter
+
+RESULTS_DIR = os.path.join(HERE, "results")
+GENRES = ["Pop", "Rock", "Jazz", "Classical", "News", "Talk", "Electronic",
+          "Ambient", "Folk", "Country", "Hip Hop", "Blues", "Soul", "Reggae"]
+COUNTRIES = ["United Kingdom", "United States", "Germany", "France", "Italy",
+             "Netherlands", "Spain", "Canada", "Australia", "Japan", "Brazil"]
+WORDS = ["Radio", "FM", "Classic", "Smooth", "Jazz", "Heart", "Capital", "Wave",
+         "Planet", "Sky", "City", "Soul", "Deep", "Chill", "Retro", "Nova",
+         "Absolute", "Magic", "Sunset", "Coast", "Metro", "Kiss", "Energy"]
+
+class RecordingMetrics(md.Metrics):
+    """Metrics that also keep every sample for exact percentiles"""
+    
+    def __init__(self):
+        super().__init__()
+        self.samples = {}
+    
+    def observe(self, stage, ms):
+        super().observe(stage, ms)
+        self.samples.setdefault(stage, []).append(ms)
+
+def make_station_db(path, count, logo_dir, seed=1):
+    """moOde-like cfg_radio table with count stations (every 3rd has a logo)"""
+    rng = random.Random(seed)
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE cfg_radio (id INTEGER PRIMARY KEY, station TEXT, "
+                 "name TEXT, type TEXT, logo TEXT, genre TEXT, broadcaster TEXT, "
+                 "language TEXT, country TEXT, region TEXT, bitrate TEXT, format TEXT)")
+    rows = []
+    for i in range(count):
+        name = f"{' '.join(rng.sample(WORDS, rng.randint(1, 3)))} {i}"
+        genre = ", ".join(rng.sample(GENRES, rng.randint(1, 2)))
+        rows.append((i + 1, f"http://127.0.0.1:9/stream/{i}", name, "r", "local",
+                     genre, "", "English", rng.choice(COUNTRIES), "", "128", "MP3"))
+        if i % 3 == 0:
+            logo = Image.new("RGB", (200, 200), (rng.randrange(256), 80, 160))
+            logo.save(os.path.join(logo_dir, name + ".jpg"), quality=80)
+    conn.executemany("INSERT INTO cfg_radio VALUES (?,?,?,?,?,?,?,?,?,?,?,?)", rows)
+    conn.commit()
+    conn.close()
+
+def make_cover(seed, size=600):
+    """Photo-like JPEG (shapes + blur + noise compress like real cover art)"""
+    rng = random.Random(seed)
+    img = Image.new("RGB", (size, size), tuple(rng.randrange(256) for _ in range(3)))
+    draw = ImageDraw.Draw(img)
+    for _ in range(30):
+        x, y = rng.randrange(size), rng.randrange(size)
+        r = rng.randint(20, size // 3)
+        draw.ellipse((x - r, y - r, x + r, y + r),
+                     fill=tuple(rng.randrange(256) for _ in range(3)))
+    img = img.filter(ImageFilter.GaussianBlur(4))
+    noise = Image.effect_noise((size, size), 24).convert("RGB")
+    img = Image.blend(img, noise, 0.15)
+    out = BytesIO()
+    img.save(out, "JPEG", quality=88)
+    return out.getvalue()
+
+def make_songs(albums, tracks_per_album):
+    songs = []
+    for a in range(albums):
+        for t in range(tracks_per_album):
+            songs.append({"file": f"Bench/Album {a:03d}/{t + 1:02d} Track.flac",
+                          "Artist": f"Artist {a % 17}", "Album": f"Album {a}",
+                          "Title": f"Track {t + 1} of album {a}", "duration": 180 + t})
+    return songs
+
+def serve_fake_mpd(albums, tracks_per_album, ports):
+    """Child process: fake MPD with generated songs and covers"""
+    covers = {f"Bench/Album {a:03d}": make_cover(a) for a in range(albums)}
+    state = FakeMPDState(make_songs(albums, tracks_per_album), covers)
+    server = FakeMPDServer(state)
+    ports.put(server.port)
+    server.serve_forever()
+
+class SpotmetaWriter:
+    """Writes spotmeta.txt the way moOde does when Spotify Connect plays"""
+    
+    def __init__(self, path, art_dir, covers=8):
+        self.path = path
+        self.art_urls = []
+        for n in range(covers):
+            art = os.path.join(art_dir, f"spotify-{n}.jpg")
+            with open(art, "wb") as f:
+                f.write(make_cover(1000 + n))
+            self.art_urls.append("file://" + art)
+        self.write("null")
+    
+    def write(self, content):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(content)
+    
+    def show(self, n):
+        title = f"Spotify Song {n}"
+        self.write(f"{title}~~~Spotify Artist {n % 5}~~~Spotify Album {n % 8}~~~"
+                   f"215000~~~{self.art_urls[n % len(self.art_urls)]}~~~Vorbis")
+        return title
+    
+    def clear(self):
+        self.write("null")
+
+def start_xvfb():
+    """Start a private Xvfb if there's no display; returns the process"""
+    if os.environ.get("DISPLAY"):
+        return None
+    if not shutil.which("Xvfb"):
+        sys.exit("No $DISPLAY and Xvfb not found (apt install xvfb)")
+    for number in range(99, 120):
+        if not os.path.exists(f"/tmp/.X11-unix/X{number}"):
+            break
+    proc = subprocess.Popen(["Xvfb", f":{number}", "-screen", "0",
+                             f"{md.SCREEN_WIDTH}x{md.SCREEN_HEIGHT}x24", "-nolisten", "tcp"],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    for _ in range(50):
+        if os.path.exists(f"/tmp/.X11-unix/X{number}"):
+            break
+        time.sleep(0.1)
+    os.environ["DISPLAY"] = f":{number}"
+    return proc
+
+def summarize(samples):
+    """Percentiles of a list of milliseconds"""
+    if not samples:
+        return {"count": 0}
+    ordered = sorted(samples)
+    def pct(q):
+        return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 3)
+    return {"count": len(ordered), "mean": round(sum(ordered) / len(ordered), 3),
+            "p50": pct(0.5), "p90": pct(0.9), "p99": pct(0.99), "max": round(ordered[-1], 3)}
+
+def git_version():
+    try:
+        out = subprocess.run(["git", "describe", "--always", "--dirty"], cwd=HERE,
+                             capture_output=True, text=True, timeout=5)
+        return out.stdout.strip() or "unknown"
+    except (OSError, subprocess.SubprocessError):
+        return "unknown"
+
+class SoakRun:
+    """Drives one MoodeDisplay through track changes and page flips"""
+    
+    def __init__(self, args, workdir):
+        self.args = args
+        self.workdir = workdir
+        self.metrics = RecordingMetrics()
+        self.track_latency = []  # ms from MPD change to display state
+        self.memory = []  # (track changes, RSS KB)
+        self.error = None
+    
+    def configure(self, mpd_port):
+        """Point moode_display at the fake environment"""
+        w = self.workdir
+        logos = os.path.join(w, "logos")
+        os.makedirs(logos)
+        make_station_db(os.path.join(w, "moode-sqlite3.db"), self.args.stations, logos)
+        
+        md.MPD_HOST = "127.0.0.1"
+        md.MPD_PORT = mpd_port
+        md.MPD_SOCKET = ""
+        md.DB_PATH = os.path.join(w, "moode-sqlite3.db")
+        md.STATION_INDEX_PATH = os.path.join(w, "cache", "stations.db")
+        md.ART_CACHE_DIR = os.path.join(w, "cache", "art")
+        md.RADIO_LOGO_DIRS = (logos,)
+        md.SPOTMETA_FILE = os.path.join(w, "spotmeta.txt")
+        md.LOG_FILE = os.path.join(w, "display.log")
+        md.METRICS_PORT = 0
+        md.METRICS = self.metrics
+        self.spotmeta = SpotmetaWriter(md.SPOTMETA_FILE, w)
+    
+    def run(self):
+        import tkinter as tk
+        self.started = time.perf_counter()
+        self.root = tk.Tk()
+        self.app = md.MoodeDisplay(self.root)
+        self.driver = md.MPDClient()
+        threading.Thread(target=self.drive, daemon=True).start()
+        self.root.mainloop()
+        self.app.cleanup()
+        self.driver.close()
+        if self.error:
+            raise self.error
+    
+    def wait_for_title(self, title, since, timeout=5.0):
+        deadline = since + timeout
+        while time.monotonic() < deadline:
+            if self.app.state.title == title:
+                self.track_latency.append((time.monotonic() - since) * 1000)
+                return True
+            time.sleep(0.001)
+        return False
+    
+    def drive(self):
+        """Driver thread: track changes, then radio page flips"""
+        try:
+            args = self.args
+            time.sleep(1.0)  # Let the display connect and settle
+            self.cpu_start = sum(os.times()[:2])
+            self.wall_start = time.monotonic()
+            self.memory.append((0, md.process_rss_bytes() // 1024))
+            missed = 0
+            
+            for n in range(1, args.tracks + 1):
+                since = time.monotonic()
+                if args.spotify_every and n % args.spotify_every == 0:
+                    # Spotify takes over: MPD stops, spotmeta.txt appears
+                    self.driver.command("stop")
+                    title = self.spotmeta.show(n)
+                elif args.spotify_every and n % args.spotify_every == 1 and n > 1:
+                    self.spotmeta.clear()
+                    status = dict(self.driver.command("status"))
+                    self.driver.command("play", (int(status.get("song", 0)) + 1))
+                    title = dict(self.driver.command("currentsong"))["Title"]
+                else:
+                    self.driver.command("next")
+                    title = dict(self.driver.command("currentsong"))["Title"]
+                if not self.wait_for_title(title, since):
+                    missed += 1
+                if n % 100 == 0:
+                    self.memory.append((n, md.process_rss_bytes() // 1024))
+                time.sleep(args.interval)
+            
+            self.cpu_used = sum(os.times()[:2]) - self.cpu_start
+            self.wall_used = time.monotonic() - self.wall_start
+            self.missed = missed
+            
+            # Radio browser: open it and flip pages on the Tk thread
+            self.root.after(0, self.app.show_radio_browser)
+            time.sleep(1.0)
+            for _ in range(args.page_flips):
+                self.root.after(0, self.app.radio_browser.next_page)
+                time.sleep(0.05)
+            time.sleep(0.5)
+        except Exception as e:
+            self.error = e
+        finally:
+            self.root.after(0, self.root.quit)
+    
+    def results(self):
+        args = self.args
+        samples = self.metrics.samples
+        ticks = len(samples.get("update_loop", [])) or 1
+        art = samples.get("art_process", [])
+        memory_start, memory_end = self.memory[0][1], self.memory[-1][1]
+        return {
+            "version": git_version(),
+            "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "host": {"machine": platform.machine(), "python": platform.python_version(),
+                     "pillow": md.Image.__version__},
+            "params": vars(args),
+            "first_frame_ms": round((md.STARTUP.first_frame_at - self.started) * 1000, 1),
+            "track_change_ms": summarize(self.track_latency),
+            "missed_track_changes": self.missed,
+            "tick_ms": summarize(samples.get("update_loop", [])),
+            "mpd_status_ms": summarize(samples.get("mpd_status", [])),
+            "update_display_ms": summarize(samples.get("update_display", [])),
+            "tk_lag_ms": summarize(samples.get("tk_lag", [])),
+            "cpu": {"ms_per_tick": round(self.cpu_used * 1000 / ticks, 3),
+                    "ms_per_track_change": round(self.cpu_used * 1000 / args.tracks, 3),
+                    "percent": round(100 * self.cpu_used / self.wall_used, 1)},
+            "art": {"process_ms": summarize(art),
+                    "images_per_second": round(1000 * len(art) / sum(art), 1) if art else 0,
+                    "fetch_ms": summarize(samples.get("art_fetch", [])),
+                    "photo_ms": summarize(samples.get("art_photo", [])),
+                    "cache": self.app.art_cache.stats()},
+            "page_flip_ms": summarize(samples.get("radio_page", [])),
+            "station_query_ms": summarize(samples.get("station_query", [])),
+            "memory": {"start_kb": memory_start, "end_kb": memory_end,
+                       "growth_kb_per_1000_tracks":
+                           round((memory_end - memory_start) * 1000 / args.tracks, 1),
+                       "samples": self.memory},
+        }
+
+def flatten(data, prefix=""):
+    """Numeric leaves as {"a.b.c": value} (params and raw samples skipped)"""
+    out = {}
+    for key, value in data.items():
+        if key in ("params", "samples", "host"):
+            continue
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            out.update(flatten(value, name + "."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            out[name] = value
+    return out
+
+def print_results(results):
+    print(f"\nmoode_display {results['version']} - {results['date']}")
+    for name, value in flatten(results).items():
+        print(f"  {name:45} {value}")
+
+def compare(old_path, new_path):
+    with open(old_path) as f:
+        old = json.load(f)
+    with open(new_path) as f:
+        new = json.load(f)
+    print(f"{'':45} {old['version']:>14} {new['version']:>14}   change")
+    old_flat, new_flat = flatten(old), flatten(new)
+    for name in sorted(set(old_flat) | set(new_flat)):
+        a, b = old_flat.get(name), new_flat.get(name)
+        change = ""
+        if a and b is not None:
+            change = f"{100 * (b - a) / a:+.1f}%"
+        print(f"{name:45} {str(a):>14} {str(b):>14}   {change}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--tracks", type=int, default=2000, help="Track changes to simulate")
+    parser.add_argument("--stations", type=int, default=5000, help="Stations in the generated database")
+    parser.add_argument("--albums", type=int, default=40, help="Albums (distinct covers) in the queue")
+    parser.add_argument("--tracks-per-album", type=int, default=5)
+    parser.add_argument("--spotify-every", type=int, default=25,
+                        help="Every Nth track change is a Spotify track (0 = never)")
+    parser.add_argument("--interval", type=float, default=0.02,
+                        help="Seconds between track changes after the display caught up")
+    parser.add_argument("--page-flips", type=int, default=50)
+    parser.add_argument("--output", default=RESULTS_DIR, help="Directory for the results file")
+    parser.add_argument("--keep", action="store_true", help="Keep the temporary directory")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"),
+                        help="Compare two saved results and exit")
+    args = parser.parse_args()
+    
+    if args.compare:
+        compare(*args.compare)
+        return
+    
+    xvfb = start_xvfb()
+    ports = multiprocessing.Queue()
+    server = multiprocessing.Process(target=serve_fake_mpd, daemon=True,
+                                     args=(args.albums, args.tracks_per_album, ports))
+    server.start()
+    workdir = tempfile.mkdtemp(prefix="moode-display-soak-")
+    try:
+        run = SoakRun(args, workdir)
+        run.configure(ports.get(timeout=60))
+        print(f"Running {args.tracks} track changes against fake MPD ({workdir})")
+        run.run()
+        results = run.results()
+    finally:
+        server.terminate()
+        if xvfb:
+            xvfb.terminate()
+        if not args.keep:
+            shutil.rmtree(workdir, ignore_errors=True)
+    
+    print_results(results)
+    os.makedirs(args.output, exist_ok=True)
+    path = os.path.join(args.output, f"{time.strftime('%Y%m%d-%H%M%S')}-{results['version']}.json")
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nSaved {path}")
+
+if __name__ == "__main__":
+    main()
@@ -16,17 +16,36 @@ Previous improvements (V2.6.1):
 - Stable Spotify playback (no file age checking)
 """
 
+import time
+IMPORT_START = time.perf_counter()  # Startup profile
+
 import tkinter as tk
 from tkinter import Canvas
-import subprocess
-import time
 import os
-import re
-import sqlite3
-from PIL import Image, ImageTk, ImageFilter, ImageDraw, ImageFont, ImageEnhance
+import sys
+import importlib
+import socket
+import struct
+from collections import OrderedDict
+from array import array
+from PIL import Image, ImageTk
 from io import BytesIO
-from urllib import request
 import threading
+import argparse
+import resource
+import queue
+import heapq
+import mmap
+import fcntl
+import select
+import signal
+import atexit
+import bisect
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+# Imported on first use (lazy_import): sqlite3, urllib.request, http.server,
+# hashlib, ctypes, multiprocessing and the PIL modules beyond Image/ImageTk
+IMPORT_END = time.perf_counter()
 
 # Constants
 SCREEN_WIDTH = 800
@@ -35,25 +54,2426 @@ BG_COLOR = "#000000"
 TEXT_COLOR = "#FFFFFF"
 ACCENT_COLOR = "#00FF00"
 UPDATE_INTERVAL = 500  # milliseconds
+PROGRESS_FPS = 10  # Progress bar animation frames per second
+PROGRESS_RESYNC_DRIFT = 1.0  # seconds; re-anchor progress on larger jumps (seek)
+RENDER_STATS_FRAMES = 120  # Log widget-ops-per-frame stats every N frames
+
+# Render backend: "tk" (X window) or "framebuffer" (Pillow frames to FB_DEVICE)
+RENDER_BACKEND = "tk"
+FB_DEVICE = "/dev/fb0"
+FB_TOUCH_DEVICE = ""  # evdev touchscreen, "" = first device with absolute X/Y
+FB_FONT = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+FB_FONT_BOLD = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
 
 # Moode metadata file
 SPOTMETA_FILE = "/var/local/www/spotmeta.txt"
 LOG_FILE = "/home/moodepi/display_debug.log"
+LOG_LEVEL = "debug"  # "debug", "info", "warning" or "error"
+LOG_MAX_BYTES = 1024 * 1024  # Rotate the log file beyond this size
+LOG_BACKUPS = 2  # Rotated files kept (display_debug.log.1, .2)
+LOG_FLUSH_INTERVAL = 2.0  # seconds; errors are flushed immediately
+
+# Metrics (Prometheus text format at http://METRICS_HOST:METRICS_PORT/metrics)
+METRICS_PORT = 9101  # 0 = disabled
+METRICS_HOST = "127.0.0.1"  # "0.0.0.0" to allow scraping from other hosts
+METRICS_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)  # ms
+METRICS_RECENT = 256  # Recent samples per stage kept for quantiles
+TK_LAG_PROBE_INTERVAL = 500  # milliseconds between Tk event-loop lag probes
+STARTUP_PROFILE = False  # Print the startup timeline after warm-up (--profile-startup)
+
+# Push API for dashboards (http://PUSH_HOST:PUSH_PORT/events, /state, /art)
+PUSH_PORT = 9102  # 0 = disabled
+PUSH_HOST = "127.0.0.1"  # "0.0.0.0" to allow clients on other hosts
+PUSH_MAX_CLIENTS = 16  # Concurrent event streams (one thread each)
+PUSH_KEEPALIVE = 15  # seconds between keep-alive comments on idle streams
+
+# MPD connection (persistent protocol client, replaces mpc subprocesses)
+MPD_HOST = "localhost"
+MPD_PORT = 6600
+MPD_SOCKET = "/run/mpd/socket"  # Used when present, otherwise TCP
+MPD_TIMEOUT = 5  # seconds
+MPD_RECONNECT_DELAY = 2  # seconds to wait after a failed connect
+MPD_BINARY_LIMIT = 256 * 1024  # Album art chunk size requested from MPD
+
+# Event-driven updates: refresh when MPD reports a change (idle command)
+USE_MPD_IDLE = True
+MPD_IDLE_SUBSYSTEMS = ("player", "mixer", "playlist", "options")
+
+# Multi-player mode: several moOde hosts monitored at once, swipe to switch
+# [(name, host, port), ...]; a host starting with "/" is a Unix socket.
+# Empty = only MPD_HOST/MPD_SOCKET. Spotify metadata belongs to the first.
+MPD_PLAYERS = []
+SWIPE_DISTANCE = 120  # pixels of horizontal travel that make a tap a swipe
+IDLE_FALLBACK_INTERVAL = 10000  # milliseconds between polls with MPD events active
+IDLE_STOPPED_INTERVAL = 60000  # milliseconds, the same while nothing plays
+
+# Adaptive polling without events (see PollScheduler); UPDATE_INTERVAL while playing
+POLL_FAST_INTERVAL = 250  # milliseconds, right after a track/state change or a tap
+POLL_FAST_WINDOW = 3  # seconds the fast rate lasts
+POLL_PAUSED_INTERVAL = 2000  # milliseconds while paused
+POLL_STOPPED_INTERVAL = 5000  # milliseconds while nothing plays
+
+# Idle screen: blank or dim after a while without playback or touches
+SCREEN_IDLE_TIMEOUT = 600  # seconds (0 = never)
+SCREEN_IDLE_MODE = "blank"  # "blank" or "dim"
+SCREEN_DIM_LEVEL = 0.2  # Brightness in dim mode (0-1)
+BACKLIGHT_DIR = ""  # e.g. "/sys/class/backlight/rpi_backlight", "" = auto-detect
+STATION_START_POLL = 100  # milliseconds between polls while a station starts
+STATION_START_TIMEOUT = 20  # seconds to wait for audio before giving up
+
+# Album art cache (processed backgrounds + original downloads)
+ART_CACHE_DIR = "/home/moodepi/.cache/moode-display/art"
+ART_CACHE_MAX_BYTES = 50 * 1024 * 1024  # Disk budget, oldest files evicted
+ART_CACHE_MEMORY_ITEMS = 8  # Ready-to-show backgrounds kept in RAM
+ART_PIPELINE = "fast"  # "fast" (reduced-resolution blur) or "quality" (full size)
+ART_FAST_SCALE = 0.25  # Fast pipeline works at this fraction of screen size
+ART_BENCHMARK_RUNS = 10  # Iterations per image for --benchmark-art
+ART_WORKERS = 2  # Background threads downloading/processing album art
+ART_DOWNLOAD_TIMEOUT = 5  # seconds
+
+# Radio browser constants
+DB_PATH = "/var/local/www/db/moode-sqlite3.db"
+STATIONS_PER_PAGE = 6  # 3x2 grid
+STATION_PREFETCH_PAGES = 2  # Extra pages fetched with each page query
+STATION_FILTER = ""  # Extra SQL condition, e.g. "AND genre LIKE '%Jazz%'"
+
+# Station logos on browser tiles (moOde's radio-logos, thumbs first)
+RADIO_LOGO_DIRS = ("/var/local/www/imagesw/radio-logos/thumbs",
+                   "/var/local/www/imagesw/radio-logos")
+LOGO_SIZE = 72  # pixels (square)
+LOGO_CACHE_ITEMS = 60  # Decoded logos kept in memory (about 10 pages)
+
+# Station search (full-text index kept outside moOde's database)
+STATION_INDEX_PATH = "/home/moodepi/.cache/moode-display/stations.db"
+SEARCH_RESULTS = 6  # Result tiles shown while typing
+SEARCH_COUNT_LIMIT = 1000  # Stop counting matches here (shown as "1000+")
+SEARCH_KEYBOARD_ROWS = (
+    list("1234567890"),
+    list("QWERTYUIOP"),
+    list("ASDFGHJKL") + ["⌫"],
+    list("ZXCVBNM") + ["Space", "Clear"],
+)
+BUTTON_BG = "#222222"
+BUTTON_ACTIVE = "#444444"
+
+LOG_LEVELS = {"debug": 10, "info": 20, "warning": 30, "error": 40}
+LOG_THRESHOLD = LOG_LEVELS[LOG_LEVEL]
+DEBUG_LOGGING = LOG_THRESHOLD <= LOG_LEVELS["debug"]  # Guard for costly messages
+
+class LogWriter:
+    """Background thread that appends log lines to LOG_FILE
+    
+    Logging calls only put a record on a queue. The writer keeps the file
+    open, formats and writes whatever has queued up, and flushes at most
+    every LOG_FLUSH_INTERVAL seconds (errors right away). The file is
+    rotated to LOG_FILE.1 ... LOG_FILE.<LOG_BACKUPS> past LOG_MAX_BYTES.
+    """
+    
+    def __init__(self, path):
+        self.path = path
+        self.queue = queue.SimpleQueue()
+        self.file = None
+        self.size = 0  # Bytes in the current file (tell() would flush)
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+        atexit.register(self.close)
+    
+    def write(self, level, message, args):
+        self.queue.put((time.time(), level, message, args))
+    
+    def close(self):
+        """Write out everything queued so far and stop"""
+        if self.thread.is_alive():
+            self.queue.put(None)
+            self.thread.join(timeout=2)
+    
+    def run(self):
+        last_flush = time.monotonic()
+        dirty = False  # Written but not flushed yet
+        while True:
+            timeout = None
+            if dirty:
+                timeout = max(0, last_flush + LOG_FLUSH_INTERVAL - time.monotonic())
+            try:
+                record = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                record = False  # Flush deadline reached
+            if record is None:
+                break
+            
+            urgent = True
+            if record:
+                self.emit(*record)
+                dirty = True
+                urgent = record[1] >= LOG_LEVELS["error"]
+            if dirty and (urgent or time.monotonic() - last_flush >= LOG_FLUSH_INTERVAL):
+                self.flush()
+                last_flush = time.monotonic()
+                dirty = False
+        
+        self.flush()
+        if self.file:
+            self.file.close()
+    
+    def emit(self, created, level, message, args):
+        try:
+            if args:
+                message = message % args
+            timestamp = time.strftime("%H:%M:%S", time.localtime(created))
+            if level == LOG_LEVELS["debug"]:
+                line = f"[{timestamp}] {message}\n"
+            else:
+                name = next(k for k, v in LOG_LEVELS.items() if v == level)
+                line = f"[{timestamp}] {name.upper()}: {message}\n"
+            
+            if self.file is None:
+                self.file = open(self.path, "a", encoding="utf-8")
+                self.size = os.path.getsize(self.path)
+            self.file.write(line)
+            self.size += len(line.encode("utf-8"))
+            if self.size > LOG_MAX_BYTES:
+                self.rotate()
+        except Exception:
+            pass
+    
+    def flush(self):
+        try:
+            if self.file:
+                self.file.flush()
+        except Exception:
+            pass
+    
+    def rotate(self):
+        self.file.close()
+        self.file = None
+        for n in range(LOG_BACKUPS - 1, 0, -1):
+            if os.path.exists(f"{self.path}.{n}"):
+                os.replace(f"{self.path}.{n}", f"{self.path}.{n + 1}")
+        if LOG_BACKUPS > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+
+_log_writer = None
+_log_writer_lock = threading.Lock()
+
+def log(level, message, *args):
+    """Queue a log message at level ("debug", "info", "warning", "error")
+    
+    With args, message is %-formatted on the writer thread, so messages
+    below LOG_LEVEL cost almost nothing.
+    """
+    global _log_writer
+    value = LOG_LEVELS[level]
+    if value < LOG_THRESHOLD:
+        return
+    if _log_writer is None:
+        with _log_writer_lock:
+            if _log_writer is None:
+                _log_writer = LogWriter(LOG_FILE)
+    _log_writer.write(value, message, args)
+
+def log_debug(message, *args):
+    """Write debug messages to log file"""
+    if DEBUG_LOGGING:
+        log("debug", message, *args)
+
+def log_info(message, *args):
+    log("info", message, *args)
+
+def log_warning(message, *args):
+    log("warning", message, *args)
+
+def log_error(message, *args):
+    log("error", message, *args)
+
+class Histogram:
+    """Fixed-bucket latency histogram plus a ring buffer of recent samples"""
+    
+    def __init__(self):
+        self.counts = [0] * (len(METRICS_BUCKETS) + 1)  # Last one is +Inf
+        self.total = 0.0
+        self.count = 0
+        self.recent = array('d', [0.0]) * METRICS_RECENT
+        self.lock = threading.Lock()
+    
+    def observe(self, ms):
+        index = bisect.bisect_left(METRICS_BUCKETS, ms)
+        with self.lock:
+            self.counts[index] += 1
+            self.recent[self.count % METRICS_RECENT] = ms
+            self.total += ms
+            self.count += 1
+    
+    def snapshot(self):
+        """(bucket counts, sum, count, sorted recent samples)"""
+        with self.lock:
+            recent = sorted(self.recent[:min(self.count, METRICS_RECENT)])
+            return list(self.counts), self.total, self.count, recent
+
+class Metrics:
+    """Stage timings, counters and gauges for the /metrics endpoint
+    
+    Stages are timed with `with METRICS.timer("name"):` or observe().
+    Gauges are functions evaluated when the endpoint is scraped.
+    """
+    
+    PREFIX = "moode_display"
+    
+    def __init__(self):
+        self.stages = {}  # name -> Histogram
+        self.counters = {}
+        self.gauges = {}  # name -> (help, function)
+        self.lock = threading.Lock()
+    
+    def observe(self, stage, ms):
+        histogram = self.stages.get(stage)
+        if histogram is None:
+            with self.lock:
+                histogram = self.stages.setdefault(stage, Histogram())
+        histogram.observe(ms)
+    
+    @contextmanager
+    def timer(self, stage):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, (time.perf_counter() - start) * 1000)
+    
+    def inc(self, name, amount=1):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+    
+    def gauge(self, name, function, help_text):
+        self.gauges[name] = (help_text, function)
+    
+    def render(self):
+        """Prometheus text exposition of everything recorded so far"""
+        p = self.PREFIX
+        lines = [f"# HELP {p}_stage_seconds Time spent per stage",
+                 f"# TYPE {p}_stage_seconds histogram"]
+        quantiles = []
+        for stage, histogram in sorted(self.stages.items()):
+            counts, total, count, recent = histogram.snapshot()
+            cumulative = 0
+            for bound, n in zip(METRICS_BUCKETS + ("+Inf",), counts):
+                cumulative += n
+                le = bound if bound == "+Inf" else bound / 1000
+                lines.append(f'{p}_stage_seconds_bucket{{stage="{stage}",le="{le}"}} {cumulative}')
+            lines.append(f'{p}_stage_seconds_sum{{stage="{stage}"}} {total / 1000:.6f}')
+            lines.append(f'{p}_stage_seconds_count{{stage="{stage}"}} {count}')
+            for q in (0.5, 0.9, 0.99):
+                if recent:
+                    value = recent[min(len(recent) - 1, int(q * len(recent)))] / 1000
+                    quantiles.append(f'{p}_stage_recent_seconds{{stage="{stage}",quantile="{q}"}} {value:.6f}')
+        
+        lines.append(f"# HELP {p}_stage_recent_seconds Quantiles of the last {METRICS_RECENT} samples")
+        lines.append(f"# TYPE {p}_stage_recent_seconds gauge")
+        lines.extend(quantiles)
+        
+        with self.lock:
+            counters = sorted(self.counters.items())
+        for name, value in counters:
+            lines.append(f"# TYPE {p}_{name} counter")
+            lines.append(f"{p}_{name} {value}")
+        
+        for name, (help_text, function) in sorted(self.gauges.items()):
+            try:
+                value = function()
+            except Exception:
+                continue
+            kind = "counter" if name.endswith("_total") else "gauge"
+            lines.append(f"# HELP {p}_{name} {help_text}")
+            lines.append(f"# TYPE {p}_{name} {kind}")
+            lines.append(f"{p}_{name} {value}")
+        return "\n".join(lines) + "\n"
+
+def process_rss_bytes():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+def process_cpu_seconds():
+    times = os.times()
+    return round(times.user + times.system, 3)
+
+METRICS = Metrics()
+METRICS.gauge("cpu_seconds_total", process_cpu_seconds, "User + system CPU time")
+METRICS.gauge("resident_memory_bytes", process_rss_bytes, "Resident set size")
+METRICS.gauge("threads", threading.active_count, "Running Python threads")
+
+def process_age():
+    """Seconds since the process started (from /proc, 10 ms resolution)"""
+    try:
+        with open("/proc/self/stat") as f:
+            start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+    except (OSError, ValueError, IndexError):
+        return None
+    return max(0.0, uptime - start_ticks / os.sysconf("SC_CLK_TCK"))
+
+class StartupProfile:
+    """Timeline from process start to the first frame and the warm-up after it
+    
+    Entries are phases (start, end, name) or marks (start, None, name),
+    all on the perf_counter clock. Modules loaded with lazy_import() are
+    recorded too, so work moved behind the first frame stays visible.
+    """
+    
+    def __init__(self, import_start, import_end):
+        age = process_age()
+        now = time.perf_counter()
+        self.origin = now - age if age is not None else import_start
+        self.entries = []
+        self.imported = set()  # Modules recorded by lazy_import
+        self.first_frame_at = None
+        self.echo = STARTUP_PROFILE  # Print the report (--profile-startup)
+        if age is not None:
+            self.add("interpreter startup", self.origin, import_start)
+        self.add("imports", import_start, import_end)
+        self.add("module setup", import_end, now)
+    
+    def add(self, name, start, end=None):
+        self.entries.append((start, end, name))  # list.append is thread-safe
+    
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, start, time.perf_counter())
+    
+    def mark(self, name):
+        now = time.perf_counter()
+        if name == "first frame":
+            self.first_frame_at = now
+        self.add(name, now)
+    
+    def ms(self, when):
+        """Milliseconds from process start"""
+        return (when - self.origin) * 1000
+    
+    def report(self):
+        lines = ["Startup profile (ms from process start, duration):"]
+        for start, end, name in sorted(self.entries, key=lambda e: e[0]):
+            duration = f"{(end - start) * 1000:8.1f}" if end is not None else " " * 8
+            lines.append(f"  {self.ms(start):8.1f} {duration}  {name}")
+        return "\n".join(lines)
+    
+    def finish(self):
+        """Warm-up done: log the timeline (and print it if asked to)"""
+        self.mark("warm-up done")
+        report = self.report()
+        log_debug(report)
+        if self.echo:
+            print(report, flush=True)
+
+STARTUP = StartupProfile(IMPORT_START, IMPORT_END)
+
+def lazy_import(name):
+    """Import a module on first use, timing it for the startup profile"""
+    loaded = name in sys.modules
+    start = time.perf_counter()
+    module = importlib.import_module(name)
+    if not loaded and name not in STARTUP.imported:
+        STARTUP.imported.add(name)  # Not again for a thread that waited on it
+        STARTUP.add(f"import {name}", start, time.perf_counter())
+    return module
+
+def metrics_handler():
+    """Request handler class for MetricsServer (http.server loads on first use)"""
+    server = lazy_import("http.server")
+    
+    class MetricsHandler(server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = METRICS.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        
+        def log_message(self, format, *args):
+            pass  # Scrapes would flood the debug log
+    
+    return MetricsHandler
+
+class MetricsServer:
+    """Serves METRICS on a background thread"""
+    
+    def __init__(self, host=None, port=None):
+        self.address = (host or METRICS_HOST, port or METRICS_PORT)
+        self.server = None
+    
+    def start(self):
+        try:
+            server = lazy_import("http.server")
+            self.server = server.ThreadingHTTPServer(self.address, metrics_handler())
+        except OSError as e:
+            log_warning(f"Metrics endpoint unavailable on port {self.address[1]}: {e}")
+            return
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        log_info(f"Metrics at http://{self.address[0]}:{self.address[1]}/metrics")
+    
+    def stop(self):
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+
+def push_payload(state, art):
+    """JSON-ready dict for a shown PlayerState and its art cache key
+    
+    The progress anchor is given in wall-clock time: while playing, the
+    position is elapsed + (now - at), capped at duration.
+    """
+    elapsed, duration, playing, timestamp, _ = state.progress
+    return {
+        'player': state.player,
+        'source': state.source,
+        'playing': state.playing,
+        'title': state.title,
+        'artist': state.artist,
+        'album': state.album,
+        'duration': state.duration,
+        'volume': state.volume,
+        'muted': state.muted,
+        'art_url': state.art_url,
+        'progress': {'elapsed': round(elapsed, 3), 'duration': duration, 'playing': playing,
+                     'at': round(time.time() - (time.monotonic() - timestamp), 3)},
+        'art': art,  # /art/<art>.jpg, None = no art
+    }
+
+class PushFeed:
+    """Now-playing state fanned out to push API clients
+    
+    The display publishes what it shows; each change is serialised once
+    and every client thread writes the same bytes, so clients add no MPD
+    traffic. A slow client skips straight to the newest state instead
+    of queueing events.
+    """
+    
+    def __init__(self, max_clients=None):
+        self.max_clients = max_clients or PUSH_MAX_CLIENTS
+        self.changed = threading.Condition()
+        self.last = None  # (PlayerState, art key) last published
+        self.sequence = 0
+        self.body = b"{}"  # JSON snapshot
+        self.event = b""  # The same as a server-sent event
+        self.clients = 0
+        self.running = True
+    
+    def publish(self, state, art):
+        """Tk thread: record the shown state, wake clients if it changed"""
+        if (state, art) == self.last:
+            return False
+        json = lazy_import("json")
+        body = json.dumps(push_payload(state, art), separators=(',', ':')).encode('utf-8')
+        with self.changed:
+            self.last = (state, art)
+            self.sequence += 1
+            self.body = body
+            self.event = b"id: %d\nevent: state\ndata: %s\n\n" % (self.sequence, body)
+            self.changed.notify_all()
+        return True
+    
+    def snapshot(self):
+        with self.changed:
+            return self.body
+    
+    def wait(self, seen, timeout):
+        """Client thread: (sequence, event) newer than seen, or seen again on timeout"""
+        with self.changed:
+            self.changed.wait_for(lambda: self.sequence != seen or not self.running, timeout)
+            return self.sequence, self.event
+    
+    def join(self):
+        """Count a new stream, False if PUSH_MAX_CLIENTS are connected"""
+        with self.changed:
+            if self.clients >= self.max_clients:
+                return False
+            self.clients += 1
+            return True
+    
+    def leave(self):
+        with self.changed:
+            self.clients -= 1
+    
+    def close(self):
+        """End all streams"""
+        with self.changed:
+            self.running = False
+            self.changed.notify_all()
+
+def push_handler(feed, art_cache):
+    """Request handler class for PushServer (http.server loads on first use)"""
+    server = lazy_import("http.server")
+    
+    class PushHandler(server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            path = self.path.split("?")[0].rstrip("/")
+            if path == "/state":
+                self.send_body(feed.snapshot(), "application/json", "no-cache")
+            elif path == "/events":
+                self.stream()
+            elif path == "/art":
+                # Current background (follows track changes, not cacheable)
+                art = feed.last[1] if feed.last else None
+                self.send_art(art, "no-cache")
+            elif path.startswith("/art/") and path.endswith(".jpg"):
+                self.send_art(path[5:-4], "max-age=86400")
+            else:
+                self.send_error(404)
+        
+        def send_body(self, body, content_type, cache_control):
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Cache-Control", cache_control)
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.end_headers()
+            self.wfile.write(body)
+        
+        def send_art(self, key, cache_control):
+            """Processed background from the art cache's disk tier"""
+            data = None
+            if key and key.replace("_", "").isalnum():  # No paths
+                data = art_cache.read_processed(key)
+            if data is None:
+                self.send_error(404)
+                return
+            self.send_body(data, "image/jpeg", cache_control)
+        
+        def stream(self):
+            """Server-sent events: the current state, then every change"""
+            if not feed.join():
+                self.send_error(503, "Too many push clients")
+                return
+            try:
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Cache-Control", "no-cache")
+                self.send_header("Access-Control-Allow-Origin", "*")
+                self.end_headers()
+                seen = 0
+                while feed.running:
+                    sequence, event = feed.wait(seen, PUSH_KEEPALIVE)
+                    if sequence == seen:
+                        self.wfile.write(b": keep-alive\n\n")
+                    else:
+                        seen = sequence
+                        self.wfile.write(event)
+            except OSError:
+                pass  # Client went away
+            finally:
+                feed.leave()
+        
+        def log_message(self, format, *args):
+            pass
+    
+    return PushHandler
+
+class PushServer:
+    """Serves a PushFeed and processed album art on a background thread
+    
+    GET /events streams state changes (server-sent events), /state returns
+    the current state as JSON and /art/<key>.jpg the processed background
+    named in it (/art is always the current one).
+    """
+    
+    def __init__(self, feed, art_cache, host=None, port=None):
+        self.feed = feed
+        self.art_cache = art_cache
+        self.address = (host or PUSH_HOST, port or PUSH_PORT)
+        self.server = None
+    
+    def start(self):
+        server = lazy_import("http.server")
+        self.server = server.ThreadingHTTPServer(
+            self.address, push_handler(self.feed, self.art_cache), bind_and_activate=False)
+        # Panels reconnect together after a restart - the default backlog is 5
+        self.server.request_queue_size = self.feed.max_clients
+        try:
+            self.server.server_bind()
+            self.server.server_activate()
+        except OSError as e:
+            log_warning(f"Push API unavailable on port {self.address[1]}: {e}")
+            self.server.server_close()
+            self.server = None
+            return
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        log_info(f"Push API at http://{self.address[0]}:{self.address[1]}/events")
+    
+    @property
+    def port(self):
+        return self.server.server_address[1] if self.server else None
+    
+    def stop(self):
+        self.feed.close()
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+
+class MPDError(Exception):
+    """Error reported by MPD (ACK response) or protocol failure"""
+    pass
+
+class MPDStatus:
+    """Parsed result of a combined status + currentsong round trip"""
+    
+    def __init__(self, status, song):
+        self.status = status  # Raw key/value dicts from MPD
+        self.song = song
+        
+        self.state = status.get('state', 'stop')  # "play", "pause" or "stop"
+        self.song_id = status.get('songid')
+        self.next_song_id = status.get('nextsongid')
+        
+        try:
+            self.volume = int(status.get('volume', -1))  # -1 = no mixer
+        except ValueError:
+            self.volume = -1
+        
+        try:
+            self.elapsed = float(status.get('elapsed', 0))
+        except ValueError:
+            self.elapsed = 0.0
+        
+        # "duration" is the precise value, "time" the legacy one (elapsed:total)
+        try:
+            if 'duration' in status:
+                self.duration = float(status['duration'])
+            elif 'time' in status:
+                self.duration = float(status['time'].split(':')[1])
+            else:
+                self.duration = float(song.get('duration', song.get('Time', 0)))
+        except (ValueError, IndexError):
+            self.duration = 0.0
+        
+        # Track tags (radio streams usually only have Name and Title)
+        self.artist = song.get('Artist', '')
+        self.title = song.get('Title', '')
+        self.album = song.get('Album', '')
+        self.name = song.get('Name', '')
+        self.file = song.get('file', '')
+        
+        self.timestamp = time.monotonic()  # When elapsed was valid
+    
+    @property
+    def is_playing(self):
+        return self.state == 'play'
+    
+    @property
+    def is_active(self):
+        """True when MPD is playing or paused"""
+        return self.state in ('play', 'pause')
+
+class MPDClient:
+    """Persistent MPD protocol client with automatic reconnect
+    
+    Keeps one socket open to MPD (Unix socket if available, else TCP)
+    instead of forking an mpc process for every query. Thread-safe:
+    the poller thread and Tk button callbacks may share one client.
+    """
+    
+    def __init__(self, host=None, port=None, socket_path=None, timeout=None):
+        # Settings default to the constants at creation time (not import
+        # time), so they can be overridden at runtime, e.g. by benchmarks
+        self.host = host or MPD_HOST
+        self.port = port or MPD_PORT
+        self.socket_path = MPD_SOCKET if socket_path is None else socket_path
+        self.timeout = timeout or MPD_TIMEOUT
+        
+        self.sock = None
+        self.rfile = None
+        self.version = None
+        self.lock = threading.RLock()
+        self.connect_failed_at = 0
+        self.binary_limit = None  # Chunk size set on this connection
+    
+    def connect(self):
+        """Open connection and read the MPD greeting"""
+        self.close()
+        try:
+            if self.socket_path and os.path.exists(self.socket_path):
+                sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                sock.settimeout(self.timeout)
+                sock.connect(self.socket_path)
+            else:
+                sock = socket.create_connection((self.host, self.port),
+                                                timeout=self.timeout)
+            rfile = sock.makefile('rb')
+            greeting = rfile.readline().decode('utf-8', 'replace').rstrip('\n')
+            if not greeting.startswith('OK MPD '):
+                sock.close()
+                raise MPDError(f"Unexpected MPD greeting: {greeting!r}")
+        except Exception:
+            self.connect_failed_at = time.monotonic()
+            raise
+        
+        self.sock = sock
+        self.rfile = rfile
+        self.version = greeting[7:]
+        self.connect_failed_at = 0
+        self.binary_limit = None
+        METRICS.inc("mpd_connects_total")
+        log_info(f"MPD connected (protocol {self.version})")
+    
+    def close(self):
+        """Close the connection (next command reconnects)"""
+        for obj in (self.rfile, self.sock):
+            if obj is not None:
+                try:
+                    obj.close()
+                except OSError:
+                    pass
+        self.sock = None
+        self.rfile = None
+    
+    @property
+    def connected(self):
+        return self.sock is not None
+    
+    @staticmethod
+    def quote(arg):
+        """Quote a command argument per the MPD protocol"""
+        arg = str(arg).replace('\\', '\\\\').replace('"', '\\"')
+        return f'"{arg}"'
+    
+    def _format(self, command):
+        name, args = command[0], command[1:]
+        return " ".join([name] + [self.quote(a) for a in args])
+    
+    def _read_line(self):
+        line = self.rfile.readline()
+        if not line:
+            raise ConnectionError("MPD closed the connection")
+        return line.decode('utf-8', 'replace').rstrip('\n')
+    
+    def _read_response(self, list_ok=False):
+        """Read key/value pairs until OK (or list_OK inside a command list)"""
+        pairs = []
+        while True:
+            line = self._read_line()
+            if line == 'OK' or (list_ok and line == 'list_OK'):
+                return pairs
+            if line.startswith('ACK '):
+                raise MPDError(line)
+            key, _, value = line.partition(': ')
+            if key == 'binary':
+                value = self._read_binary(int(value))
+            pairs.append((key, value))
+    
+    def _read_binary(self, length):
+        """Read a binary payload (albumart/readpicture) and its newline"""
+        data = self.rfile.read(length)
+        if len(data) != length:
+            raise ConnectionError("MPD closed the connection")
+        self.rfile.read(1)
+        return data
+    
+    def _execute(self, func, retry=True):
+        """Run func on a live connection, reconnecting once if it dropped"""
+        with self.lock:
+            for attempt in ((0, 1) if retry else (1,)):
+                if self.sock is None:
+                    since_fail = time.monotonic() - self.connect_failed_at
+                    if self.connect_failed_at and since_fail < MPD_RECONNECT_DELAY:
+                        raise ConnectionError("MPD unavailable (waiting to reconnect)")
+                    self.connect()
+                try:
+                    return func()
+                except (OSError, ConnectionError):
+                    # Stale or broken socket - drop it and retry once
+                    self.close()
+                    if attempt:
+                        raise
+    
+    def command(self, name, *args):
+        """Run one command, return list of (key, value) pairs"""
+        line = self._format((name,) + args)
+        
+        def run():
+            self.sock.sendall(line.encode('utf-8') + b'\n')
+            return self._read_response()
+        
+        return self._execute(run)
+    
+    def command_list(self, commands):
+        """Run several commands in one round trip
+        
+        commands: list of tuples like ('status',) or ('add', url)
+        Returns one list of (key, value) pairs per command.
+        """
+        lines = ['command_list_ok_begin']
+        lines += [self._format(c) for c in commands]
+        lines.append('command_list_end')
+        payload = ("\n".join(lines) + "\n").encode('utf-8')
+        
+        def run():
+            self.sock.sendall(payload)
+            results = [self._read_response(list_ok=True) for _ in commands]
+            self._read_response()  # Final OK
+            return results
+        
+        return self._execute(run)
+    
+    def idle(self, *subsystems):
+        """Block until MPD reports a change, return changed subsystem names
+        
+        Waits without a socket timeout and does not retry, so the caller
+        decides how to back off. Use interrupt() from another thread to
+        unblock it.
+        """
+        line = self._format(('idle',) + subsystems)
+        
+        def run():
+            self.sock.settimeout(None)
+            try:
+                self.sock.sendall(line.encode('utf-8') + b'\n')
+                pairs = self._read_response()
+            finally:
+                if self.sock is not None:
+                    self.sock.settimeout(self.timeout)
+            return [value for key, value in pairs if key == 'changed']
+        
+        return self._execute(run, retry=False)
+    
+    def interrupt(self):
+        """Unblock a pending read (e.g. idle) from another thread"""
+        sock = self.sock
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+    
+    def read_binary(self, command, uri):
+        """Fetch a chunked binary response (albumart/readpicture)
+        
+        Chunks are copied into one preallocated buffer. Returns None if
+        MPD has no picture.
+        """
+        data = None
+        size = 0
+        offset = 0
+        while data is None or offset < size:
+            result = dict(self.command(command, uri, offset))
+            chunk = result.get('binary')
+            if not chunk:
+                break
+            if data is None:
+                size = int(result['size'])
+                data = bytearray(size)
+            data[offset:offset + len(chunk)] = chunk
+            offset += len(chunk)
+        return data if data and offset == size else None
+    
+    def read_art(self, uri):
+        """Cover art for a song: folder image (albumart), else embedded
+        picture (readpicture). Returns bytes-like or None."""
+        if self.binary_limit != MPD_BINARY_LIMIT:
+            try:
+                self.command('binarylimit', MPD_BINARY_LIMIT)
+            except MPDError:
+                pass  # MPD < 0.22.4 - default chunk size
+            self.binary_limit = MPD_BINARY_LIMIT
+        
+        for command in ('albumart', 'readpicture'):
+            try:
+                data = self.read_binary(command, uri)
+            except MPDError:
+                data = None  # albumart reports a missing cover file as ACK
+            if data:
+                return data
+        return None
+    
+    def status_snapshot(self):
+        """Get status and current song together as an MPDStatus"""
+        status, song = self.command_list([('status',), ('currentsong',)])
+        return MPDStatus(dict(status), dict(song))
+
+class MPDIdleWatcher:
+    """Background thread that blocks in MPD idle and reports changes
+    
+    Uses its own connection (a connection in idle can't run other
+    commands) and calls on_change(subsystems) from the watcher thread
+    whenever MPD reports a change in one of MPD_IDLE_SUBSYSTEMS.
+    """
+    
+    def __init__(self, on_change):
+        self.on_change = on_change
+        self.client = MPDClient()
+        self.running = False
+        self.thread = None
+    
+    def start(self):
+        self.running = True
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+    
+    def stop(self):
+        self.running = False
+        self.client.interrupt()
+    
+    @property
+    def connected(self):
+        """True while events are being received (timed polling can slow down)"""
+        return self.running and self.client.connected
+    
+    def run(self):
+        while self.running:
+            try:
+                changed = self.client.idle(*MPD_IDLE_SUBSYSTEMS)
+                if changed and self.running:
+                    log_debug("MPD idle event: %s", ', '.join(changed))
+                    self.on_change(changed)
+            except Exception as e:
+                if not self.running:
+                    break
+                log_warning(f"MPD idle error: {e}")
+                self.client.close()
+                # Let the poller pick up whatever we may have missed
+                self.on_change([])
+                time.sleep(MPD_RECONNECT_DELAY)
+        self.client.close()
+
+class MPDCommandQueue:
+    """Worker thread that sends transport and volume commands to MPD
+    
+    Button callbacks only record what the user wants, so touch handling
+    never waits for MPD. Taps that arrive before the worker gets to them
+    are coalesced: volume changes collapse into one absolute setvol with
+    the final target, skips add up (to one jump in sequential playback)
+    and play/pause keeps only the last requested state. on_done() is
+    called after each batch.
+    """
+    
+    def __init__(self, client, on_done):
+        self.client = client
+        self.on_done = on_done
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.pending = {}  # "volume" / "play" -> target, "skip" -> offset
+        self.applied = {}  # kind -> monotonic time its last command was sent
+        self.sending = {}  # Batch currently being sent
+        self.running = False
+        self.thread = None
+    
+    def start(self):
+        self.running = True
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+    
+    def stop(self):
+        self.running = False
+        self.wakeup.set()
+    
+    def set_volume(self, volume):
+        self._submit('volume', volume)
+    
+    def set_playing(self, playing):
+        self._submit('play', playing)
+    
+    def skip(self, offset):
+        """Queue a relative skip (+1 = next, -1 = previous)"""
+        with self.lock:
+            total = self.pending.get('skip', 0) + offset
+            if total:
+                self.pending['skip'] = total
+            else:
+                self.pending.pop('skip', None)  # next + prev cancel out
+        self.wakeup.set()
+    
+    def _submit(self, kind, value):
+        with self.lock:
+            self.pending[kind] = value
+        self.wakeup.set()
+    
+    def discard(self):
+        """Drop commands that haven't been sent yet"""
+        with self.lock:
+            self.pending = {}
+    
+    def settled(self, kind, timestamp):
+        """True if a status snapshot taken at timestamp reflects our commands
+        
+        While a command is queued, or was sent after the snapshot, the
+        optimistic value shown on screen is newer than MPD's.
+        """
+        with self.lock:
+            if kind in self.pending or kind in self.sending:
+                return False
+            return self.applied.get(kind, 0) <= timestamp
+    
+    def run(self):
+        while self.running:
+            self.wakeup.wait()
+            self.wakeup.clear()
+            with self.lock:
+                batch, self.pending = self.pending, {}
+                self.sending = batch
+            if not batch or not self.running:
+                continue
+            try:
+                self.send(batch)
+            except Exception as e:
+                log_error(f"MPD command error: {e}")
+            finally:
+                with self.lock:
+                    now = time.monotonic()
+                    for kind in batch:
+                        self.applied[kind] = now
+                    self.sending = {}
+                self.on_done()
+    
+    def send(self, batch):
+        commands = []
+        if 'skip' in batch:
+            commands.extend(self.skip_commands(batch['skip']))
+        if 'play' in batch:
+            commands.append(('play',) if batch['play'] else ('pause', 1))
+        if 'volume' in batch:
+            commands.append(('setvol', batch['volume']))
+        with METRICS.timer("mpd_command"):
+            self.client.command_list(commands)
+        if DEBUG_LOGGING:
+            log_debug("MPD commands: %s", ', '.join(' '.join(map(str, c)) for c in commands))
+    
+    def skip_commands(self, offset):
+        """Turn a net skip into MPD commands
+        
+        Only in sequential playback do several taps become a single jump to
+        the queue position they add up to. With random or consume set the
+        next song isn't the next position, so each tap stays a
+        next/previous (sent in the same command list).
+        """
+        step = ('next',) if offset > 0 else ('previous',)
+        if abs(offset) == 1:
+            return [step]
+        status = dict(self.client.command('status'))
+        if 'song' not in status:
+            return [step]
+        if status.get('random', '0') != '0' or status.get('consume', '0') != '0':
+            return [step] * abs(offset)
+        last = int(status.get('playlistlength', 1)) - 1
+        position = max(0, min(last, int(status['song']) + offset))
+        return [('play', position)]
+
+class AsyncMPDConnection:
+    """MPD protocol over asyncio streams (one per PlayerMonitor)"""
+    
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.reader = None
+        self.writer = None
+    
+    async def connect(self):
+        asyncio = lazy_import("asyncio")
+        if self.host.startswith("/"):
+            opening = asyncio.open_unix_connection(self.host)
+        else:
+            opening = asyncio.open_connection(self.host, self.port)
+        self.reader, self.writer = await asyncio.wait_for(opening, MPD_TIMEOUT)
+        greeting = await asyncio.wait_for(self.read_line(), MPD_TIMEOUT)
+        if not greeting.startswith('OK MPD '):
+            raise MPDError(f"Unexpected MPD greeting: {greeting!r}")
+    
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+    
+    def send(self, *commands):
+        line = "".join(" ".join([c[0]] + [MPDClient.quote(a) for a in c[1:]]) + "\n"
+                       for c in commands)
+        self.writer.write(line.encode('utf-8'))
+    
+    async def read_line(self):
+        line = await self.reader.readline()
+        if not line:
+            raise ConnectionError("MPD closed the connection")
+        return line.decode('utf-8', 'replace').rstrip('\n')
+    
+    async def read_response(self, list_ok=False):
+        """Key/value pairs until OK (or list_OK inside a command list)"""
+        pairs = []
+        while True:
+            line = await self.read_line()
+            if line == 'OK' or (list_ok and line == 'list_OK'):
+                return pairs
+            if line.startswith('ACK '):
+                raise MPDError(line)
+            key, _, value = line.partition(': ')
+            if key == 'binary':
+                value = await self.reader.readexactly(int(value))
+                await self.reader.readexactly(1)
+            pairs.append((key, value))
+    
+    async def command_list(self, commands):
+        """Like MPDClient.command_list, one round trip"""
+        asyncio = lazy_import("asyncio")
+        self.send(('command_list_ok_begin',), *commands, ('command_list_end',))
+        
+        async def read():
+            results = [await self.read_response(list_ok=True) for _ in commands]
+            await self.read_response()  # Final OK
+            return results
+        
+        return await asyncio.wait_for(read(), MPD_TIMEOUT)
+
+class PlayerMonitor:
+    """Keeps one player's status current from MPD idle events
+    
+    Runs as a task on MultiPlayer's event loop over one connection:
+    status and current song are fetched on connect and after every
+    change MPD reports, so status is never older than the last event.
+    Commands for the player interrupt idle (noidle) and run in between.
+    """
+    
+    def __init__(self, name, host, port, on_change):
+        self.name = name
+        self.host = host
+        self.port = port or MPD_PORT
+        self.on_change = on_change  # Called on the event loop
+        self.status = None  # Latest MPDStatus, None while unreachable
+        self.requests = None  # asyncio.Queue of (commands, future)
+        self.connected = False
+    
+    async def run(self):
+        asyncio = lazy_import("asyncio")
+        self.requests = asyncio.Queue()
+        while True:
+            conn = AsyncMPDConnection(self.host, self.port)
+            try:
+                await conn.connect()
+                self.connected = True
+                METRICS.inc("mpd_connects_total")
+                log_info(f"Player {self.name} connected ({self.host})")
+                await self.refresh(conn)
+                while True:
+                    await self.wait(conn)
+            except (OSError, EOFError, MPDError, asyncio.TimeoutError) as e:
+                log_warning(f"Player {self.name} ({self.host}): {e}")
+            except Exception as e:
+                # e.g. a malformed response - reconnect rather than freeze
+                log_error(f"Player {self.name} ({self.host}) monitor error: {e!r}")
+            finally:
+                conn.close()
+            self.connected = False
+            self.status = None
+            self.on_change(self)
+            await asyncio.sleep(MPD_RECONNECT_DELAY)
+    
+    async def refresh(self, conn):
+        with METRICS.timer("mpd_status"):
+            status, song = await conn.command_list([('status',), ('currentsong',)])
+        self.status = MPDStatus(dict(status), dict(song))
+        self.on_change(self)
+    
+    async def wait(self, conn):
+        """Idle until MPD reports a change or a command is requested"""
+        asyncio = lazy_import("asyncio")
+        conn.send(('idle',) + MPD_IDLE_SUBSYSTEMS)
+        idle = asyncio.ensure_future(conn.read_response())
+        request = asyncio.ensure_future(self.requests.get())
+        try:
+            await asyncio.wait({idle, request}, return_when=asyncio.FIRST_COMPLETED)
+        except BaseException:
+            idle.cancel()
+            request.cancel()
+            raise
+        job = None
+        if request.done():
+            job = request.result()
+            if job[1].done():
+                job = None  # The caller timed out - don't run it late
+            if not idle.done():
+                conn.send(('noidle',))  # MPD ignores it if idle just ended
+        else:
+            request.cancel()
+        
+        try:
+            changed = [value for key, value in await idle if key == 'changed']
+            if job is not None:
+                commands, future = job
+                try:
+                    result = await conn.command_list(commands)
+                except MPDError as e:
+                    result = e
+                job = None
+                if not future.done():
+                    if isinstance(result, MPDError):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result)
+        except BaseException as e:
+            if job is not None and not job[1].done():
+                job[1].set_exception(ConnectionError(f"Player {self.name}: {e!r}"))
+            raise
+        if changed:
+            await self.refresh(conn)
+    
+    async def request(self, commands):
+        """Run a command list on this player (between idles)"""
+        if not self.connected:
+            raise ConnectionError(f"Player {self.name} unavailable")
+        future = lazy_import("asyncio").get_running_loop().create_future()
+        await self.requests.put((commands, future))
+        return await future
+
+class MultiPlayer:
+    """Several moOde players, each monitored by a PlayerMonitor
+    
+    All monitors share one asyncio event loop in one thread, so more
+    hosts mean more connections, not more threads or polling. Every
+    player's status is always current, so switching players only
+    changes which cached status is read.
+    
+    To the display it stands in for both the MPD client and the idle
+    watcher of the selected player: status_snapshot() returns the
+    cached status without any I/O, command()/command_list() run on the
+    selected player's connection.
+    """
+    
+    def __init__(self, players, on_change):
+        self.monitors = [PlayerMonitor(name, host, port, self.changed)
+                         for name, host, port in players]
+        self.on_change = on_change  # on_change(monitor), from the loop thread
+        self.selected = 0
+        self.loop = None
+        self.tasks = []
+        self.art_clients = {}  # Monitor index -> MPDClient for album art
+    
+    def start(self):
+        asyncio = lazy_import("asyncio")
+        self.loop = asyncio.new_event_loop()
+        threading.Thread(target=self.run, daemon=True).start()
+        log_info(f"Multi-player mode: {', '.join(m.name for m in self.monitors)}")
+    
+    def run(self):
+        lazy_import("asyncio").set_event_loop(self.loop)
+        self.tasks = [self.loop.create_task(m.run()) for m in self.monitors]
+        self.loop.run_forever()
+    
+    def stop(self):
+        if self.loop is not None and self.loop.is_running():
+            self.loop.call_soon_threadsafe(self._stop)
+        for client in self.art_clients.values():
+            client.close()
+    
+    def _stop(self):
+        for task in self.tasks:
+            task.cancel()
+        # Stop once the monitors have unwound (closing their connections)
+        stopped = lazy_import("asyncio").gather(*self.tasks, return_exceptions=True)
+        stopped.add_done_callback(lambda _: self.loop.stop())
+    
+    def close(self):
+        self.stop()
+    
+    def changed(self, monitor):
+        self.on_change(monitor)
+    
+    @property
+    def current(self):
+        return self.monitors[self.selected]
+    
+    def select(self, index):
+        self.selected = index % len(self.monitors)
+        return self.current
+    
+    @property
+    def connected(self):
+        """True while the selected player's events are being received"""
+        return self.current.connected
+    
+    def status_snapshot(self):
+        status = self.current.status
+        if status is None:
+            raise ConnectionError(f"Player {self.current.name} unavailable")
+        return status
+    
+    def command(self, name, *args):
+        return self.command_list([(name,) + args])[0]
+    
+    def command_list(self, commands):
+        asyncio = lazy_import("asyncio")
+        future = asyncio.run_coroutine_threadsafe(self.current.request(commands), self.loop)
+        try:
+            return future.result(MPD_TIMEOUT)
+        except Exception:
+            future.cancel()  # Still queued after a timeout: drop it
+            raise
+    
+    def art_client(self):
+        """Blocking client for album art transfers from the selected player"""
+        index = self.selected
+        if index not in self.art_clients:
+            monitor = self.monitors[index]
+            if monitor.host.startswith("/"):
+                client = MPDClient(socket_path=monitor.host)
+            else:
+                client = MPDClient(monitor.host, monitor.port, socket_path="")
+            self.art_clients[index] = client
+        return self.art_clients[index]
+
+class SpotifyTrack:
+    """Parsed spotmeta.txt record"""
+    
+    def __init__(self, title, artist, album, duration, art_url):
+        self.title = title
+        self.artist = artist
+        self.album = album
+        self.duration = duration  # seconds
+        self.art_url = art_url
+        self.started_at = time.monotonic()  # When the file changed (track start)
+
+def parse_spotmeta(content):
+    """Parse spotmeta.txt content, return SpotifyTrack or None if inactive"""
+    content = content.strip()
+    
+    # Check if content is empty, null, or whitespace
+    if not content or content == "null" or len(content) < 10:
+        log_debug("Spotify metadata empty or null")
+        return None
+    
+    # Format: Title~~~Artist~~~Album~~~Duration(ms)~~~ImageURLs~~~Format
+    parts = content.split('~~~')
+    
+    if len(parts) < 4:
+        log_debug("Spotify metadata incomplete (%s parts)", len(parts))
+        return None
+    
+    # Verify we have actual data (not empty fields)
+    if not parts[0] or not parts[1]:  # No title or artist
+        log_debug("Spotify metadata missing title or artist")
+        return None
+    
+    title = parts[0]
+    
+    # Artists (may be newline-separated)
+    artists = parts[1].split('\n')
+    artist = artists[0] if artists else "Unknown Artist"
+    
+    album = parts[2] if parts[2] else ""
+    
+    # Duration (in milliseconds)
+    try:
+        duration = int(parts[3]) // 1000 if parts[3] else 0
+    except ValueError:
+        duration = 0
+    
+    # Image URLs (newline-separated, first is largest)
+    art_url = None
+    if len(parts) > 4 and parts[4]:
+        art_url = parts[4].split('\n')[0] or None
+    
+    return SpotifyTrack(title, artist, album, duration, art_url)
+
+# inotify constants (linux/inotify.h)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_IGNORED = 0x00008000
+IN_CLOEXEC = 0o2000000
+INOTIFY_EVENT = struct.Struct("iIII")  # wd, mask, cookie, len
+
+class SpotmetaWatcher:
+    """Cached, change-driven view of spotmeta.txt
+    
+    Moode only rewrites spotmeta.txt when the Spotify track changes, so
+    the parsed record is kept and the file is re-read only when it
+    changes. Changes are detected with inotify on the file's directory
+    (the file may be replaced, not just rewritten); if inotify isn't
+    available the (mtime, size, inode) fingerprint is polled instead.
+    """
+    
+    def __init__(self, path, on_change=None):
+        self.path = path
+        self.on_change = on_change
+        
+        self.track = None  # Last parsed SpotifyTrack (None = inactive)
+        self.fingerprint = None
+        self.dirty = True  # Re-check file on next get()
+        self.lock = threading.Lock()
+        
+        self.inotify_fd = None
+        self.inotify_wd = None
+        self.libc = None
+        self.running = False
+    
+    @property
+    def event_driven(self):
+        """True if changes are pushed by inotify (no polling needed)"""
+        return self.inotify_fd is not None and self.running
+    
+    def start(self):
+        """Start inotify watch (falls back to polling on failure)"""
+        self.running = True
+        try:
+            ctypes = lazy_import("ctypes")
+            # libc is already loaded (find_library would run ldconfig)
+            libc = ctypes.CDLL(None, use_errno=True)
+            fd = libc.inotify_init1(IN_CLOEXEC)
+            if fd < 0:
+                raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+            directory = os.path.dirname(self.path) or "."
+            mask = IN_CLOSE_WRITE | IN_MOVED_TO | IN_MOVED_FROM | IN_CREATE | IN_DELETE
+            wd = libc.inotify_add_watch(fd, os.fsencode(directory), mask)
+            if wd < 0:
+                os.close(fd)
+                raise OSError(ctypes.get_errno(), f"inotify_add_watch({directory}) failed")
+        except Exception as e:
+            log_debug("inotify unavailable, polling %s: %s", self.path, e)
+            return
+        
+        self.libc = libc
+        self.inotify_fd = fd
+        self.inotify_wd = wd
+        threading.Thread(target=self.watch_loop, daemon=True).start()
+        log_debug("Watching %s with inotify", self.path)
+    
+    def stop(self):
+        self.running = False
+        if self.inotify_fd is not None:
+            # Removing the watch queues IN_IGNORED, which unblocks watch_loop
+            self.libc.inotify_rm_watch(self.inotify_fd, self.inotify_wd)
+    
+    def watch_loop(self):
+        name = os.fsencode(os.path.basename(self.path))
+        fd = self.inotify_fd
+        try:
+            while self.running:
+                data = os.read(fd, 4096)
+                offset = 0
+                changed = False
+                while offset < len(data):
+                    wd, mask, cookie, length = INOTIFY_EVENT.unpack_from(data, offset)
+                    offset += INOTIFY_EVENT.size
+                    event_name = data[offset:offset + length].rstrip(b'\0')
+                    offset += length
+                    if mask & IN_IGNORED:
+                        self.running = False
+                    elif event_name == name:
+                        changed = True
+                
+                if changed:
+                    with self.lock:
+                        self.dirty = True
+                    if self.on_change:
+                        self.on_change()
+        except Exception as e:
+            log_debug("inotify watch error: %s", e)
+        finally:
+            self.inotify_fd = None
+            os.close(fd)
+    
+    def read_fingerprint(self):
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+    
+    def get(self):
+        """Return the current SpotifyTrack (None if Spotify inactive)
+        
+        With inotify this does no file I/O unless the file changed.
+        """
+        with self.lock:
+            if self.event_driven and not self.dirty:
+                return self.track
+            self.dirty = False
+            
+            fingerprint = self.read_fingerprint()
+            if fingerprint == self.fingerprint:
+                return self.track
+            self.fingerprint = fingerprint
+            
+            if fingerprint is None:
+                self.track = None
+                return None
+            
+            with METRICS.timer("spotmeta_read"):
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+                self.track = parse_spotmeta(content)
+            log_debug("spotmeta.txt changed, metadata re-parsed")
+            return self.track
+
+def process_background(image_data, width=SCREEN_WIDTH, height=SCREEN_HEIGHT,
+                       pipeline=None):
+    """Turn raw cover art bytes into a blurred, darkened screen background"""
+    if (pipeline or ART_PIPELINE) == "fast":
+        return process_background_fast(image_data, width, height)
+    return process_background_quality(image_data, width, height)
+
+def process_background_fast(image_data, width=SCREEN_WIDTH, height=SCREEN_HEIGHT):
+    """Background pipeline working at ART_FAST_SCALE of the screen size
+    
+    The result is blurred and darkened, so there is no visible detail to
+    lose: JPEGs are DCT-downscaled while decoding (Image.draft), blur and
+    darkening run on the small image and only the result is upscaled.
+    """
+    work_size = (max(1, int(width * ART_FAST_SCALE)),
+                 max(1, int(height * ART_FAST_SCALE)))
+    
+    img = Image.open(BytesIO(image_data))
+    if img.format == 'JPEG':
+        # Decoder skips detail we'd throw away (scale 1/2, 1/4 or 1/8)
+        side = max(work_size)
+        img.draft('RGB', (side, side))
+    if img.mode != 'RGB':
+        img = img.convert('RGB')
+    
+    ImageOps = lazy_import("PIL.ImageOps")
+    ImageFilter = lazy_import("PIL.ImageFilter")
+    ImageEnhance = lazy_import("PIL.ImageEnhance")
+    
+    # Fill and center-crop to the working size
+    img = ImageOps.fit(img, work_size, Image.Resampling.BILINEAR)
+    
+    # Same blur radius relative to the picture as the quality pipeline
+    img = img.filter(ImageFilter.GaussianBlur(radius=10 * ART_FAST_SCALE))
+    img = ImageEnhance.Brightness(img).enhance(0.4)  # 40% brightness
+    
+    img = img.resize((width, height), Image.Resampling.BICUBIC)
+    log_debug("Background processed (fast, %sx%s)", work_size[0], work_size[1])
+    return img
+
+def process_background_quality(image_data, width=SCREEN_WIDTH, height=SCREEN_HEIGHT):
+    """Background pipeline at full screen resolution"""
+    ImageFilter = lazy_import("PIL.ImageFilter")
+    ImageEnhance = lazy_import("PIL.ImageEnhance")
+    
+    # Open image
+    img = Image.open(BytesIO(image_data))
+    log_debug("Image loaded: %s - %s", img.size, img.mode)
+    
+    # Convert to RGB if needed
+    if img.mode != 'RGB':
+        img = img.convert('RGB')
+    
+    # Resize to fill screen (maintain aspect ratio)
+    img_ratio = img.width / img.height
+    screen_ratio = width / height
+    
+    if img_ratio > screen_ratio:
+        # Image is wider than screen
+        new_height = height
+        new_width = int(new_height * img_ratio)
+    else:
+        # Image is taller than screen
+        new_width = width
+        new_height = int(new_width / img_ratio)
+    
+    img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+    log_debug("Resized to: %s", img.size)
+    
+    # Crop to screen size (center)
+    left = (new_width - width) // 2
+    top = (new_height - height) // 2
+    img = img.crop((left, top, left + width, top + height))
+    log_debug("Cropped to: %s", img.size)
+    
+    # Apply blur (subtle background effect)
+    img = img.filter(ImageFilter.GaussianBlur(radius=10))
+    log_debug("Blur applied")
+    
+    # Darken (create overlay effect)
+    enhancer = ImageEnhance.Brightness(img)
+    img = enhancer.enhance(0.4)  # 40% brightness
+    log_debug("Darkened")
+    
+    return img
+
+class AlbumArtCache:
+    """Two-tier cache for album art
+    
+    Memory: LRU of ready-to-show backgrounds (ART_CACHE_MEMORY_ITEMS).
+    Disk: original downloads and processed backgrounds under ART_CACHE_DIR,
+    evicted oldest-first once they exceed ART_CACHE_MAX_BYTES. Survives
+    restarts, so replaying an album needs no network or Pillow work.
+    """
+    
+    def __init__(self, directory=None, max_bytes=None, memory_items=None):
+        self.directory = directory = directory or ART_CACHE_DIR
+        self.max_bytes = max_bytes or ART_CACHE_MAX_BYTES
+        self.memory_items = memory_items or ART_CACHE_MEMORY_ITEMS
+        
+        self.memory = OrderedDict()  # key -> ready background
+        self.lock = threading.Lock()
+        self.disk_bytes = 0
+        self.disk_enabled = True
+        self.evicting = False  # A worker is scanning/deleting files
+        
+        # Statistics
+        self.memory_hits = 0
+        self.disk_hits = 0  # Processed background found on disk
+        self.original_hits = 0  # Only the original download found on disk
+        self.misses = 0
+        
+        try:
+            for sub in ("original", "background"):
+                os.makedirs(os.path.join(directory, sub), exist_ok=True)
+            self.disk_bytes = sum(size for _, size, _ in self._disk_files())
+            log_debug("Art cache: %s KB on disk in %s", self.disk_bytes // 1024, directory)
+        except OSError as e:
+            log_debug("Art cache disk tier disabled: %s", e)
+            self.disk_enabled = False
+    
+    @staticmethod
+    def key(source, width=SCREEN_WIDTH, height=SCREEN_HEIGHT):
+        """Cache key for a processed background (art URL, resolution, pipeline)"""
+        digest = lazy_import("hashlib").sha1(source.encode('utf-8')).hexdigest()
+        return f"{digest}_{width}x{height}_{ART_PIPELINE}"
+    
+    @staticmethod
+    def original_key(source):
+        return lazy_import("hashlib").sha1(source.encode('utf-8')).hexdigest()
+    
+    def _path(self, sub, name):
+        return os.path.join(self.directory, sub, name)
+    
+    def _disk_files(self):
+        """(path, size, mtime) for every cached file"""
+        files = []
+        for sub in ("original", "background"):
+            with os.scandir(os.path.join(self.directory, sub)) as it:
+                for entry in it:
+                    if entry.is_file():
+                        st = entry.stat()
+                        files.append((entry.path, st.st_size, st.st_mtime))
+        return files
+    
+    # Memory tier
+    
+    def get_memory(self, key):
+        with self.lock:
+            item = self.memory.get(key)
+            if item is not None:
+                self.memory.move_to_end(key)
+                self.memory_hits += 1
+            return item
+    
+    def put_memory(self, key, item):
+        with self.lock:
+            self.memory[key] = item
+            self.memory.move_to_end(key)
+            while len(self.memory) > self.memory_items:
+                self.memory.popitem(last=False)
+    
+    # Disk tier
+    
+    def _read(self, path):
+        if not self.disk_enabled:
+            return None
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path)  # Mark as recently used for eviction
+            return data
+        except OSError:
+            return None
+    
+    def _write(self, path, data):
+        if not self.disk_enabled:
+            return
+        try:
+            tmp = path + ".tmp"
+            with open(tmp, 'wb') as f:
+                f.write(data)
+            old_size = os.path.getsize(path) if os.path.exists(path) else 0
+            os.replace(tmp, path)
+            with self.lock:
+                self.disk_bytes += len(data) - old_size
+            self._evict()
+        except OSError as e:
+            log_warning(f"Art cache write error: {e}")
+    
+    def _evict(self):
+        """Delete least recently used files until under max_bytes
+        
+        The directory scan runs without the lock (it can take a while on an
+        SD card and get_memory() is called from the Tk thread). The scan
+        also corrects disk_bytes; files written meanwhile may be counted
+        twice until the next eviction.
+        """
+        with self.lock:
+            if self.disk_bytes <= self.max_bytes or self.evicting:
+                return
+            self.evicting = True
+            before = self.disk_bytes
+        try:
+            files = sorted(self._disk_files(), key=lambda f: f[2])
+            total = sum(size for _, size, _ in files)
+            removed = 0
+            for path, size, _ in files:
+                if total - removed <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                    removed += size
+                except OSError:
+                    pass
+            with self.lock:
+                self.disk_bytes = max(0, self.disk_bytes + total - before - removed)
+        finally:
+            with self.lock:
+                self.evicting = False
+    
+    def get_processed(self, key):
+        """Processed background as a PIL image, or None"""
+        data = self._read(self._path("background", key + ".jpg"))
+        if data is None:
+            return None
+        try:
+            img = Image.open(BytesIO(data))
+            img.load()
+        except Exception as e:
+            log_debug("Art cache: bad background %s: %s", key, e)
+            return None
+        with self.lock:
+            self.disk_hits += 1
+        return img
+    
+    def put_processed(self, key, img):
+        out = BytesIO()
+        img.save(out, format="JPEG", quality=90)
+        self._write(self._path("background", key + ".jpg"), out.getvalue())
+    
+    def read_processed(self, key):
+        """Processed background as JPEG bytes (for the push API), or None"""
+        return self._read(self._path("background", key + ".jpg"))
+    
+    def get_original(self, source):
+        data = self._read(self._path("original", self.original_key(source)))
+        if data is not None:
+            with self.lock:
+                self.original_hits += 1
+        return data
+    
+    def put_original(self, source, data):
+        self._write(self._path("original", self.original_key(source)), data)
+    
+    def count_miss(self):
+        """Worker thread: art that had to be fetched"""
+        with self.lock:
+            self.misses += 1
+    
+    def stats(self):
+        return {
+            'memory_hits': self.memory_hits,
+            'disk_hits': self.disk_hits,
+            'original_hits': self.original_hits,
+            'misses': self.misses,
+            'memory_items': len(self.memory),
+            'disk_bytes': self.disk_bytes,
+        }
+
+def download_art(url):
+    """Download album art bytes"""
+    log_debug("Loading album art: %s", url)
+    request = lazy_import("urllib.request")
+    with request.urlopen(url, timeout=ART_DOWNLOAD_TIMEOUT) as response:
+        return response.read()
+
+class AlbumArtLoader:
+    """Fetches and processes album art on a bounded worker pool
+    
+    request() replaces the current job: older jobs are cancelled if not
+    started yet, and dropped at the next checkpoint (or on delivery) if
+    they are. Finished backgrounds go to a queue and deliver() is called
+    so the Tk thread can pick them up with drain(). prefetch() warms the
+    cache for a track that hasn't started yet. A source is only fetched
+    once at a time: prefetch() skips the current request's source, and a
+    request for a source being prefetched is answered by that job.
+    
+    source is a stable id for the art (e.g. the URL) and fetch a
+    function returning the raw image bytes, or None if there is no art
+    (remembered so the source isn't asked again).
+    """
+    
+    def __init__(self, cache, deliver, make_image=None):
+        self.cache = cache
+        self.deliver = deliver
+        self.make_image = make_image  # e.g. ImageTk.PhotoImage (None = keep PIL)
+        self.executor = ThreadPoolExecutor(max_workers=ART_WORKERS,
+                                           thread_name_prefix="art")
+        self.results = queue.Queue()
+        self.generation = 0
+        self.current = None  # Future of the current job
+        self.current_key = None  # Its cache key
+        self.prefetching = set()  # Keys with a prefetch job in flight
+        self.joined = None  # (generation, key) of a request left to a prefetch
+        self.missing = set()  # Sources whose fetch found no art
+        self.shown = None  # Cache key of the art last drained (None = no art)
+        self.lock = threading.Lock()
+    
+    def request(self, source, fetch):
+        """Show art for source (None clears the background)"""
+        with self.lock:
+            self.generation += 1
+            gen = self.generation
+            if self.current is not None:
+                self.current.cancel()
+                self.current = None
+            self.current_key = None
+            self.joined = None
+        
+        if source is None or source in self.missing:
+            self._finish(gen, None, None)
+            return
+        
+        key = self.cache.key(source)
+        photo = self.cache.get_memory(key)
+        if photo is not None:
+            log_debug("Album art ready (memory cache)")
+            self._finish(gen, key, photo)
+            return
+        
+        with self.lock:
+            if key in self.prefetching:
+                # Already being fetched for the next track - it delivers
+                self.joined = (gen, key)
+                return
+            self.current_key = key
+            self.current = self.executor.submit(self._job, gen, key, source, fetch)
+    
+    def prefetch(self, source, fetch):
+        """Process art ahead of time so it is ready when the track starts"""
+        key = self.cache.key(source)
+        with self.lock:
+            if (key in self.prefetching or key in self.cache.memory
+                    or source in self.missing or key == self.current_key):
+                return
+            self.prefetching.add(key)
+        log_debug("Prefetching album art: %s", source)
+        self.executor.submit(self._job, None, key, source, fetch)
+    
+    def is_stale(self, gen):
+        return gen is not None and gen != self.generation
+    
+    def _finish(self, gen, key, image):
+        self.results.put((gen, key, image))
+        self.deliver()
+    
+    def _done(self, gen, key, image):
+        """Deliver a job's background (None = no art), also to a joined request"""
+        if gen is None:
+            with self.lock:
+                self.prefetching.discard(key)
+                if self.joined is not None and self.joined[1] == key:
+                    gen, self.joined = self.joined[0], None
+        if gen is None:
+            if image is not None:
+                self._finish(None, key, image)  # Warms the memory tier
+        elif not self.is_stale(gen):
+            self._finish(gen, key, image)
+    
+    def _job(self, gen, key, source, fetch):
+        image = None
+        try:
+            if self.is_stale(gen):
+                return
+            
+            # Processed background on disk
+            img = self.cache.get_processed(key)
+            if img is None:
+                # Original download on disk, otherwise fetch it
+                data = self.cache.get_original(source)
+                if data is None:
+                    self.cache.count_miss()
+                    with METRICS.timer("art_fetch"):
+                        data = fetch()
+                    if not data:
+                        log_debug("No album art for %s", source)
+                        with self.lock:
+                            if len(self.missing) > 1000:
+                                self.missing.clear()
+                            self.missing.add(source)
+                        return
+                    self.cache.put_original(source, data)
+                
+                if self.is_stale(gen):
+                    log_debug("Album art job dropped (track changed)")
+                    return
+                
+                with METRICS.timer("art_process"):
+                    img = process_background(data)
+                self.cache.put_processed(key, img)
+            image = img
+        except Exception as e:
+            log_warning(f"Album art load error: {e}")
+        finally:
+            self._done(gen, key, image)
+    
+    def drain(self):
+        """Tk thread: collect finished jobs
+        
+        Returns (changed, photo): changed is True if the current request
+        finished, photo is its PhotoImage (None = no art).
+        """
+        changed, photo = False, None
+        while True:
+            try:
+                gen, key, image = self.results.get_nowait()
+            except queue.Empty:
+                break
+            if self.is_stale(gen):
+                continue
+            
+            if isinstance(image, Image.Image):
+                # PhotoImages must be created on the Tk thread
+                if self.make_image:
+                    with METRICS.timer("art_photo"):
+                        image = self.make_image(image)
+                self.cache.put_memory(key, image)
+            
+            if gen is not None:
+                changed, photo = True, image
+                self.shown = key if image is not None else None
+        
+        if changed and DEBUG_LOGGING:
+            log_debug("Album art ready, cache stats: %s", self.cache.stats())
+        return changed, photo
+    
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+def database_mtime(path):
+    """Newest mtime of an SQLite database and its WAL file
+    
+    Writes in WAL mode only touch the -wal file until a checkpoint.
+    """
+    mtime = os.stat(path).st_mtime_ns
+    try:
+        mtime = max(mtime, os.stat(path + "-wal").st_mtime_ns)
+    except FileNotFoundError:
+        pass
+    return mtime
+
+class StationStore:
+    """Paged, read-only access to moOde's radio station table
+    
+    Only the visible page plus STATION_PREFETCH_PAGES are queried, using
+    keyset pagination on (name, id) over one kept-open read-only
+    connection. The page count comes from a cached COUNT(*). Everything
+    cached is dropped when the database file's mtime changes, so edits
+    made in the moOde web UI show up.
+    """
+    
+    def __init__(self, db_path=None, page_size=None):
+        self.db_path = db_path or DB_PATH
+        self.page_size = page_size or STATIONS_PER_PAGE
+        self.conn = None
+        self.db_mtime = None
+        self.reset()
+    
+    def reset(self):
+        self.count = None
+        self.pages = {}  # page number -> list of station tuples
+        self.page_starts = {0: None}  # page number -> (name, id) before it
+        self.facet_index = None  # StationFacets, built on first use
+    
+    def connect(self):
+        if self.conn is None:
+            sqlite3 = lazy_import("sqlite3")
+            self.conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True,
+                                        check_same_thread=False)
+        return self.conn
+    
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+    
+    def check_changed(self):
+        """Drop cached pages/count if the database changed, return True if so"""
+        mtime = database_mtime(self.db_path)
+        if mtime == self.db_mtime:
+            return False
+        if self.db_mtime is not None:
+            log_debug("Station database changed, reloading")
+        self.db_mtime = mtime
+        self.reset()
+        return True
+    
+    @staticmethod
+    def make_station(row):
+        """Station tuple (id, name, url, genre, country) from a DB row"""
+        station_id, station_name, stream_url, genre, country = row
+        # Remove .pls from display name if present
+        return (station_id, station_name.replace('.pls', ''), stream_url, genre, country)
+    
+    def total(self):
+        """Number of stations (cached COUNT(*))"""
+        self.check_changed()
+        if self.count is None:
+            row = self.connect().execute(
+                "SELECT COUNT(*) FROM cfg_radio WHERE type = 'r' " + STATION_FILTER).fetchone()
+            self.count = row[0]
+            log_debug("Station count: %s", self.count)
+        return self.count
+    
+    def total_pages(self):
+        return (self.total() + self.page_size - 1) // self.page_size
+    
+    def facets(self):
+        """Genre/country index over all stations (rebuilt when the DB changes)"""
+        self.check_changed()
+        if self.facet_index is None:
+            start = time.perf_counter()
+            rows = self.connect().execute(
+                "SELECT id, genre, country FROM cfg_radio WHERE type = 'r' "
+                + STATION_FILTER + " ORDER BY name, id").fetchall()
+            self.facet_index = StationFacets(rows)
+            log_debug("Facet index built: %s stations in %.0f ms",
+                      len(rows), (time.perf_counter() - start) * 1000)
+        return self.facet_index
+    
+    def stations_by_id(self, ids):
+        """Station tuples for the given ids, in the same order"""
+        if not ids:
+            return []
+        placeholders = ",".join("?" * len(ids))
+        rows = self.connect().execute(
+            "SELECT id, name, station, genre, country FROM cfg_radio "
+            f"WHERE id IN ({placeholders})", list(ids)).fetchall()
+        by_id = {row[0]: self.make_station(row) for row in rows}
+        return [by_id[i] for i in ids if i in by_id]
+    
+    def _fetch_from(self, page):
+        """Query page and the prefetch window after it (page start must be known)"""
+        start = self.page_starts[page]
+        limit = self.page_size * (1 + STATION_PREFETCH_PAGES)
+        query = ("SELECT id, name, station, genre, country FROM cfg_radio "
+                 "WHERE type = 'r' " + STATION_FILTER + " {} ORDER BY name, id LIMIT ?")
+        with METRICS.timer("station_query"):
+            if start is None:
+                rows = self.connect().execute(query.format(""), (limit,)).fetchall()
+            else:
+                rows = self.connect().execute(query.format("AND (name, id) > (?, ?)"),
+                                              (start[0], start[1], limit)).fetchall()
+        
+        for offset in range(0, max(len(rows), 1), self.page_size):
+            chunk = rows[offset:offset + self.page_size]
+            number = page + offset // self.page_size
+            self.pages[number] = [self.make_station(r) for r in chunk]
+            if len(chunk) == self.page_size:
+                last = chunk[-1]
+                self.page_starts[number + 1] = (last[1], last[0])
+    
+    def page(self, page):
+        """Stations on a page (list of (id, name, url, genre, country))"""
+        self.check_changed()
+        if page in self.pages:
+            return self.pages[page]
+        
+        # Walk forward from the nearest page whose start key is known
+        known = max(p for p in self.page_starts if p <= page)
+        while page not in self.pages:
+            if known not in self.page_starts:
+                return []  # Past the end
+            self._fetch_from(known)
+            known += 1 + STATION_PREFETCH_PAGES
+        
+        # Keep cached rows to a window around the current page
+        window = 2 * (1 + STATION_PREFETCH_PAGES)
+        for number in [p for p in self.pages if abs(p - page) > window]:
+            del self.pages[number]
+        return self.pages[page]
 
-# Radio browser constants
-DB_PATH = "/var/local/www/db/moode-sqlite3.db"
-STATIONS_PER_PAGE = 6  # 3x2 grid
-BUTTON_BG = "#222222"
-BUTTON_ACTIVE = "#444444"
+class StationLogos:
+    """Station logo thumbnails decoded in the background
+    
+    Logos are decoded and scaled to LOGO_SIZE on a worker thread and
+    turned into PhotoImages on the Tk thread (drain()), kept in a bounded
+    LRU. Stations without a logo are remembered as missing so tiles fall
+    back to text without touching the disk again.
+    """
+    
+    def __init__(self, deliver):
+        self.deliver = deliver  # Called (any thread) when logos are ready
+        self.cache = OrderedDict()  # station name -> PhotoImage or False
+        self.pending = set()
+        self.results = queue.Queue()
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="logo")
+    
+    def get(self, name):
+        """PhotoImage for a station, None if not loaded (or no logo)"""
+        photo = self.cache.get(name)
+        if photo is not None:
+            self.cache.move_to_end(name)
+        return photo or None
+    
+    def request(self, names):
+        """Decode logos for these stations unless cached or already queued"""
+        for name in names:
+            if name in self.cache or name in self.pending:
+                continue
+            self.pending.add(name)
+            self.executor.submit(self._load, name)
+    
+    @staticmethod
+    def find(name):
+        for directory in RADIO_LOGO_DIRS:
+            path = os.path.join(directory, name + ".jpg")
+            if os.path.exists(path):
+                return path
+        return None
+    
+    def _load(self, name):
+        img = None
+        try:
+            path = self.find(name)
+            if path:
+                img = Image.open(path)
+                img.draft('RGB', (LOGO_SIZE, LOGO_SIZE))
+                img = img.convert('RGB')
+                img.thumbnail((LOGO_SIZE, LOGO_SIZE), Image.Resampling.LANCZOS)
+        except Exception as e:
+            log_debug("Logo load error (%s): %s", name, e)
+            img = None
+        self.results.put((name, img))
+        self.deliver()
+    
+    def drain(self):
+        """Tk thread: cache finished logos, return the names now available"""
+        ready = []
+        while True:
+            try:
+                name, img = self.results.get_nowait()
+            except queue.Empty:
+                break
+            self.pending.discard(name)
+            self.cache[name] = ImageTk.PhotoImage(img) if img is not None else False
+            self.cache.move_to_end(name)
+            if img is not None:
+                ready.append(name)
+        while len(self.cache) > LOGO_CACHE_ITEMS:
+            self.cache.popitem(last=False)
+        return ready
 
-def log_debug(message):
-    """Write debug messages to log file"""
-    try:
-        timestamp = time.strftime("%H:%M:%S")
-        with open(LOG_FILE, "a") as f:
-            f.write(f"[{timestamp}] {message}\n")
-    except:
-        pass
+class StationFacets:
+    """In-memory inverted index: facet value -> sorted station positions
+    
+    Stations are numbered by their position in name order, so every
+    posting array is sorted and a filtered selection comes out in display
+    order. Combining facets (Jazz + France) intersects the arrays; the
+    table isn't scanned again.
+    """
+    
+    KINDS = ("genre", "country")
+    
+    def __init__(self, rows):
+        """rows: (id, genre, country) in name order"""
+        self.ids = array('l')  # position -> station id
+        self.index = {kind: {} for kind in self.KINDS}
+        for position, (station_id, genre, country) in enumerate(rows):
+            self.ids.append(station_id)
+            for value in self.genre_values(genre):
+                self.index["genre"].setdefault(value, array('l')).append(position)
+            country = (country or "").strip()
+            if country:
+                self.index["country"].setdefault(country, array('l')).append(position)
+    
+    @staticmethod
+    def genre_values(genre):
+        """moOde genres are comma-separated ("Jazz, Blues")"""
+        values = []
+        for value in (genre or "").split(','):
+            value = value.strip()
+            if value and value not in values:
+                values.append(value)
+        return values
+    
+    def select(self, filters):
+        """Sorted positions matching every active filter, None if no filters"""
+        postings = [self.index[kind].get(value, ())
+                    for kind, value in filters.items() if value]
+        if not postings:
+            return None
+        postings.sort(key=len)
+        result = set(postings[0])
+        for other in postings[1:]:
+            result.intersection_update(other)
+        return sorted(result)
+    
+    def values(self, kind, filters):
+        """(value, count) for a facet, counted within the other active filters"""
+        others = {k: v for k, v in filters.items() if k != kind}
+        within = self.select(others)
+        if within is None:
+            counts = [(value, len(posting)) for value, posting in self.index[kind].items()]
+        else:
+            within = set(within)
+            counts = [(value, len(within.intersection(posting)))
+                      for value, posting in self.index[kind].items()]
+        counts = [c for c in counts if c[1]]
+        counts.sort(key=lambda c: (-c[1], c[0].lower()))
+        return counts
+    
+    def station_ids(self, positions):
+        return [self.ids[p] for p in positions]
+
+class StationSearch:
+    """Full-text station search over name, genre and country
+    
+    The index lives in a sidecar database (STATION_INDEX_PATH) so moOde's
+    own database is only ever opened read-only. It mirrors cfg_radio into
+    a local table with an FTS5 index (trigram tokenizer for substring
+    matches, unicode61 prefix matching on older SQLite, plain LIKE if FTS5
+    is missing) kept in sync by triggers. sync() only touches rows that
+    were added, removed or changed since the last sync.
+    """
+    
+    def __init__(self, db_path=None, index_path=None):
+        self.db_path = db_path or DB_PATH
+        self.index_path = index_path or STATION_INDEX_PATH
+        self.conn = None
+        self.tokenizer = None  # "trigram", "unicode61" or None (no FTS5)
+    
+    def open(self):
+        if self.conn is not None:
+            return self.conn
+        os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+        sqlite3 = lazy_import("sqlite3")
+        conn = sqlite3.connect(f"file:{self.index_path}", uri=True,
+                               check_same_thread=False)
+        conn.execute("ATTACH DATABASE ? AS moode", (f"file:{self.db_path}?mode=ro",))
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS stations (
+                id INTEGER PRIMARY KEY, name TEXT, station TEXT,
+                genre TEXT, country TEXT);
+            CREATE INDEX IF NOT EXISTS stations_name ON stations (name, id);
+        """)
+        
+        row = conn.execute("SELECT value FROM meta WHERE key = 'tokenizer'").fetchone()
+        self.tokenizer = row[0] if row else None
+        if self.tokenizer is None:
+            for tokenizer in ("trigram", "unicode61"):
+                try:
+                    conn.execute(f"""
+                        CREATE VIRTUAL TABLE station_fts USING fts5(
+                            name, genre, country,
+                            content='stations', content_rowid='id',
+                            tokenize='{tokenizer}')""")
+                except sqlite3.OperationalError:
+                    continue
+                conn.executescript("""
+                    CREATE TRIGGER stations_ai AFTER INSERT ON stations BEGIN
+                        INSERT INTO station_fts(rowid, name, genre, country)
+                        VALUES (new.id, new.name, new.genre, new.country);
+                    END;
+                    CREATE TRIGGER stations_ad AFTER DELETE ON stations BEGIN
+                        INSERT INTO station_fts(station_fts, rowid, name, genre, country)
+                        VALUES ('delete', old.id, old.name, old.genre, old.country);
+                    END;
+                """)
+                self.tokenizer = tokenizer
+                break
+            # Rebuild through the new triggers on next sync
+            conn.execute("DELETE FROM stations")
+            conn.execute("DELETE FROM meta WHERE key = 'source'")
+            conn.execute("INSERT OR REPLACE INTO meta VALUES ('tokenizer', ?)",
+                         (self.tokenizer or "none",))
+            conn.commit()
+        if self.tokenizer == "none":
+            self.tokenizer = None
+        
+        self.conn = conn
+        log_debug("Station search index: %s (%s)", self.index_path, self.tokenizer or 'LIKE')
+        return conn
+    
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+    
+    def sync(self):
+        """Bring the index up to date with cfg_radio (only changed rows)"""
+        conn = self.open()
+        source = f"{database_mtime(self.db_path)}|{STATION_FILTER}"
+        row = conn.execute("SELECT value FROM meta WHERE key = 'source'").fetchone()
+        if row and row[0] == source:
+            return
+        
+        start = time.perf_counter()
+        with conn:
+            conn.execute("DROP TABLE IF EXISTS temp.src")
+            conn.execute("CREATE TEMP TABLE src (id INTEGER PRIMARY KEY, name TEXT, "
+                         "station TEXT, genre TEXT, country TEXT)")
+            conn.execute("INSERT INTO temp.src "
+                         "SELECT id, name, station, genre, country FROM moode.cfg_radio "
+                         "WHERE type = 'r' " + STATION_FILTER)
+            removed = conn.execute("""
+                DELETE FROM stations WHERE NOT EXISTS (
+                    SELECT 1 FROM temp.src s WHERE s.id = stations.id
+                    AND s.name IS stations.name AND s.station IS stations.station
+                    AND s.genre IS stations.genre AND s.country IS stations.country)
+            """).rowcount
+            added = conn.execute("""
+                INSERT INTO stations SELECT * FROM temp.src
+                WHERE id NOT IN (SELECT id FROM stations)
+            """).rowcount
+            conn.execute("DROP TABLE temp.src")
+            conn.execute("INSERT OR REPLACE INTO meta VALUES ('source', ?)", (source,))
+        log_debug("Station index synced: -%s +%s rows in %.0f ms",
+                  removed, added, (time.perf_counter() - start) * 1000)
+    
+    def query(self, text, limit=SEARCH_RESULTS):
+        """Return (stations, total matches) for the search text"""
+        conn = self.open()
+        terms = text.split()
+        if not terms:
+            return [], 0
+        
+        # FTS handles terms it can index; short ones (trigram needs 3
+        # characters) and the no-FTS case fall back to LIKE on the mirror
+        if self.tokenizer == "trigram":
+            fts_terms = [t for t in terms if len(t) >= 3]
+        elif self.tokenizer:
+            fts_terms = terms
+        else:
+            fts_terms = []
+        like_terms = [t for t in terms if t not in fts_terms]
+        
+        where = []
+        params = []
+        if fts_terms:
+            suffix = "*" if self.tokenizer == "unicode61" else ""
+            match = " AND ".join('"' + t.replace('"', '""') + '"' + suffix for t in fts_terms)
+            where.append("s.id IN (SELECT rowid FROM station_fts WHERE station_fts MATCH ?)")
+            params.append(match)
+        for term in like_terms:
+            pattern = "%" + term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            where.append("(s.name LIKE ? ESCAPE '\\' OR s.genre LIKE ? ESCAPE '\\' "
+                         "OR s.country LIKE ? ESCAPE '\\')")
+            params += [pattern] * 3
+        condition = " AND ".join(where)
+        
+        rows = conn.execute(
+            "SELECT s.id, s.name, s.station, s.genre, s.country "
+            "FROM stations s INDEXED BY stations_name "
+            f"WHERE {condition} ORDER BY s.name, s.id LIMIT ?", params + [limit]).fetchall()
+        total = len(rows)
+        if total == limit:
+            total = conn.execute(
+                f"SELECT COUNT(*) FROM (SELECT 1 FROM stations s WHERE {condition} "
+                "LIMIT ?)", params + [SEARCH_COUNT_LIMIT]).fetchone()[0]
+        return [StationStore.make_station(r) for r in rows], total
 
 class RadioBrowser:
     """Radio station browser with grid view and pagination"""
@@ -65,71 +2485,93 @@ class RadioBrowser:
         self.height = height
         
         # State
-        self.stations = []
+        self.store = StationStore()  # Queried on demand, per page
         self.current_page = 0
         self.total_pages = 0
         
+        # Facet browsing: mode is "stations" or a facet kind ("genre",
+        # "country") whose values are shown in the grid instead
+        self.mode = "stations"
+        self.filters = {kind: None for kind in StationFacets.KINDS}
+        self.station_page = 0  # Page to return to after picking a facet
+        
+        # Logo thumbnails, decoded in the background
+        self.logos = StationLogos(lambda: self.parent.after(0, self.apply_logos))
+        self.tile_names = [None] * STATIONS_PER_PAGE  # Station shown per tile
+        
         # UI elements
         self.frame = None
         self.station_buttons = []
         
-        # Load stations
-        self.load_stations()
-    
-    def load_stations(self):
-        """Load radio stations from Moode database"""
-        try:
-            conn = sqlite3.connect(DB_PATH)
-            cursor = conn.cursor()
-            
-            # Get all radio stations, ordered by name
-            cursor.execute("""
-                SELECT id, name, station, genre, country
-                FROM cfg_radio
-                WHERE type = 'r'
-                ORDER BY name
-            """)
-            
-            rows = cursor.fetchall()
-            conn.close()
-            
-            # Store stations as tuples (id, name, url, genre, country)
-            self.stations = []
-            for row in rows:
-                station_id = row[0]
-                station_name = row[1]
-                stream_url = row[2]  # This is the actual stream URL!
-                genre = row[3]
-                country = row[4]
-                
-                # Remove .pls from display name if present
-                display_name = station_name.replace('.pls', '')
-                
-                # Store with actual stream URL from database
-                self.stations.append((station_id, display_name, stream_url, genre, country))
-            
-            self.total_pages = (len(self.stations) + STATIONS_PER_PAGE - 1) // STATIONS_PER_PAGE
-            log_debug(f"Loaded {len(self.stations)} stations, {self.total_pages} pages")
+        # Search mode
+        self.search = None  # StationSearch, opened on first use
+        self.search_frame = None
+        self.search_text = ""
+        self.result_buttons = []
+    
+    def load_page(self):
+        """Items for the current page
+        
+        Station tuples, or (value, count) pairs when choosing a facet
+        (value None = "All").
+        """
+        try:
+            if self.mode != "stations":
+                items = [(None, 0)] + self.store.facets().values(self.mode, self.filters)
+            elif any(self.filters.values()):
+                facets = self.store.facets()
+                items = facets.select(self.filters)
+            else:
+                self.total_pages = self.store.total_pages()
+                self.current_page = max(0, min(self.current_page, self.total_pages - 1))
+                return self.store.page(self.current_page)
             
+            self.total_pages = (len(items) + STATIONS_PER_PAGE - 1) // STATIONS_PER_PAGE
+            self.current_page = max(0, min(self.current_page, self.total_pages - 1))
+            start = self.current_page * STATIONS_PER_PAGE
+            items = items[start:start + STATIONS_PER_PAGE]
+            if self.mode == "stations":
+                items = self.store.stations_by_id(facets.station_ids(items))
+            return items
         except Exception as e:
-            log_debug(f"Error loading stations: {e}")
-            self.stations = []
+            log_error(f"Error loading stations: {e}")
+            self.store.close()
             self.total_pages = 0
+            return []
     
-    def show(self):
-        """Show the radio browser"""
-        if self.frame:
-            self.frame.destroy()
-        
+    def build(self):
+        """Create the browser widgets once; page flips only reconfigure them"""
         # Create main frame (covers entire screen)
         self.frame = tk.Frame(self.parent, bg=BG_COLOR)
-        self.frame.place(x=0, y=0, width=self.width, height=self.height)
         
-        # Title
-        title = tk.Label(self.frame, text="📻 Radio Stations",
-                        font=("Arial", 24, "bold"),
-                        fg=TEXT_COLOR, bg=BG_COLOR)
-        title.pack(pady=15)
+        # Title (shows active genre/country filters)
+        self.title_label = tk.Label(self.frame, text="📻 Radio Stations",
+                                    font=("Arial", 24, "bold"),
+                                    fg=TEXT_COLOR, bg=BG_COLOR)
+        self.title_label.pack(pady=15)
+        
+        # Facet buttons (top left)
+        facet_frame = tk.Frame(self.frame, bg=BG_COLOR)
+        facet_frame.place(x=30, y=15, anchor="nw")
+        self.facet_buttons = {}
+        for kind in StationFacets.KINDS:
+            btn = tk.Button(facet_frame, text=kind.title(),
+                            font=("Arial", 16, "bold"),
+                            bg=BUTTON_BG, fg=TEXT_COLOR,
+                            activebackground=BUTTON_ACTIVE,
+                            relief=tk.FLAT, bd=0,
+                            command=lambda k=kind: self.show_facet(k))
+            btn.pack(side=tk.LEFT, padx=(0, 8))
+            self.facet_buttons[kind] = btn
+        
+        # Search button (top right)
+        btn_search = tk.Button(self.frame, text="🔍 Search",
+                               font=("Arial", 16, "bold"),
+                               bg=BUTTON_BG, fg=TEXT_COLOR,
+                               activebackground=BUTTON_ACTIVE,
+                               relief=tk.FLAT, bd=0,
+                               command=self.show_search)
+        btn_search.place(relx=1.0, x=-30, y=15, anchor="ne")
         
         # Grid frame for station buttons
         grid_frame = tk.Frame(self.frame, bg=BG_COLOR)
@@ -137,31 +2579,19 @@ class RadioBrowser:
         
         # Create station buttons (3 columns x 2 rows)
         self.station_buttons = []
-        start_idx = self.current_page * STATIONS_PER_PAGE
-        end_idx = min(start_idx + STATIONS_PER_PAGE, len(self.stations))
-        
         for i in range(STATIONS_PER_PAGE):
             row = i // 3
             col = i % 3
             
-            if start_idx + i < end_idx:
-                station = self.stations[start_idx + i]
-                station_id, station_name, url, genre, country = station
-                
-                # Format station name for display
-                display_name = self.format_station_name(station_name)
-                
-                # Create button for station
-                btn = tk.Button(grid_frame, 
-                               text=display_name,
-                               font=("Arial", 14, "bold"),
-                               bg=BUTTON_BG, fg=TEXT_COLOR,
-                               activebackground=BUTTON_ACTIVE,
-                               relief=tk.RAISED, bd=3,
-                               wraplength=200,
-                               command=lambda s=station: self.play_station(s))
-                btn.grid(row=row, column=col, padx=8, pady=8, sticky="nsew")
-                self.station_buttons.append(btn)
+            btn = tk.Button(grid_frame,
+                           text="",
+                           font=("Arial", 14, "bold"),
+                           bg=BUTTON_BG, fg=TEXT_COLOR,
+                           activebackground=BUTTON_ACTIVE,
+                           relief=tk.RAISED, bd=3,
+                           wraplength=200)
+            btn.grid(row=row, column=col, padx=8, pady=8, sticky="nsew")
+            self.station_buttons.append(btn)
         
         # Configure grid weights for equal sizing
         for i in range(3):
@@ -174,36 +2604,30 @@ class RadioBrowser:
         control_frame.pack(side=tk.BOTTOM, fill=tk.X, padx=20, pady=15)
         
         # Previous button
-        btn_prev = tk.Button(control_frame, text="◀ Previous",
-                            font=("Arial", 18, "bold"),
-                            bg=BUTTON_BG, fg=TEXT_COLOR,
-                            activebackground=BUTTON_ACTIVE,
-                            relief=tk.FLAT, bd=0,
-                            width=11, height=2,
-                            command=self.previous_page)
-        btn_prev.pack(side=tk.LEFT, padx=10)
-        
-        if self.current_page == 0:
-            btn_prev.config(state=tk.DISABLED, fg="#555555")
+        self.btn_prev = tk.Button(control_frame, text="◀ Previous",
+                                  font=("Arial", 18, "bold"),
+                                  bg=BUTTON_BG, fg=TEXT_COLOR,
+                                  activebackground=BUTTON_ACTIVE,
+                                  relief=tk.FLAT, bd=0,
+                                  width=11, height=2,
+                                  command=self.previous_page)
+        self.btn_prev.pack(side=tk.LEFT, padx=10)
         
         # Page indicator
-        page_text = f"Page {self.current_page + 1} of {self.total_pages}"
-        tk.Label(control_frame, text=page_text,
-                font=("Arial", 18, "bold"),
-                fg=TEXT_COLOR, bg=BG_COLOR).pack(side=tk.LEFT, expand=True)
+        self.page_label = tk.Label(control_frame, text="",
+                                   font=("Arial", 18, "bold"),
+                                   fg=TEXT_COLOR, bg=BG_COLOR)
+        self.page_label.pack(side=tk.LEFT, expand=True)
         
         # Next button
-        btn_next = tk.Button(control_frame, text="Next ▶",
-                            font=("Arial", 18, "bold"),
-                            bg=BUTTON_BG, fg=TEXT_COLOR,
-                            activebackground=BUTTON_ACTIVE,
-                            relief=tk.FLAT, bd=0,
-                            width=11, height=2,
-                            command=self.next_page)
-        btn_next.pack(side=tk.LEFT, padx=10)
-        
-        if self.current_page >= self.total_pages - 1:
-            btn_next.config(state=tk.DISABLED, fg="#555555")
+        self.btn_next = tk.Button(control_frame, text="Next ▶",
+                                  font=("Arial", 18, "bold"),
+                                  bg=BUTTON_BG, fg=TEXT_COLOR,
+                                  activebackground=BUTTON_ACTIVE,
+                                  relief=tk.FLAT, bd=0,
+                                  width=11, height=2,
+                                  command=self.next_page)
+        self.btn_next.pack(side=tk.LEFT, padx=10)
         
         # Close button
         btn_close = tk.Button(control_frame, text="✕ Close",
@@ -215,6 +2639,148 @@ class RadioBrowser:
                              command=self.hide)
         btn_close.pack(side=tk.RIGHT, padx=10)
     
+    def preload(self):
+        """Build the widgets and open the station DB without showing them"""
+        if self.frame is None:
+            self.build()
+        self.load_page()
+    
+    def show(self):
+        """Show the radio browser"""
+        if self.frame is None:
+            self.build()
+        self.render_page()
+        self.frame.place(x=0, y=0, width=self.width, height=self.height)
+        self.frame.lift()
+    
+    def render_page(self):
+        """Fill the existing tiles and nav buttons for the current page"""
+        start = time.perf_counter()
+        page_items = self.load_page()
+        
+        for i, btn in enumerate(self.station_buttons):
+            if i >= len(page_items):
+                # Empty slot on the last page
+                btn.grid_remove()
+                continue
+            
+            if self.mode == "stations":
+                station = page_items[i]
+                station_id, station_name, url, genre, country = station
+                
+                # Format station name for display
+                display_name = self.format_station_name(station_name)
+                btn.config(text=display_name,
+                           command=lambda s=station: self.play_station(s))
+                self.tile_names[i] = station_name
+                self.set_tile_logo(btn, self.logos.get(station_name))
+            else:
+                value, count = page_items[i]
+                if value is None:
+                    text = "All genres" if self.mode == "genre" else "All countries"
+                else:
+                    text = f"{self.format_station_name(value)}\n{count} stations"
+                btn.config(text=text,
+                           command=lambda v=value: self.select_facet(self.mode, v))
+                self.tile_names[i] = None
+                self.set_tile_logo(btn, None)
+            btn.grid()
+        
+        if self.mode == "stations":
+            # Logos for this page first, then neighbours after the redraw
+            self.logos.request([name for name in self.tile_names[:len(page_items)]])
+            self.frame.after_idle(self.prefetch_logos)
+        
+        # Title and facet buttons reflect the active filters
+        active = [v for v in self.filters.values() if v]
+        if self.mode != "stations":
+            title = f"Choose {self.mode}"
+        elif active:
+            title = "📻 " + " · ".join(active)
+        else:
+            title = "📻 Radio Stations"
+        if len(title) > 24:
+            title = title[:21] + "..."
+        self.title_label.config(text=title)
+        for kind, btn in self.facet_buttons.items():
+            btn.config(bg=BUTTON_ACTIVE if self.filters[kind] or self.mode == kind
+                       else BUTTON_BG)
+        
+        if self.current_page == 0:
+            self.btn_prev.config(state=tk.DISABLED, fg="#555555")
+        else:
+            self.btn_prev.config(state=tk.NORMAL, fg=TEXT_COLOR)
+        
+        if self.current_page >= self.total_pages - 1:
+            self.btn_next.config(state=tk.DISABLED, fg="#555555")
+        else:
+            self.btn_next.config(state=tk.NORMAL, fg=TEXT_COLOR)
+        
+        self.page_label.config(text=f"Page {self.current_page + 1} of {self.total_pages}")
+        
+        # Log once Tk has processed the changes (idle callbacks run after redraw)
+        page = self.current_page + 1
+        def shown():
+            elapsed = (time.perf_counter() - start) * 1000
+            METRICS.observe("radio_page", elapsed)
+            log_debug("Radio page %s shown in %.1f ms", page, elapsed)
+        self.frame.after_idle(shown)
+    
+    def set_tile_logo(self, btn, photo):
+        """Show a logo above the tile text, or text only"""
+        if photo is not None:
+            btn.config(image=photo, compound=tk.TOP)
+        else:
+            btn.config(image="", compound=tk.NONE)
+    
+    def apply_logos(self):
+        """Tk thread: put newly decoded logos on the visible tiles"""
+        ready = set(self.logos.drain())
+        if self.mode != "stations":
+            return
+        for btn, name in zip(self.station_buttons, self.tile_names):
+            if name in ready:
+                self.set_tile_logo(btn, self.logos.get(name))
+    
+    def stations_on_page(self, page):
+        """Stations on another page of the current listing"""
+        if page < 0 or page >= self.total_pages:
+            return []
+        if any(self.filters.values()):
+            facets = self.store.facets()
+            positions = facets.select(self.filters)
+            start = page * STATIONS_PER_PAGE
+            return self.store.stations_by_id(
+                facets.station_ids(positions[start:start + STATIONS_PER_PAGE]))
+        return self.store.page(page)
+    
+    def prefetch_logos(self):
+        """Decode logos for the pages either side of the current one"""
+        if self.mode != "stations":
+            return
+        try:
+            for page in (self.current_page + 1, self.current_page - 1):
+                self.logos.request([station[1] for station in self.stations_on_page(page)])
+        except Exception as e:
+            log_debug("Logo prefetch error: %s", e)
+    
+    def show_facet(self, kind):
+        """Show the values of a facet (genre/country) with station counts"""
+        if self.mode == "stations":
+            self.station_page = self.current_page
+        self.mode = kind
+        self.current_page = 0
+        self.render_page()
+    
+    def select_facet(self, kind, value):
+        """Filter stations by a facet value (None clears that facet)"""
+        log_debug("Radio filter %s: %s", kind, value)
+        changed = self.filters[kind] != value
+        self.filters[kind] = value
+        self.mode = "stations"
+        self.current_page = 0 if changed else self.station_page
+        self.render_page()
+    
     def format_station_name(self, name):
         """Format station name for display"""
         # Remove .pls extension if present
@@ -229,107 +2795,862 @@ class RadioBrowser:
     def play_station(self, station):
         """Play selected radio station"""
         station_id, station_name, url, genre, country = station
-        log_debug(f"User selected station: {station_name}")
-        log_debug(f"Station URL: {url}")
-        
-        try:
-            # Check current playback state first
-            status_result = subprocess.run(['mpc', 'status'], 
-                                         capture_output=True, text=True, check=False)
-            was_playing = '[playing]' in status_result.stdout
-            
-            # Clear queue and add station
-            clear_result = subprocess.run(['mpc', 'clear'], 
-                                        capture_output=True, text=True, check=False)
-            log_debug(f"mpc clear result: {clear_result.returncode}")
-            
-            # Add the station - try with RADIO/ prefix
-            add_result = subprocess.run(['mpc', 'add', url], 
-                                      capture_output=True, text=True, check=False)
-            log_debug(f"mpc add result: {add_result.returncode}, stderr: {add_result.stderr}")
-            
-            # If add failed, try without RADIO/ prefix
-            if add_result.returncode != 0 or add_result.stderr:
-                log_debug(f"Trying without RADIO/ prefix")
-                # Remove RADIO/ prefix
-                url_without_prefix = url.replace('RADIO/', '')
-                add_result = subprocess.run(['mpc', 'add', url_without_prefix], 
-                                          capture_output=True, text=True, check=False)
-                log_debug(f"mpc add (no prefix) result: {add_result.returncode}, stderr: {add_result.stderr}")
-            
-            # Start playback
-            play_result = subprocess.run(['mpc', 'play'], 
-                                       capture_output=True, text=True, check=False)
-            log_debug(f"mpc play result: {play_result.returncode}, stderr: {play_result.stderr}")
-            
-            # Verify what's playing
-            current_result = subprocess.run(['mpc', 'current'], 
-                                          capture_output=True, text=True, check=False)
-            log_debug(f"Now playing: {current_result.stdout.strip()}")
-            
-            # Close browser after selection
-            self.hide()
-            
+        log_debug("User selected station: %s", station_name)
+        log_debug("Station URL: %s", url)
+        
+        # Close browser right away; MPD commands run in the background
+        self.hide()
+        self.main_display.play_url(url)
+    
+    def next_page(self):
+        """Go to next page"""
+        if self.current_page < self.total_pages - 1:
+            self.current_page += 1
+            self.render_page()
+    
+    def previous_page(self):
+        """Go to previous page"""
+        if self.current_page > 0:
+            self.current_page -= 1
+            self.render_page()
+    
+    def build_search(self):
+        """Create the search screen: query line, result tiles, keyboard"""
+        self.search_frame = tk.Frame(self.parent, bg=BG_COLOR)
+        
+        # Query line with close button
+        top = tk.Frame(self.search_frame, bg=BG_COLOR)
+        top.pack(fill=tk.X, padx=20, pady=(12, 4))
+        self.search_label = tk.Label(top, text="", anchor="w", padx=10,
+                                     font=("Arial", 20, "bold"),
+                                     fg=TEXT_COLOR, bg=BUTTON_BG)
+        self.search_label.pack(side=tk.LEFT, expand=True, fill=tk.X, ipady=4)
+        tk.Button(top, text="✕ Close",
+                  font=("Arial", 16, "bold"),
+                  bg="#CC0000", fg=TEXT_COLOR,
+                  activebackground="#990000",
+                  relief=tk.FLAT, bd=0,
+                  command=self.hide_search).pack(side=tk.RIGHT, padx=(10, 0), ipady=4)
+        
+        # Match count
+        self.search_count_label = tk.Label(self.search_frame, text="",
+                                           font=("Arial", 12),
+                                           fg="#CCCCCC", bg=BG_COLOR)
+        self.search_count_label.pack()
+        
+        # Result tiles (3 columns)
+        results_frame = tk.Frame(self.search_frame, bg=BG_COLOR)
+        results_frame.pack(fill=tk.X, padx=20)
+        self.result_buttons = []
+        for i in range(SEARCH_RESULTS):
+            btn = tk.Button(results_frame, text="",
+                            font=("Arial", 12, "bold"),
+                            bg=BUTTON_BG, fg=TEXT_COLOR,
+                            activebackground=BUTTON_ACTIVE,
+                            relief=tk.RAISED, bd=2,
+                            wraplength=220, height=2)
+            btn.grid(row=i // 3, column=i % 3, padx=4, pady=4, sticky="nsew")
+            self.result_buttons.append(btn)
+        for i in range(3):
+            results_frame.columnconfigure(i, weight=1, uniform="results")
+        
+        # On-screen keyboard
+        keyboard = tk.Frame(self.search_frame, bg=BG_COLOR)
+        keyboard.pack(side=tk.BOTTOM, pady=(0, 10))
+        for keys in SEARCH_KEYBOARD_ROWS:
+            row = tk.Frame(keyboard, bg=BG_COLOR)
+            row.pack()
+            for key in keys:
+                tk.Button(row, text=key,
+                          font=("Arial", 16, "bold"),
+                          bg=BUTTON_BG, fg=TEXT_COLOR,
+                          activebackground=BUTTON_ACTIVE,
+                          relief=tk.FLAT, bd=0,
+                          width=3 if len(key) == 1 else 6, height=1,
+                          command=lambda k=key: self.search_key(k)).pack(
+                              side=tk.LEFT, padx=2, pady=2)
+    
+    def show_search(self):
+        """Open the search screen over the browser"""
+        try:
+            if self.search is None:
+                self.search = StationSearch()
+            self.search.sync()
+        except Exception as e:
+            log_debug("Station search unavailable: %s", e)
+            return
+        
+        if self.search_frame is None:
+            self.build_search()
+        self.search_text = ""
+        self.update_search()
+        self.search_frame.place(x=0, y=0, width=self.width, height=self.height)
+        self.search_frame.lift()
+        log_debug("Station search opened")
+    
+    def search_key(self, key):
+        """Handle an on-screen keyboard key"""
+        if key == "⌫":
+            self.search_text = self.search_text[:-1]
+        elif key == "Space":
+            self.search_text += " "
+        elif key == "Clear":
+            self.search_text = ""
+        else:
+            self.search_text += key.lower()
+        self.update_search()
+    
+    def update_search(self):
+        """Re-run the search and fill the result tiles"""
+        start = time.perf_counter()
+        try:
+            results, total = self.search.query(self.search_text)
         except Exception as e:
-            log_debug(f"Error playing station: {e}")
-            import traceback
-            log_debug(f"Traceback: {traceback.format_exc()}")
+            log_error(f"Station search error: {e}")
+            results, total = [], 0
+        elapsed = (time.perf_counter() - start) * 1000
+        METRICS.observe("station_search", elapsed)
+        
+        for i, btn in enumerate(self.result_buttons):
+            if i < len(results):
+                station = results[i]
+                btn.config(text=self.format_station_name(station[1]),
+                           command=lambda s=station: self.play_station(s))
+                btn.grid()
+            else:
+                btn.grid_remove()
+        
+        self.search_label.config(text=self.search_text.upper() + "▏")
+        if not self.search_text.strip():
+            self.search_count_label.config(text="Type a station name, genre or country")
+        elif total == 1:
+            self.search_count_label.config(text="1 station")
+        elif total >= SEARCH_COUNT_LIMIT:
+            self.search_count_label.config(text=f"{SEARCH_COUNT_LIMIT}+ stations")
+        else:
+            self.search_count_label.config(text=f"{total} stations")
+        
+        if self.search_text:
+            log_debug("Search '%s': %s matches in %.1f ms", self.search_text, total, elapsed)
+    
+    def hide_search(self):
+        """Close the search screen (back to the station grid)"""
+        if self.search_frame:
+            self.search_frame.place_forget()
+    
+    def hide(self):
+        """Hide the radio browser (widgets are kept for next time)"""
+        self.hide_search()
+        if self.frame:
+            self.frame.place_forget()
+            log_debug("Radio browser closed")
+
+class PlayerState:
+    """Immutable snapshot of what the now-playing screen shows
+    
+    update_loop builds one per tick and publishes it only when it differs
+    from the last one; the Tk thread swaps in the newest pending snapshot
+    once per frame. A frame is drawn from a single snapshot, so it never
+    mixes fields of two tracks.
+    """
+    
+    __slots__ = ("player", "source", "playing", "title", "artist", "album", "duration",
+                 "volume", "muted", "art_url", "progress")
+    
+    def __init__(self, player="", source="unknown", playing=False, title="", artist="",
+                 album="", duration=0, volume=0, muted=False, art_url=None,
+                 progress=(0.0, 0.0, False, 0.0, None)):
+        init = object.__setattr__
+        init(self, "player", player)  # Player name in multi-player mode
+        init(self, "source", source)  # "mpd", "spotify" or "unknown"
+        init(self, "playing", playing)
+        init(self, "title", title)
+        init(self, "artist", artist)
+        init(self, "album", album)
+        init(self, "duration", duration)  # seconds
+        init(self, "volume", volume)  # Last non-zero volume while muted
+        init(self, "muted", muted)
+        init(self, "art_url", art_url)  # Spotify cover URL
+        init(self, "progress", progress)  # ProgressEngine anchor
+    
+    def __setattr__(self, name, value):
+        raise AttributeError(f"PlayerState is immutable (tried to set {name})")
+    
+    def replace(self, **changes):
+        """Copy with some fields changed"""
+        fields = {name: getattr(self, name) for name in self.__slots__}
+        fields.update(changes)
+        return PlayerState(**fields)
+    
+    def fields(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+    
+    def __eq__(self, other):
+        return isinstance(other, PlayerState) and self.fields() == other.fields()
+    
+    def __hash__(self):
+        return hash(self.fields())
+    
+    @property
+    def track_id(self):
+        return f"{self.artist}-{self.title}"
+
+class PollScheduler:
+    """Picks the update_loop poll interval from the player state
+    
+    Fast for POLL_FAST_WINDOW seconds after a transition or a tap (follow-up
+    changes such as stream titles and audio format arrive then), the normal
+    rate while playing, slower while paused and slowest while stopped. When
+    MPD idle events and inotify deliver changes, the timed poll is only a
+    fallback and each rate is stretched accordingly.
+    """
+    
+    def __init__(self):
+        self.fast_until = 0.0
+        self.last_state = None
+    
+    def activity(self):
+        self.fast_until = time.monotonic() + POLL_FAST_WINDOW
+    
+    def observe(self, state):
+        """Record the (source, playing, track) state, True if it changed"""
+        if state == self.last_state:
+            return False
+        self.last_state = state
+        self.activity()
+        return True
+    
+    def delay(self, playing, paused, event_driven):
+        """Seconds until the next timed poll"""
+        if time.monotonic() < self.fast_until:
+            interval = UPDATE_INTERVAL if event_driven else POLL_FAST_INTERVAL
+        elif playing:
+            interval = IDLE_FALLBACK_INTERVAL if event_driven else UPDATE_INTERVAL
+        elif paused:
+            interval = IDLE_FALLBACK_INTERVAL if event_driven else POLL_PAUSED_INTERVAL
+        else:
+            interval = IDLE_STOPPED_INTERVAL if event_driven else POLL_STOPPED_INTERVAL
+        return interval / 1000.0
+
+class Backlight:
+    """Display backlight via /sys/class/backlight (if present and writable)"""
+    
+    def __init__(self, directory=None):
+        self.directory = directory or BACKLIGHT_DIR or self.find()
+        self.saved = None  # Brightness to restore
+    
+    @staticmethod
+    def find():
+        try:
+            names = sorted(os.listdir("/sys/class/backlight"))
+        except OSError:
+            return None
+        return os.path.join("/sys/class/backlight", names[0]) if names else None
+    
+    def read(self, name):
+        with open(os.path.join(self.directory, name)) as f:
+            return int(f.read())
+    
+    def write(self, value):
+        with open(os.path.join(self.directory, "brightness"), "w") as f:
+            f.write(str(value))
+    
+    def set_level(self, level):
+        """Set brightness to level (0-1) of the maximum, True if it worked"""
+        if not self.directory:
+            return False
+        try:
+            if self.saved is None:
+                self.saved = self.read("brightness")
+            self.write(round(self.read("max_brightness") * level))
+            return True
+        except OSError as e:
+            log_warning(f"Backlight control unavailable ({self.directory}): {e}")
+            self.directory = None
+            return False
+    
+    def restore(self):
+        if self.directory and self.saved is not None:
+            try:
+                self.write(self.saved)
+            except OSError as e:
+                log_warning(f"Backlight restore failed: {e}")
+        self.saved = None
+
+class ProgressEngine:
+    """Extrapolates playback position between status snapshots
+    
+    sync() is called by the poller with elapsed/duration/state and the
+    monotonic time the values were valid; position() is called by the
+    Tk animation and needs no I/O. The anchor is only replaced on track
+    change, play/pause, duration change or when the reported position
+    drifts from the prediction by more than PROGRESS_RESYNC_DRIFT (seek).
+    """
+    
+    def __init__(self):
+        # (elapsed, duration, playing, timestamp, track_key) - replaced as
+        # a whole so the Tk thread never sees a half-updated anchor
+        self.anchor = (0.0, 0.0, False, time.monotonic(), None)
+    
+    def sync(self, elapsed, duration, playing, track_key, timestamp=None):
+        """Record a snapshot, return True if the anchor was reset"""
+        if timestamp is None:
+            timestamp = time.monotonic()
+        
+        _, old_duration, old_playing, _, old_key = self.anchor
+        if (track_key == old_key and playing == old_playing
+                and duration == old_duration
+                and abs(self.position(timestamp) - elapsed) <= PROGRESS_RESYNC_DRIFT):
+            return False
+        
+        self.anchor = (elapsed, duration, playing, timestamp, track_key)
+        return True
+    
+    def position(self, now=None):
+        """Estimated elapsed seconds"""
+        elapsed, duration, playing, timestamp, _ = self.anchor
+        if playing:
+            if now is None:
+                now = time.monotonic()
+            elapsed += now - timestamp
+            if duration > 0:
+                elapsed = min(elapsed, duration)
+        return max(0.0, elapsed)
+    
+    def follow(self, anchor):
+        """Take over the anchor of another engine (from a PlayerState)"""
+        self.anchor = anchor
+    
+    @property
+    def duration(self):
+        return self.anchor[1]
+    
+    @property
+    def moving(self):
+        """True if the bar needs animating"""
+        return self.anchor[2] and self.anchor[1] > 0
+
+class DiffRenderer:
+    """Applies widget changes only when a value differs from the last frame
+    
+    Remembers the last value set for every (widget, option) and skips Tk
+    calls that wouldn't change anything. Counts the Tk operations each
+    frame actually performed so the savings can be measured.
+    """
+    
+    def __init__(self):
+        self.applied = {}  # (widget/item key, option) -> last value
+        self.frame_ops = 0
+        self.last_frame_ops = 0
+        self.frames = 0
+        self.total_ops = 0
+    
+    def _changed(self, key, options):
+        changed = {}
+        for name, value in options.items():
+            if self.applied.get((key, name), self) != value:
+                self.applied[(key, name)] = value
+                changed[name] = value
+        return changed
+    
+    def config(self, widget, **options):
+        """widget.config(...) with only the options that changed"""
+        changed = self._changed(str(widget), options)
+        if changed:
+            widget.config(**changed)
+            self.frame_ops += 1
+    
+    def itemconfig(self, canvas, item, **options):
+        """canvas.itemconfig(item, ...) with only the options that changed"""
+        changed = self._changed((str(canvas), item), options)
+        if changed:
+            canvas.itemconfig(item, **changed)
+            self.frame_ops += 1
+    
+    def coords(self, canvas, item, *coords):
+        """canvas.coords(item, ...) if the coordinates changed"""
+        if self._changed((str(canvas), item), {'coords': coords}):
+            canvas.coords(item, *coords)
+            self.frame_ops += 1
+    
+    def place(self, widget, visible, **options):
+        """Show widget with place(**options) or hide it with place_forget()"""
+        if self._changed(str(widget), {'placed': visible}):
+            if visible:
+                widget.place(**options)
+            else:
+                widget.place_forget()
+            self.frame_ops += 1
+    
+    def begin_frame(self):
+        self.frame_ops = 0
+    
+    def end_frame(self):
+        """Finish a frame, return the number of Tk operations it performed"""
+        self.last_frame_ops = self.frame_ops
+        self.total_ops += self.frame_ops
+        self.frames += 1
+        if self.frames % RENDER_STATS_FRAMES == 0:
+            log_debug("Render stats: %s frames, %.2f widget ops/frame, last frame %s",
+                      self.frames, self.total_ops / self.frames, self.last_frame_ops)
+        return self.frame_ops
+
+class FrameLoop:
+    """Main loop for the framebuffer backend (stands in for Tk's)
+    
+    Provides the parts of the Tk root MoodeDisplay uses: after(),
+    after_idle() and after_cancel() (callable from any thread), plus
+    mainloop() and quit(). Callbacks run on the thread in mainloop().
+    """
+    
+    def __init__(self):
+        self.timers = []  # Heap of (due, id, func, args)
+        self.cancelled = set()
+        self.next_id = 0
+        self.running = False
+        self.cond = threading.Condition()
+    
+    def after(self, ms, func, *args):
+        with self.cond:
+            self.next_id += 1
+            heapq.heappush(self.timers, (time.monotonic() + ms / 1000, self.next_id, func, args))
+            self.cond.notify()
+            return self.next_id
+    
+    def after_idle(self, func, *args):
+        return self.after(0, func, *args)
+    
+    def after_cancel(self, timer_id):
+        with self.cond:
+            self.cancelled.add(timer_id)
+    
+    def mainloop(self):
+        self.running = True
+        while True:
+            with self.cond:
+                while self.running:
+                    now = time.monotonic()
+                    if self.timers and self.timers[0][0] <= now:
+                        _, timer_id, func, args = heapq.heappop(self.timers)
+                        break
+                    self.cond.wait(self.timers[0][0] - now if self.timers else None)
+                else:
+                    return
+                if timer_id in self.cancelled:
+                    self.cancelled.discard(timer_id)
+                    continue
+            try:
+                func(*args)
+            except Exception as e:
+                log_error(f"Frame loop callback error: {e}")
+    
+    def quit(self):
+        with self.cond:
+            self.running = False
+            self.cond.notify()
+    
+    destroy = quit
+
+class FramebufferOutput:
+    """Writes frame regions to a memory-mapped Linux framebuffer"""
+    
+    RAWMODES = {32: "BGRX", 24: "BGR"}  # 16 bpp is packed by hand (RGB565)
+    
+    def __init__(self, device=None):
+        self.device = device or FB_DEVICE
+        sysfs = os.path.join("/sys/class/graphics", os.path.basename(self.device))
+        
+        def read(name):
+            with open(os.path.join(sysfs, name)) as f:
+                return f.read().strip()
+        
+        width, height = (int(v) for v in read("virtual_size").split(","))
+        self.bpp = int(read("bits_per_pixel"))
+        self.stride = int(read("stride"))
+        if self.bpp not in (16, 24, 32):
+            raise OSError(f"{self.device}: unsupported {self.bpp} bits per pixel")
+        self.size = (width, height)
+        
+        self.fd = os.open(self.device, os.O_RDWR)
+        self.mem = mmap.mmap(self.fd, self.stride * height)
+        log_info(f"Framebuffer {self.device}: {width}x{height}, {self.bpp} bpp")
+    
+    def pack(self, image):
+        if self.bpp != 16:
+            return image.tobytes("raw", self.RAWMODES[self.bpp])
+        # RGB565 little-endian: low byte gggbbbbb, high byte rrrrrggg
+        ImageChops = lazy_import("PIL.ImageChops")
+        r, g, b = image.split()
+        low = ImageChops.add(g.point(lambda v: (v & 0x1C) << 3), b.point(lambda v: v >> 3))
+        high = ImageChops.add(r.point(lambda v: v & 0xF8), g.point(lambda v: v >> 5))
+        return Image.merge("LA", (low, high)).tobytes()
+    
+    def write(self, frame, boxes):
+        width, height = self.size
+        pixel = self.bpp // 8
+        for box in boxes:
+            x0, y0 = box[0], box[1]
+            x1, y1 = min(box[2], width), min(box[3], height)
+            if x1 <= x0 or y1 <= y0:
+                continue
+            data = self.pack(frame.crop((x0, y0, x1, y1)))
+            row = (x1 - x0) * pixel
+            for y in range(y0, y1):
+                offset = y * self.stride + x0 * pixel
+                start = (y - y0) * row
+                self.mem[offset:offset + row] = data[start:start + row]
+    
+    def close(self):
+        self.mem.close()
+        os.close(self.fd)
+
+class ImageFileOutput:
+    """Writes frames to a PNG (or raw RGB) file instead of a screen, for testing"""
+    
+    def __init__(self, path):
+        self.path = path
+        self.size = (SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.frames = 0
+        self.last_boxes = []
+    
+    def write(self, frame, boxes):
+        self.frames += 1
+        self.last_boxes = list(boxes)
+        tmp = self.path + ".tmp"
+        if self.path.endswith(".png"):
+            frame.save(tmp, "PNG", compress_level=1)
+        else:
+            with open(tmp, "wb") as f:
+                f.write(frame.tobytes())
+        os.replace(tmp, self.path)
+    
+    def close(self):
+        pass
+
+class FrameComposer:
+    """Builds frames as a Pillow image and outputs only the changed areas
+    
+    Every element has a box, a state value and a draw function. An element
+    whose box or state changed marks its old and new box dirty; dirty
+    boxes are repainted from the background plus the elements overlapping
+    them and handed to the output.
+    """
+    
+    def __init__(self, output, size=(SCREEN_WIDTH, SCREEN_HEIGHT)):
+        self.output = output
+        self.size = size
+        self.background = Image.new("RGB", size, BG_COLOR)
+        self.frame = self.background.copy()
+        self.elements = {}  # name -> (box, state, draw)
+        self.dirty = [(0, 0) + size]
+        self.frames = 0
+        self.pixels = 0
+    
+    def set_background(self, image):
+        """Full-screen background (None = plain BG_COLOR)"""
+        if image is None:
+            image = Image.new("RGB", self.size, BG_COLOR)
+        elif image.size != self.size:
+            image = image.resize(self.size)
+        self.background = image.convert("RGB")
+        self.dirty.append((0, 0) + self.size)
+    
+    def element(self, name, box, state, draw):
+        """Show an element; draw(draw, x, y, state) paints it at (x, y)"""
+        old = self.elements.get(name)
+        if old is None or old[0] != box or old[1] != state:
+            if old is not None:
+                self.dirty.append(old[0])
+            self.dirty.append(box)
+        self.elements[name] = (box, state, draw)
+    
+    def remove(self, name):
+        old = self.elements.pop(name, None)
+        if old is not None:
+            self.dirty.append(old[0])
+    
+    def merge_dirty(self):
+        """Clip dirty boxes to the screen and merge overlapping ones"""
+        width, height = self.size
+        boxes = []
+        for x0, y0, x1, y1 in self.dirty:
+            box = [max(0, x0), max(0, y0), min(width, x1), min(height, y1)]
+            if box[0] >= box[2] or box[1] >= box[3]:
+                continue
+            merged = True
+            while merged:
+                merged = False
+                for other in boxes:
+                    if (box[0] < other[2] and other[0] < box[2]
+                            and box[1] < other[3] and other[1] < box[3]):
+                        boxes.remove(other)
+                        box = [min(box[0], other[0]), min(box[1], other[1]),
+                               max(box[2], other[2]), max(box[3], other[3])]
+                        merged = True
+                        break
+            boxes.append(box)
+        self.dirty = []
+        
+        # Many small boxes cost more than one full redraw
+        if sum((b[2] - b[0]) * (b[3] - b[1]) for b in boxes) > width * height // 2:
+            return [(0, 0, width, height)]
+        return [tuple(b) for b in boxes]
+    
+    def flush(self):
+        """Repaint and output dirty areas, return the boxes written"""
+        boxes = self.merge_dirty()
+        ImageDraw = lazy_import("PIL.ImageDraw")
+        for box in boxes:
+            tile = self.background.crop(box)
+            draw = ImageDraw.Draw(tile)
+            for ebox, state, paint in self.elements.values():
+                if (ebox[0] < box[2] and box[0] < ebox[2]
+                        and ebox[1] < box[3] and box[1] < ebox[3]):
+                    paint(draw, ebox[0] - box[0], ebox[1] - box[1], state)
+            self.frame.paste(tile, box[:2])
+            self.pixels += (box[2] - box[0]) * (box[3] - box[1])
+        if boxes:
+            self.output.write(self.frame, boxes)
+            self.frames += 1
+            if self.frames % RENDER_STATS_FRAMES == 0:
+                full = self.size[0] * self.size[1]
+                log_debug("Frame stats: %s frames, %.1f%% of pixels redrawn",
+                          self.frames, 100 * self.pixels / (full * self.frames))
+        return boxes
+
+# evdev constants (linux/input-event-codes.h)
+EV_SYN = 0x00
+EV_KEY = 0x01
+EV_ABS = 0x03
+ABS_X = 0x00
+ABS_Y = 0x01
+ABS_MT_POSITION_X = 0x35
+ABS_MT_POSITION_Y = 0x36
+ABS_MT_TRACKING_ID = 0x39
+BTN_TOUCH = 0x14a
+INPUT_EVENT = struct.Struct("llHHi")  # struct input_event (native long timeval)
+INPUT_ABSINFO = struct.Struct("6i")  # value, minimum, maximum, fuzz, flat, resolution
+
+class TouchInput:
+    """Reads taps from an evdev touchscreen and calls on_tap(x, y)
+    
+    Talks to /dev/input/event* directly (no python-evdev needed). Touch
+    coordinates are scaled from the device's axis range to the screen.
+    A touch that travels SWIPE_DISTANCE sideways calls on_swipe(1) for
+    a swipe to the left, on_swipe(-1) to the right, instead of on_tap.
+    Callbacks run on the reader thread.
+    """
+    
+    def __init__(self, on_tap, device=None, on_swipe=None):
+        self.on_tap = on_tap
+        self.on_swipe = on_swipe
+        self.device = device or FB_TOUCH_DEVICE or self.find_device()
+        self.running = False
+        self.fd = None
+    
+    @staticmethod
+    def find_device():
+        """First input device reporting absolute X/Y (a touchscreen)"""
+        long_bits = struct.calcsize("l") * 8
+        try:
+            names = sorted(os.listdir("/sys/class/input"))
+        except OSError:
+            return None
+        for name in names:
+            if not name.startswith("event"):
+                continue
+            try:
+                with open(f"/sys/class/input/{name}/device/capabilities/abs") as f:
+                    words = f.read().split()
+            except OSError:
+                continue
+            bits = 0
+            for word in words:
+                bits = (bits << long_bits) | int(word, 16)
+            if bits & (1 << ABS_X | 1 << ABS_MT_POSITION_X):
+                return f"/dev/input/{name}"
+        return None
+    
+    def axis_range(self, code):
+        # EVIOCGABS(code) = _IOR('E', 0x40 + code, struct input_absinfo)
+        request = (2 << 30) | (INPUT_ABSINFO.size << 16) | (ord('E') << 8) | (0x40 + code)
+        info = fcntl.ioctl(self.fd, request, bytes(INPUT_ABSINFO.size))
+        _, minimum, maximum = INPUT_ABSINFO.unpack(info)[:3]
+        return minimum, max(maximum, minimum + 1)
+    
+    def start(self):
+        if not self.device:
+            log_warning("No touchscreen found, touch input disabled")
+            return
+        try:
+            self.fd = os.open(self.device, os.O_RDONLY)
+            self.ranges = {ABS_X: self.axis_range(ABS_X), ABS_Y: self.axis_range(ABS_Y)}
+        except OSError as e:
+            log_warning(f"Touch input unavailable ({self.device}): {e}")
+            return
+        self.ranges[ABS_MT_POSITION_X] = self.ranges[ABS_X]
+        self.ranges[ABS_MT_POSITION_Y] = self.ranges[ABS_Y]
+        self.running = True
+        threading.Thread(target=self.run, daemon=True).start()
+        log_info(f"Touch input: {self.device}")
     
-    def next_page(self):
-        """Go to next page"""
-        if self.current_page < self.total_pages - 1:
-            self.current_page += 1
-            self.show()
+    def stop(self):
+        self.running = False
     
-    def previous_page(self):
-        """Go to previous page"""
-        if self.current_page > 0:
-            self.current_page -= 1
-            self.show()
+    def scale(self, code, value, screen):
+        minimum, maximum = self.ranges[code]
+        return (value - minimum) * screen // (maximum - minimum)
     
-    def hide(self):
-        """Hide the radio browser"""
-        if self.frame:
-            self.frame.destroy()
-            self.frame = None
-            log_debug("Radio browser closed")
+    def run(self):
+        x = y = 0
+        touching = False
+        origin = None  # Where the current touch started
+        while self.running:
+            readable, _, _ = select.select([self.fd], [], [], 0.5)
+            if not readable:
+                continue
+            try:
+                data = os.read(self.fd, INPUT_EVENT.size * 64)
+            except OSError as e:
+                log_warning(f"Touch read error: {e}")
+                break
+            for offset in range(0, len(data) - INPUT_EVENT.size + 1, INPUT_EVENT.size):
+                _, _, kind, code, value = INPUT_EVENT.unpack_from(data, offset)
+                if kind == EV_ABS and code in (ABS_X, ABS_MT_POSITION_X):
+                    x = self.scale(code, value, SCREEN_WIDTH)
+                elif kind == EV_ABS and code in (ABS_Y, ABS_MT_POSITION_Y):
+                    y = self.scale(code, value, SCREEN_HEIGHT)
+                elif kind == EV_SYN and touching and origin is None:
+                    origin = (x, y)  # End of the touch's first report
+                elif (kind == EV_KEY and code == BTN_TOUCH) or (
+                        kind == EV_ABS and code == ABS_MT_TRACKING_ID):
+                    down = value > 0 if kind == EV_KEY else value >= 0
+                    if touching and not down:
+                        # Act on release, like a Tk button
+                        dx, dy = (x - origin[0], y - origin[1]) if origin else (0, 0)
+                        if self.on_swipe and abs(dx) >= SWIPE_DISTANCE and abs(dx) > abs(dy):
+                            self.on_swipe(1 if dx < 0 else -1)
+                        else:
+                            self.on_tap(x, y)
+                    elif down and not touching:
+                        origin = None
+                    touching = down
+        os.close(self.fd)
 
 class MoodeDisplay:
     def __init__(self, root):
         self.root = root
-        self.root.title("Moode Audio")
-        self.root.geometry(f"{SCREEN_WIDTH}x{SCREEN_HEIGHT}")
-        self.root.configure(bg=BG_COLOR, cursor="none")
-        
-        # Fullscreen
-        self.root.attributes("-fullscreen", True)
-        self.root.bind("<Escape>", lambda e: self.root.destroy())
+        with STARTUP.phase("window setup"):
+            self.setup_window()
+        setup_start = time.perf_counter()
         
-        # State variables
-        self.current_track = ""
-        self.current_artist = ""
-        self.current_album = ""
-        self.current_duration = 0
-        self.elapsed_time = 0
-        self.is_playing = False
-        self.current_volume = 0
-        self.is_muted = False
-        self.album_art_url = None
+        # Player state: self.state is what the screen shows (Tk thread only).
+        # update_loop publishes new snapshots through pending_state.
+        self.state = PlayerState()
+        self.published = None  # Newest snapshot from update_loop
+        self.pending_state = None  # (snapshot, poll time) not yet shown
+        self.state_lock = threading.Lock()
+        self.poll_progress = ProgressEngine()  # Anchors for the snapshots
         self.album_art_image = None
-        self.current_source = "unknown"  # "mpd" or "spotify"
+        
+        # Persistent MPD connection (shared by poller and controls). In
+        # multi-player mode MultiPlayer stands in for it and for the idle
+        # watcher, routing to the selected player.
+        self.players = MultiPlayer(MPD_PLAYERS, self.player_changed) if MPD_PLAYERS else None
+        self.mpd = self.players or MPDClient()
+        self.mpd_art = MPDClient()  # Album art transfers (art worker threads)
+        
+        # Set to wake update_loop early (MPD event, user action)
+        self.wake_event = threading.Event()
+        self.mpd_events = None
+        
+        # Station switch in progress: (candidate URIs, monotonic tap time)
+        self.pending_station = None
+        self.last_station_latency = None  # Tap-to-audio, milliseconds
+        
+        # Poll rate and idle screen
+        self.scheduler = PollScheduler()
+        self.last_activity = time.monotonic()  # Last playback, touch or change
+        self.screen_idle = False
+        self.swipe_origin = None  # Tk: where the current touch started
+        self.backlight = Backlight()
+        self.idle_cover = None  # Tk: black frame over the idle screen
+        
+        # Transport and volume taps are sent to MPD off the Tk thread
+        self.commands = MPDCommandQueue(self.mpd, on_done=self.request_update)
+        
+        # Album art backgrounds (memory + disk)
+        self.art_cache = AlbumArtCache()
+        
+        self.art_loader = AlbumArtLoader(
+            self.art_cache, lambda: self.root.after(0, self.apply_album_art),
+            make_image=self.make_image)
+        
+        # Shown state for push API clients (server starts after the first frame)
+        self.push_feed = PushFeed() if PUSH_PORT else None
+        
+        # spotmeta.txt watcher (pushes Spotify track changes)
+        self.spotmeta = SpotmetaWatcher(SPOTMETA_FILE, on_change=self.request_update)
+        STARTUP.add("state, MPD, art cache", setup_start, time.perf_counter())
         
         # Create UI
-        self.create_widgets()
+        with STARTUP.phase("create widgets"):
+            self.create_widgets()
         
-        # Initialize radio browser (after UI created)
-        self.radio_browser = RadioBrowser(self.root, self, SCREEN_WIDTH, SCREEN_HEIGHT)
+        # Radio browser, metrics endpoint and station DB are set up after
+        # the first frame (see startup_complete)
+        self.radio_browser = None
+        self.metrics_server = None
+        self.push_server = None
+        self.first_frame_pending = True
         
         # Start update thread
-        self.running = True
-        self.update_thread = threading.Thread(target=self.update_loop, daemon=True)
-        self.update_thread.start()
+        with STARTUP.phase("start threads"):
+            self.running = True
+            self.spotmeta.start()
+            self.commands.start()
+            if self.players:
+                self.players.start()
+                self.mpd_events = self.players
+            elif USE_MPD_IDLE:
+                self.mpd_events = MPDIdleWatcher(lambda changed: self.request_update())
+                self.mpd_events.start()
+            self.update_thread = threading.Thread(target=self.update_loop, daemon=True)
+            self.update_thread.start()
         
-        log_debug("Display initialized")
+        # Metrics (endpoint starts after the first frame), Tk event-loop lag probe
+        if METRICS_PORT:
+            self.register_metrics()
+        self.tk_lag = 0.0
+        self.lag_probe_due = time.monotonic() + TK_LAG_PROBE_INTERVAL / 1000
+        self.root.after(TK_LAG_PROBE_INTERVAL, self.probe_tk_lag)
+        
+        log_info("Display initialized")
+    
+    def setup_window(self):
+        """Fullscreen Tk window"""
+        self.root.title("Moode Audio")
+        self.root.geometry(f"{SCREEN_WIDTH}x{SCREEN_HEIGHT}")
+        self.root.configure(bg=BG_COLOR, cursor="none")
+        
+        # Fullscreen
+        self.root.attributes("-fullscreen", True)
+        self.root.bind("<Escape>", lambda e: self.root.destroy())
+        
+        # Any tap counts as activity (and wakes an idle screen); sideways
+        # swipes switch players (multi-player mode). One press binding:
+        # Tk only runs the most specific binding of a tag, so a separate
+        # <ButtonPress-1> would hide <ButtonPress> for the first button.
+        self.root.bind_all("<ButtonPress>", self.touch_start, add="+")
+        self.root.bind_all("<ButtonRelease-1>", self.swipe_end, add="+")
+    
+    @staticmethod
+    def make_image(background):
+        """Turn a processed background into what update_display shows"""
+        return ImageTk.PhotoImage(background)
+    
+    def create_radio_browser(self):
+        return RadioBrowser(self.root, self, SCREEN_WIDTH, SCREEN_HEIGHT)
     
     def create_widgets(self):
         """Create all UI elements"""
@@ -339,6 +3660,12 @@ class MoodeDisplay:
                             bg=BG_COLOR, highlightthickness=0)
         self.canvas.pack(fill=tk.BOTH, expand=True)
         
+        # Background image item, reused for every track (empty = black)
+        self.bg_item = self.canvas.create_image(0, 0, anchor=tk.NW)
+        self.renderer = DiffRenderer()
+        self.progress = ProgressEngine()
+        self.progress_after_id = None
+        
         # Track info labels (no frame - place directly on canvas)
         # Title label
         self.title_label = tk.Label(self.root, text="No Track Playing",
@@ -364,6 +3691,16 @@ class MoodeDisplay:
         self.status_canvas.place(x=20, y=20)
         self.status_dot = self.status_canvas.create_oval(5, 5, 15, 15, fill="#666666")
         
+        # Player name (multi-player mode): tap or swipe to switch
+        self.btn_player = None
+        if self.players:
+            self.btn_player = tk.Button(self.root, text="", font=("Arial", 12),
+                                        bg="#222222", fg="#CCCCCC",
+                                        activebackground="#444444",
+                                        relief=tk.FLAT, bd=0,
+                                        command=lambda: self.switch_player(1))
+            self.btn_player.place(x=SCREEN_WIDTH - 20, y=20, anchor="ne")
+        
         # Progress bar frame (bottom third)
         progress_y = SCREEN_HEIGHT - 150
         
@@ -467,476 +3804,1109 @@ class MoodeDisplay:
                                  width=2, height=1,
                                  command=self.toggle_mute)
         self.btn_mute.place(x=vol_x + 140, y=vol_y, anchor="center")
+        
+        # Volume cluster placement, used to show/hide it by source
+        self.volume_widgets = [
+            (self.btn_vol_down, vol_x - 60),
+            (self.volume_label, vol_x + 10),
+            (self.btn_vol_up, vol_x + 80),
+            (self.btn_mute, vol_x + 140),
+        ]
+        self.volume_y = vol_y
+    
+    def poll_mpd(self):
+        """Fetch MPD status + current song in one round trip (None if unreachable)"""
+        try:
+            with METRICS.timer("mpd_status"):
+                return self.mpd.status_snapshot()
+        except Exception as e:
+            log_warning(f"MPD status error: {e}")
+            return None
     
-    def get_mpd_status(self):
-        """Get current MPD status and track info"""
+    def get_mpd_status(self, mpd_status):
+        """Track fields from a poll_mpd() snapshot, None if MPD isn't playing"""
         try:
-            # Get playback state
-            result = subprocess.run(['mpc', 'status'], capture_output=True, text=True)
-            status_output = result.stdout
+            if mpd_status is None:
+                return None
             
             # Check if anything is playing
-            if '[playing]' in status_output:
-                self.is_playing = True
-                self.current_source = "mpd"
-            elif '[paused]' in status_output:
-                self.is_playing = False
-                self.current_source = "mpd"
-            else:
+            if not mpd_status.is_active:
                 # Nothing playing in MPD
                 log_debug("MPD not playing or paused")
-                return False
+                return None
             
-            # Get track info - first try formatted, then fall back to plain
-            result = subprocess.run(['mpc', 'current', '-f', '%artist%|||%title%|||%album%|||%time%'],
-                                  capture_output=True, text=True)
+            # Track tags (local files have artist/title/album/duration)
+            track = {'source': "mpd", 'playing': mpd_status.is_playing,
+                     'artist': mpd_status.artist, 'title': mpd_status.title,
+                     'album': mpd_status.album, 'duration': int(mpd_status.duration)}
             
-            track_data_found = False
-            
-            if result.stdout.strip():
-                parts = result.stdout.strip().split('|||')
-                log_debug(f"MPD formatted output: {len(parts)} parts")
+            # No tags at all - fall back to what mpc current would print
+            if not track['artist'] and not track['title']:
+                stream_info = mpd_status.name or mpd_status.file
+                if not stream_info:
+                    log_debug("MPD: No track data found")
+                    return None
                 
-                # Try to parse formatted output (local files)
-                if len(parts) >= 2:  # At least artist and title
-                    self.current_artist = parts[0] if parts[0] else ""
-                    self.current_track = parts[1] if parts[1] else ""
-                    self.current_album = parts[2] if len(parts) > 2 and parts[2] else ""
-                    
-                    # Parse duration if available
-                    if len(parts) > 3 and parts[3] and ':' in parts[3]:
-                        time_str = parts[3]
-                        try:
-                            m, s = time_str.split(':', 1)
-                            self.current_duration = int(m) * 60 + int(s)
-                        except:
-                            self.current_duration = 0
-                    else:
-                        self.current_duration = 0
-                    
-                    track_data_found = True
-            
-            # If formatted output failed or returned nothing useful, try plain current
-            if not track_data_found or (not self.current_artist and not self.current_track):
-                log_debug("Trying plain mpc current for radio stream")
-                result = subprocess.run(['mpc', 'current'], capture_output=True, text=True)
+                # Check if it looks like "Artist - Title" format
+                if ' - ' in stream_info:
+                    parts = stream_info.split(' - ', 1)
+                    track['artist'] = parts[0].strip()
+                    track['title'] = parts[1].strip()
+                else:
+                    # Just use the whole thing as the title (station name)
+                    track['title'] = stream_info
                 
-                if result.stdout.strip():
-                    # For radio: entire line is usually the station name or current song
-                    stream_info = result.stdout.strip()
-                    log_debug(f"MPD plain output: {stream_info}")
-                    
-                    # Check if it looks like "Artist - Title" format
-                    if ' - ' in stream_info:
-                        parts = stream_info.split(' - ', 1)
-                        self.current_artist = parts[0].strip()
-                        self.current_track = parts[1].strip()
-                    else:
-                        # Just use the whole thing as the title (station name)
-                        self.current_artist = ""
-                        self.current_track = stream_info
-                    
-                    self.current_album = ""
-                    self.current_duration = 0
-                    track_data_found = True
-                    log_debug(f"Radio: artist='{self.current_artist}', track='{self.current_track}'")
-            
-            if not track_data_found:
-                log_debug("MPD: No track data found")
-                return False
-            
-            # Get elapsed time from status (if available - won't be for streams)
-            time_match = re.search(r'(\d+):(\d+)/(\d+):(\d+)', status_output)
-            if time_match:
-                elapsed_min = int(time_match.group(1))
-                elapsed_sec = int(time_match.group(2))
-                self.elapsed_time = elapsed_min * 60 + elapsed_sec
-                log_debug(f"MPD: elapsed {elapsed_min}:{elapsed_sec}")
-            else:
-                self.elapsed_time = 0
+                track['album'] = ""
+                track['duration'] = 0
+                log_debug("Radio: artist='%s', track='%s'", track['artist'], track['title'])
             
-            log_debug(f"MPD active: {self.current_track}")
-            return True
+            log_debug("MPD active: %s", track['title'])
+            return track
             
         except Exception as e:
-            log_debug(f"MPD status error: {e}")
-            return False
+            log_warning(f"MPD status error: {e}")
+            return None
     
     def get_spotify_status(self):
-        """Get current Spotify Connect status from spotmeta.txt"""
+        """Track fields from spotmeta.txt (cached), None if Spotify is inactive"""
         try:
-            if not os.path.exists(SPOTMETA_FILE):
-                return False
-            
-            with open(SPOTMETA_FILE, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
-            
-            # Check if content is empty, null, or whitespace
-            if not content or content == "null" or content == "" or len(content) < 10:
-                log_debug("Spotify metadata empty or null")
-                return False
-            
-            # Parse Spotify metadata
-            # Format: Title~~~Artist~~~Album~~~Duration(ms)~~~ImageURLs~~~Format
-            parts = content.split('~~~')
-            
-            if len(parts) < 4:
-                log_debug(f"Spotify metadata incomplete ({len(parts)} parts)")
-                return False
-            
-            # Verify we have actual data (not empty fields)
-            if not parts[0] or not parts[1]:  # No title or artist
-                log_debug("Spotify metadata missing title or artist")
-                return False
+            track = self.spotmeta.get()
+            if track is None:
+                return None
             
             # NOTE: We do NOT check file age anymore!
             # Moode only updates spotmeta.txt when track changes, not continuously.
             # As long as the file has valid Spotify data, we assume Spotify is active.
             # When Spotify disconnects, Moode will write "null" to the file.
             
-            self.current_track = parts[0] if parts[0] else "Unknown Track"
-            
-            # Artists (may be newline-separated)
-            artists = parts[1].split('\n') if parts[1] else []
-            self.current_artist = artists[0] if artists else "Unknown Artist"
-            
-            self.current_album = parts[2] if parts[2] else ""
-            
-            # Duration (in milliseconds)
-            try:
-                self.current_duration = int(parts[3]) // 1000 if parts[3] else 0
-            except:
-                self.current_duration = 0
-            
-            # Image URLs (newline-separated, first is largest)
-            if len(parts) > 4 and parts[4]:
-                image_urls = parts[4].split('\n')
-                self.album_art_url = image_urls[0] if image_urls else None
-            else:
-                self.album_art_url = None
-            
             # Spotify is playing if we have valid metadata
-            self.is_playing = True
-            self.current_source = "spotify"
-            
-            log_debug(f"Spotify active: {self.current_track}")
-            
             # Note: Spotify doesn't provide elapsed time in spotmeta.txt
-            # Progress bar won't move for Spotify tracks
-            
-            return True
+            # Progress is estimated from when the file changed (ProgressEngine)
+            return {'source': "spotify", 'playing': True, 'title': track.title,
+                    'artist': track.artist, 'album': track.album,
+                    'duration': track.duration, 'art_url': track.art_url}
             
         except Exception as e:
-            log_debug(f"Spotify status error: {e}")
+            log_warning(f"Spotify status error: {e}")
+            return None
+    
+    def get_volume(self, mpd_status, previous):
+        """(volume, muted) from a poll_mpd() snapshot and the previous state"""
+        if mpd_status is None or mpd_status.volume < 0:
+            # MPD unreachable or no mixer
+            return previous.volume, previous.muted
+        
+        volume = mpd_status.volume
+        
+        # Check if muted (volume = 0 but was previously > 0)
+        if volume == 0 and previous.volume > 0:
+            return previous.volume, True
+        elif volume > 0:
+            return volume, False
+        return previous.volume, previous.muted
+    
+    def keep_optimistic(self, state, polled_at):
+        """Keep values of taps MPD hasn't caught up with (shown until settled)"""
+        shown = self.state
+        if shown.player != state.player:
+            return state  # Taps were for the previously shown player
+        if state.source == "mpd" and not self.commands.settled('play', polled_at):
+            state = state.replace(playing=shown.playing)
+        if not self.commands.settled('volume', polled_at):
+            state = state.replace(volume=shown.volume, muted=shown.muted)
+        return state
+    
+    def publish_state(self, state, polled_at):
+        """update_loop: hand a changed snapshot to the Tk thread
+        
+        Returns False if it matches both the last published snapshot and
+        the screen. Only one apply_state callback is queued at a time; a
+        newer snapshot replaces the pending one.
+        """
+        if state == self.published and state == self.state:
             return False
+        self.published = state
+        with self.state_lock:
+            schedule = self.pending_state is None
+            self.pending_state = (state, polled_at)
+        if schedule:
+            self.root.after(0, self.apply_state)
+        return True
     
-    def get_volume(self):
-        """Get current volume from mpc"""
-        try:
-            result = subprocess.run(['mpc', 'volume'], capture_output=True, text=True)
-            # Output format: "volume: 75%"
-            match = re.search(r'volume:\s*(\d+)%', result.stdout)
-            if match:
-                volume = int(match.group(1))
-                
-                # Check if muted (volume = 0 but was previously > 0)
-                if volume == 0 and self.current_volume > 0:
-                    self.is_muted = True
-                elif volume > 0:
-                    self.is_muted = False
-                    self.current_volume = volume
-                
-                return volume
-            return self.current_volume
-        except Exception as e:
-            log_debug(f"Volume get error: {e}")
-            return self.current_volume
+    def apply_state(self):
+        """Tk thread: show the newest published snapshot"""
+        with self.state_lock:
+            pending, self.pending_state = self.pending_state, None
+        if pending is None:
+            return
+        state, polled_at = pending
+        # A tap after the poll wins over the snapshot
+        self.state = self.keep_optimistic(state, polled_at)
+        self.progress.follow(self.state.progress)
+        self.update_display()
+        self.push_state()
+    
+    def set_state(self, **changes):
+        """Tk thread: show a tap's result before MPD confirms it"""
+        self.state = self.state.replace(**changes)
+        self.update_display()
+        self.push_state()
+    
+    def push_state(self):
+        """Tk thread: hand the shown state and art to push API clients"""
+        if self.push_feed:
+            self.push_feed.publish(self.state, self.art_loader.shown)
     
     def set_volume(self, volume):
-        """Set volume via mpc"""
-        try:
-            volume = max(0, min(100, volume))  # Clamp to 0-100
-            subprocess.run(['mpc', 'volume', str(volume)], capture_output=True)
-            self.current_volume = volume
-            if volume > 0:
-                self.is_muted = False
-        except Exception as e:
-            log_debug(f"Volume set error: {e}")
+        """Set volume (shown immediately, sent to MPD in the background)"""
+        volume = max(0, min(100, volume))  # Clamp to 0-100
+        self.commands.set_volume(volume)
+        self.set_state(volume=volume, muted=self.state.muted and volume == 0)
     
     def volume_up(self):
         """Increase volume by 5%"""
-        if self.is_muted:
+        if self.state.muted:
             self.toggle_mute()  # Unmute first
         else:
-            new_vol = min(100, self.current_volume + 5)
+            new_vol = min(100, self.state.volume + 5)
             self.set_volume(new_vol)
     
     def volume_down(self):
         """Decrease volume by 5%"""
-        if self.is_muted:
+        if self.state.muted:
             self.toggle_mute()  # Unmute first
         else:
-            new_vol = max(0, self.current_volume - 5)
+            new_vol = max(0, self.state.volume - 5)
             self.set_volume(new_vol)
     
     def toggle_mute(self):
         """Toggle mute/unmute"""
-        try:
-            if self.is_muted:
-                # Unmute - restore previous volume
-                subprocess.run(['mpc', 'volume', str(self.current_volume)],
-                             capture_output=True)
-                self.is_muted = False
-                log_debug(f"Unmuted to {self.current_volume}%")
-            else:
-                # Mute - set to 0
-                subprocess.run(['mpc', 'volume', '0'], capture_output=True)
-                self.is_muted = True
-                log_debug("Muted")
-        except Exception as e:
-            log_debug(f"Mute toggle error: {e}")
+        if self.state.muted:
+            # Unmute - restore previous volume
+            self.commands.set_volume(self.state.volume)
+            log_debug("Unmuted to %s%%", self.state.volume)
+        else:
+            # Mute - set to 0
+            self.commands.set_volume(0)
+            log_debug("Muted")
+        self.set_state(muted=not self.state.muted)
     
     def toggle_play(self):
         """Toggle play/pause"""
-        try:
-            subprocess.run(['mpc', 'toggle'], capture_output=True)
-            log_debug("Toggled play/pause")
-        except Exception as e:
-            log_debug(f"Play toggle error: {e}")
+        playing = not self.state.playing
+        self.commands.set_playing(playing)
+        log_debug("Toggled play/pause")
+        self.set_state(playing=playing)
     
     def next_track(self):
         """Skip to next track"""
-        try:
-            subprocess.run(['mpc', 'next'], capture_output=True)
-            log_debug("Next track")
-        except Exception as e:
-            log_debug(f"Next track error: {e}")
+        self.commands.skip(1)
+        log_debug("Next track")
     
     def prev_track(self):
         """Go to previous track"""
-        try:
-            subprocess.run(['mpc', 'prev'], capture_output=True)
-            log_debug("Previous track")
-        except Exception as e:
-            log_debug(f"Previous track error: {e}")
+        self.commands.skip(-1)
+        log_debug("Previous track")
+    
+    def play_url(self, url):
+        """Replace the queue with url and play it (returns immediately)
+        
+        The MPD commands go out as one command list from a worker thread.
+        update_loop then times how long it takes until MPD is decoding
+        the new stream.
+        """
+        candidates = [url]
+        if 'RADIO/' in url:
+            # Older station entries may need the URL without the prefix
+            candidates.append(url.replace('RADIO/', ''))
+        self.pending_station = (candidates, time.monotonic())
+        threading.Thread(target=self._play_url_worker, args=(candidates,),
+                         daemon=True).start()
+    
+    def _play_url_worker(self, candidates):
+        for uri in candidates:
+            try:
+                self.mpd.command_list([('clear',), ('add', uri), ('play',)])
+                log_debug("Playing %s", uri)
+                self.request_update()
+                return
+            except MPDError as e:
+                log_warning(f"MPD add failed for {uri}: {e}")
+            except Exception as e:
+                log_error(f"Error playing station: {e}")
+                break
+        self.pending_station = None
+    
+    def check_station_started(self, mpd_status):
+        """Log tap-to-audio latency once MPD decodes the new station"""
+        candidates, tapped_at = self.pending_station
+        waited = time.monotonic() - tapped_at
+        if (mpd_status and mpd_status.is_playing and mpd_status.file in candidates
+                and 'audio' in mpd_status.status):
+            self.last_station_latency = waited * 1000
+            self.pending_station = None
+            METRICS.observe("station_start", self.last_station_latency)
+            log_info(f"Station started in {self.last_station_latency:.0f} ms (tap to audio)")
+        elif waited > STATION_START_TIMEOUT:
+            self.pending_station = None
+            log_warning(f"Station did not start within {STATION_START_TIMEOUT} s")
     
     def show_radio_browser(self):
         """Show the radio station browser"""
         log_debug("Opening radio browser")
+        if self.radio_browser is None:
+            self.radio_browser = self.create_radio_browser()
         self.radio_browser.show()
     
-    def load_album_art(self):
-        """Load and process album art"""
+    def apply_album_art(self):
+        """Tk thread: show the background delivered by the art loader"""
+        changed, photo = self.art_loader.drain()
+        if changed:
+            self.album_art_image = photo
+            self.update_display()
+            self.push_state()
+    
+    def art_source_for_song(self, song):
+        """(source, fetch) for an MPD song's art, or None
+        
+        Art comes from MPD (albumart/readpicture) and is keyed by the
+        song's directory, so a whole album shares one download and one
+        processed background. Streams have no art.
+        """
+        uri = song.get('file', '')
+        if not uri or '://' in uri:
+            return None
+        directory = os.path.dirname(uri) or uri
+        if self.players:
+            # Same paths on two hosts need not be the same album
+            client = self.players.art_client()
+            return (f"mpd:{self.players.current.name}:{directory}",
+                    lambda: client.read_art(uri))
+        return ("mpd:" + directory, lambda: self.mpd_art.read_art(uri))
+    
+    def prefetch_next_art(self, next_song_id):
+        """Warm the art cache for the next song in the MPD queue"""
         try:
-            if not self.album_art_url:
-                # No URL, clear album art
-                self.album_art_image = None
-                return
-            
-            log_debug(f"Loading album art: {self.album_art_url}")
-            
-            # Download image
-            with request.urlopen(self.album_art_url, timeout=5) as response:
-                image_data = response.read()
-            
-            # Open image
-            img = Image.open(BytesIO(image_data))
-            log_debug(f"Image loaded: {img.size} - {img.mode}")
-            
-            # Convert to RGB if needed
-            if img.mode != 'RGB':
-                img = img.convert('RGB')
-            
-            # Resize to fill screen (maintain aspect ratio)
-            img_ratio = img.width / img.height
-            screen_ratio = SCREEN_WIDTH / SCREEN_HEIGHT
-            
-            if img_ratio > screen_ratio:
-                # Image is wider than screen
-                new_height = SCREEN_HEIGHT
-                new_width = int(new_height * img_ratio)
-            else:
-                # Image is taller than screen
-                new_width = SCREEN_WIDTH
-                new_height = int(new_width / img_ratio)
-            
-            img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            log_debug(f"Resized to: {img.size}")
-            
-            # Crop to screen size (center)
-            left = (new_width - SCREEN_WIDTH) // 2
-            top = (new_height - SCREEN_HEIGHT) // 2
-            img = img.crop((left, top, left + SCREEN_WIDTH, top + SCREEN_HEIGHT))
-            log_debug(f"Cropped to: {img.size}")
-            
-            # Apply blur (subtle background effect)
-            img = img.filter(ImageFilter.GaussianBlur(radius=10))
-            log_debug("Blur applied")
-            
-            # Darken (create overlay effect)
-            enhancer = ImageEnhance.Brightness(img)
-            img = enhancer.enhance(0.4)  # 40% brightness
-            log_debug("Darkened")
-            
-            # Convert to PhotoImage
-            self.album_art_image = ImageTk.PhotoImage(img)
-            log_debug("Album art ready")
-            
+            song = dict(self.mpd.command('playlistid', next_song_id))
+            source = self.art_source_for_song(song)
+            if source:
+                self.art_loader.prefetch(*source)
         except Exception as e:
-            log_debug(f"Album art load error: {e}")
-            self.album_art_image = None
+            log_debug("Art prefetch error: %s", e)
     
     def update_display(self):
-        """Update UI elements"""
+        """Update UI elements (only those whose values changed)"""
+        if self.screen_idle:
+            return
+        start = time.perf_counter()
+        r = self.renderer
+        state = self.state
+        r.begin_frame()
         try:
-            # Update album art background
-            if self.album_art_image:
-                self.canvas.delete("all")
-                self.canvas.create_image(0, 0, anchor=tk.NW, image=self.album_art_image)
-            else:
-                self.canvas.delete("all")
-                self.canvas.create_rectangle(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT,
-                                            fill=BG_COLOR, outline="")
+            # Update album art background (same canvas item, new image)
+            r.itemconfig(self.canvas, self.bg_item, image=self.album_art_image or '')
             
             # Update track info
-            if self.current_track:
-                self.title_label.config(text=self.current_track)
-                self.artist_label.config(text=self.current_artist)
-                self.album_label.config(text=self.current_album)
+            if state.title:
+                r.config(self.title_label, text=state.title)
+                r.config(self.artist_label, text=state.artist)
+                r.config(self.album_label, text=state.album)
             else:
-                self.title_label.config(text="No Track Playing")
-                self.artist_label.config(text="")
-                self.album_label.config(text="")
+                r.config(self.title_label, text="No Track Playing")
+                r.config(self.artist_label, text="")
+                r.config(self.album_label, text="")
+            
+            if self.btn_player is not None:
+                r.config(self.btn_player, text=f"{state.player} ›")
             
             # Update status indicator
-            if self.is_playing:
-                self.status_canvas.itemconfig(self.status_dot, fill=ACCENT_COLOR)
+            if state.playing:
+                r.itemconfig(self.status_canvas, self.status_dot, fill=ACCENT_COLOR)
             else:
-                self.status_canvas.itemconfig(self.status_dot, fill="#666666")
+                r.itemconfig(self.status_canvas, self.status_dot, fill="#666666")
             
             # Update play button
-            if self.is_playing:
-                self.btn_play.config(text="⏸")
+            if state.playing:
+                r.config(self.btn_play, text="⏸")
             else:
-                self.btn_play.config(text="▶")
+                r.config(self.btn_play, text="▶")
             
             # Update progress bar
-            if self.current_duration > 0:
-                progress = self.elapsed_time / self.current_duration
-                bar_width = (SCREEN_WIDTH - 160) * progress
-                self.progress_canvas.coords(self.progress_bar, 0, 0, bar_width, 8)
-                
-                # Update time labels
-                elapsed_str = f"{self.elapsed_time // 60}:{self.elapsed_time % 60:02d}"
-                duration_str = f"{self.current_duration // 60}:{self.current_duration % 60:02d}"
-                self.elapsed_label.config(text=elapsed_str)
-                self.duration_label.config(text=duration_str)
-            else:
-                self.progress_canvas.coords(self.progress_bar, 0, 0, 0, 8)
-                self.elapsed_label.config(text="0:00")
-                self.duration_label.config(text="0:00")
+            self.draw_progress()
             
             # Update volume display
-            if self.current_source == "spotify":
-                # Hide volume controls during Spotify (Spotify has its own volume)
-                self.volume_label.place_forget()
-                self.btn_vol_down.place_forget()
-                self.btn_vol_up.place_forget()
-                self.btn_mute.place_forget()
-            else:
-                # Show volume controls for MPD/radio
-                vol_x = SCREEN_WIDTH - 180
-                vol_y = SCREEN_HEIGHT - 50
-                
-                self.btn_vol_down.place(x=vol_x - 60, y=vol_y, anchor="center")
-                self.volume_label.place(x=vol_x + 10, y=vol_y, anchor="center")
-                self.btn_vol_up.place(x=vol_x + 80, y=vol_y, anchor="center")
-                self.btn_mute.place(x=vol_x + 140, y=vol_y, anchor="center")
-                
+            # Hide volume controls during Spotify (Spotify has its own volume)
+            show_volume = state.source != "spotify"
+            for widget, x in self.volume_widgets:
+                r.place(widget, show_volume, x=x, y=self.volume_y, anchor="center")
+            
+            if show_volume:
                 # Update volume text
-                if self.is_muted:
-                    self.volume_label.config(text="Vol: 🔇")
-                    self.btn_mute.config(text="🔇")
+                if state.muted:
+                    r.config(self.volume_label, text="Vol: 🔇")
+                    r.config(self.btn_mute, text="🔇")
                 else:
-                    self.volume_label.config(text=f"Vol: {self.current_volume}")
-                    self.btn_mute.config(text="🔊")
+                    r.config(self.volume_label, text=f"Vol: {state.volume}")
+                    r.config(self.btn_mute, text="🔊")
+            
+        except Exception as e:
+            log_error(f"Display update error: {e}")
+        finally:
+            r.end_frame()
+        
+        self.schedule_progress()
+        METRICS.observe("update_display", (time.perf_counter() - start) * 1000)
+        self.frame_drawn()
+    
+    def draw_progress(self):
+        """Draw progress bar and time labels from the interpolated position"""
+        r = self.renderer
+        duration = int(self.progress.duration)
+        if duration > 0:
+            elapsed = self.progress.position()
+            bar_width = round((SCREEN_WIDTH - 160) * elapsed / duration)
+            r.coords(self.progress_canvas, self.progress_bar, 0, 0, bar_width, 8)
             
+            # Update time labels
+            elapsed = int(elapsed)
+            elapsed_str = f"{elapsed // 60}:{elapsed % 60:02d}"
+            duration_str = f"{duration // 60}:{duration % 60:02d}"
+            r.config(self.elapsed_label, text=elapsed_str)
+            r.config(self.duration_label, text=duration_str)
+        else:
+            r.coords(self.progress_canvas, self.progress_bar, 0, 0, 0, 8)
+            r.config(self.elapsed_label, text="0:00")
+            r.config(self.duration_label, text="0:00")
+    
+    def schedule_progress(self):
+        """Keep the progress animation running while playback is moving"""
+        if self.progress_after_id is None and self.progress.moving and not self.screen_idle:
+            self.progress_after_id = self.root.after(
+                int(1000 / PROGRESS_FPS), self.animate_progress)
+    
+    def animate_progress(self):
+        """Tk timer: advance the progress bar (no I/O)"""
+        self.progress_after_id = None
+        self.renderer.begin_frame()
+        try:
+            self.draw_progress()
         except Exception as e:
-            log_debug(f"Display update error: {e}")
+            log_error(f"Progress update error: {e}")
+        finally:
+            self.renderer.end_frame()
+        self.schedule_progress()
+    
+    def register_metrics(self):
+        cache = self.art_cache
+        for name in ("memory_hits", "disk_hits", "original_hits", "misses"):
+            METRICS.gauge(f"art_cache_{name}_total", lambda n=name: getattr(cache, n),
+                          f"Album art cache {name.replace('_', ' ')}")
+        METRICS.gauge("art_cache_disk_bytes", lambda: cache.disk_bytes,
+                      "Album art cache size on disk")
+        METRICS.gauge("tk_lag_seconds", lambda: round(self.tk_lag, 4),
+                      "How late the last Tk timer probe ran")
+        if self.push_feed:
+            METRICS.gauge("push_clients", lambda: self.push_feed.clients,
+                          "Connected push API event streams")
+        METRICS.gauge("station_start_seconds",
+                      lambda: (self.last_station_latency or 0) / 1000,
+                      "Last tap-to-audio time for a station")
+    
+    def probe_tk_lag(self):
+        """Tk thread: measure how late a timer fires (event-loop lag)"""
+        now = time.monotonic()
+        self.tk_lag = max(0.0, now - self.lag_probe_due)
+        METRICS.observe("tk_lag", self.tk_lag * 1000)
+        if self.running and not self.screen_idle:
+            self.lag_probe_due = now + TK_LAG_PROBE_INTERVAL / 1000
+            self.root.after(TK_LAG_PROBE_INTERVAL, self.probe_tk_lag)
+    
+    def frame_drawn(self):
+        """Called at the end of update_display; the first time starts warm-up"""
+        if self.first_frame_pending:
+            self.first_frame_pending = False
+            # Idle callbacks run after Tk has painted the frame
+            self.root.after_idle(self.startup_complete)
+    
+    def startup_complete(self):
+        """First now-playing frame is on screen: load what startup skipped"""
+        STARTUP.mark("first frame")
+        log_info(f"First frame after {STARTUP.ms(STARTUP.first_frame_at):.0f} ms")
+        self.root.after_idle(self.warm_up, [
+            ("metrics endpoint", self.start_metrics_server),
+            ("push API", self.start_push_server),
+            ("radio browser", self.preload_radio_browser),
+        ])
+    
+    def warm_up(self, steps):
+        """One deferred startup step per idle callback, so taps stay responsive"""
+        name, step = steps.pop(0)
+        with STARTUP.phase(f"warm-up: {name}"):
+            try:
+                step()
+            except Exception as e:
+                log_error(f"Warm-up of {name} failed: {e}")
+        if steps and self.running:
+            self.root.after_idle(self.warm_up, steps)
+        else:
+            STARTUP.finish()
+    
+    def start_metrics_server(self):
+        if METRICS_PORT:
+            self.metrics_server = MetricsServer()
+            self.metrics_server.start()
+    
+    def start_push_server(self):
+        if self.push_feed:
+            self.push_server = PushServer(self.push_feed, self.art_cache)
+            self.push_server.start()
+    
+    def preload_radio_browser(self):
+        """Build the browser and query its first page before the first tap"""
+        if self.radio_browser is None:
+            self.radio_browser = self.create_radio_browser()
+        if self.radio_browser is not None:
+            self.radio_browser.preload()
+    
+    def request_update(self):
+        """Wake update_loop now instead of waiting for the next timed poll"""
+        self.wake_event.set()
+    
+    def player_changed(self, monitor):
+        """MultiPlayer event loop: a player's status changed"""
+        if monitor is self.players.current:
+            self.request_update()
+    
+    def touch_start(self, event):
+        """Tk: any press; remember where a swipe may start
+        
+        The press that wakes the idle screen (caught by idle_cover) is not
+        a swipe start, so moving sideways while waking switches nothing.
+        """
+        cover = self.idle_cover
+        waking = self.screen_idle or (cover is not None and event.widget is cover)
+        self.note_activity()
+        if event.num == 1 and not waking:
+            self.swipe_origin = (event.x_root, event.y_root)
+        else:
+            self.swipe_origin = None
+    
+    def swipe_end(self, event):
+        """Tk: a touch that moved SWIPE_DISTANCE sideways switches players"""
+        origin, self.swipe_origin = self.swipe_origin, None
+        if origin is None:
+            return
+        dx, dy = event.x_root - origin[0], event.y_root - origin[1]
+        browser = self.radio_browser
+        if browser is not None and browser.frame is not None and browser.frame.winfo_ismapped():
+            return  # Swipes in the radio browser are not for us
+        if abs(dx) >= SWIPE_DISTANCE and abs(dx) > abs(dy):
+            self.switch_player(1 if dx < 0 else -1)
+    
+    def switch_player(self, offset):
+        """Show and control the next/previous player (multi-player mode)
+        
+        Every player's status is kept current, so update_loop only has
+        to read the cached one - nothing is fetched.
+        """
+        if not self.players or len(self.players.monitors) < 2:
+            return
+        monitor = self.players.select(self.players.selected + offset)
+        self.commands.discard()  # Taps not sent yet were meant for the old player
+        log_info(f"Switched to player {monitor.name}")
+        self.request_update()
+    
+    def next_poll_delay(self):
+        """Seconds until the next timed poll (see PollScheduler)
+        
+        With MPD events and inotify, changes wake update_loop right away,
+        the progress bar is interpolated locally and the timed poll is
+        only a slow fallback.
+        """
+        if self.pending_station:
+            # MPD sends no event when the stream's audio starts
+            return STATION_START_POLL / 1000.0
+        event_driven = (self.mpd_events is not None and self.mpd_events.connected
+                        and self.spotmeta.event_driven)
+        state = self.published or self.state
+        delay = self.scheduler.delay(state.playing, state.source != "unknown", event_driven)
+        if SCREEN_IDLE_TIMEOUT and not self.screen_idle:
+            # Wake up in time to blank the screen
+            until_idle = self.last_activity + SCREEN_IDLE_TIMEOUT - time.monotonic()
+            delay = min(delay, max(until_idle, 0.05))
+        return delay
+    
+    def note_activity(self):
+        """A tap or playback change: poll fast for a while, wake the screen"""
+        self.last_activity = time.monotonic()
+        self.scheduler.activity()
+        if self.screen_idle:
+            self.root.after(0, self.wake_screen)
+    
+    def check_idle(self):
+        """Blank/dim the screen after SCREEN_IDLE_TIMEOUT without activity"""
+        now = time.monotonic()
+        if (self.published or self.state).playing:
+            self.last_activity = now
+        elif (SCREEN_IDLE_TIMEOUT and not self.screen_idle
+                and now - self.last_activity >= SCREEN_IDLE_TIMEOUT):
+            self.root.after(0, self.sleep_screen)
+    
+    def sleep_screen(self):
+        """Tk thread: enter the idle screen mode and stop redrawing"""
+        if self.screen_idle or time.monotonic() - self.last_activity < SCREEN_IDLE_TIMEOUT:
+            return
+        self.screen_idle = True
+        if self.progress_after_id is not None:
+            self.root.after_cancel(self.progress_after_id)
+            self.progress_after_id = None
+        self.enter_idle_screen(SCREEN_IDLE_MODE)
+        log_info(f"Screen idle ({SCREEN_IDLE_MODE})")
+    
+    def wake_screen(self):
+        """Tk thread: leave the idle screen mode and redraw"""
+        if not self.screen_idle:
+            return
+        self.screen_idle = False
+        self.leave_idle_screen()
+        self.lag_probe_due = time.monotonic() + TK_LAG_PROBE_INTERVAL / 1000
+        self.root.after(TK_LAG_PROBE_INTERVAL, self.probe_tk_lag)
+        self.update_display()
+        log_info("Screen woken")
+    
+    def enter_idle_screen(self, mode):
+        """Backlight off/dimmed; a cover catches the waking tap
+        
+        Tk can't dim by itself - without a backlight, dim blanks too. While
+        the backlight dims, the cover is a single pixel holding the input
+        grab: the screen stays visible, but every tap goes to the cover
+        instead of the button underneath.
+        """
+        level = SCREEN_DIM_LEVEL if mode == "dim" else 0
+        dimmed = self.backlight.set_level(level) and mode == "dim"
+        self.idle_cover = tk.Frame(self.root, bg="#000000", cursor="none")
+        if dimmed:
+            self.idle_cover.place(x=0, y=0, width=1, height=1)
+        else:
+            self.idle_cover.place(x=0, y=0, relwidth=1, relheight=1)
+        self.idle_cover.lift()
+        try:
+            self.idle_cover.update_idletasks()  # A grab needs a mapped window
+            self.idle_cover.grab_set()
+        except tk.TclError as e:
+            log_warning(f"Idle screen input grab failed, blanking instead: {e}")
+            self.idle_cover.place_forget()
+            self.idle_cover.place(x=0, y=0, relwidth=1, relheight=1)
+    
+    def leave_idle_screen(self):
+        self.backlight.restore()
+        if self.idle_cover is not None:
+            self.idle_cover.grab_release()
+            self.idle_cover.destroy()
+            self.idle_cover = None
     
     def update_loop(self):
         """Background thread to update status"""
         last_track = ""
+        last_next_song = None
+        first_tick = True
         
         while self.running:
             try:
+                tick_start = time.perf_counter()
+                # Events from here on wake the next wait, so none are lost
+                self.wake_event.clear()
+                
                 # Check Spotify first, then fall back to MPD
                 # BUT: If MPD is actively playing, prefer MPD over stale Spotify data
-                spotify_active = self.get_spotify_status()
-                mpd_active = False
+                # One MPD round trip per tick, shared by source arbitration,
+                # track info and volume
+                mpd_status = self.poll_mpd()
+                player = self.players.current.name if self.players else ""
+                # spotmeta.txt describes the local player (the first one)
+                spotify = None
+                if not (self.players and self.players.selected):
+                    spotify = self.get_spotify_status()
+                if first_tick:
+                    STARTUP.mark("first status")
+                    first_tick = False
                 
-                if spotify_active:
-                    # Spotify metadata exists, but check if MPD is ALSO playing
+                if spotify and mpd_status and mpd_status.is_playing:
+                    # Spotify metadata exists, but MPD is ALSO playing
                     # If MPD is playing, it means user switched away from Spotify
                     # and Moode hasn't cleared the old Spotify metadata yet
-                    mpd_check = subprocess.run(['mpc', 'status'], capture_output=True, text=True)
-                    if '[playing]' in mpd_check.stdout:
-                        # MPD is playing - prefer MPD over stale Spotify data
-                        log_debug("Both Spotify metadata and MPD active - preferring MPD")
-                        spotify_active = False
-                        mpd_active = True
+                    log_debug("Both Spotify metadata and MPD active - preferring MPD")
+                    spotify = None
                 
-                if not spotify_active:
-                    # No Spotify (or MPD took priority), try MPD
-                    if not mpd_active:  # Only check if we didn't already check above
-                        mpd_active = self.get_mpd_status()
-                    else:
-                        # We already know MPD is playing, just get the details
-                        mpd_active = self.get_mpd_status()
-                    
-                    if not mpd_active:
-                        # Nothing playing
-                        self.is_playing = False
-                        self.current_track = ""
-                        self.current_artist = ""
-                        self.current_album = ""
-                        self.current_duration = 0
-                        self.elapsed_time = 0
-                        self.album_art_url = None
-                        self.current_source = "unknown"
+                # No Spotify (or MPD took priority): MPD, else nothing playing
+                track = spotify or self.get_mpd_status(mpd_status) or {}
+                previous = self.published or self.state
+                if previous.player != player:
+                    previous = PlayerState(player=player)  # Just switched
+                volume, muted = self.get_volume(mpd_status, previous)
                 
-                # Get volume
-                self.get_volume()
+                # Tap-to-audio timing for a station switch
+                if self.pending_station:
+                    self.check_station_started(mpd_status)
                 
-                # Load album art if track changed
-                current_track_id = f"{self.current_artist}-{self.current_track}"
-                if current_track_id != last_track:
-                    if self.current_source == "spotify" and self.album_art_url:
-                        self.load_album_art()
-                    else:
-                        self.album_art_image = None
-                    last_track = current_track_id
+                # Re-anchor the progress bar on track change, seek or pause
+                source = track.get('source', "unknown")
+                if source == "mpd":
+                    self.poll_progress.sync(mpd_status.elapsed, mpd_status.duration,
+                                            mpd_status.is_playing,
+                                            ('mpd', player, mpd_status.song_id),
+                                            mpd_status.timestamp)
+                elif source == "spotify":
+                    # No elapsed time in spotmeta.txt - count from the file change
+                    started_at = self.spotmeta.track.started_at
+                    self.poll_progress.sync(0.0, track['duration'], True,
+                                            ('spotify', started_at), started_at)
+                else:
+                    self.poll_progress.sync(0.0, 0.0, False, None)
+                
+                # One snapshot per tick, handed over only if something changed
+                polled_at = mpd_status.timestamp if mpd_status else time.monotonic()
+                state = PlayerState(player=player, volume=volume, muted=muted,
+                                    progress=self.poll_progress.anchor, **track)
+                state = self.keep_optimistic(state, polled_at)
                 
-                # Schedule UI update on main thread
-                self.root.after(0, self.update_display)
+                # Track, play/pause or source changes: poll fast, wake the screen
+                if self.scheduler.observe((state.source, state.playing, state.track_id)):
+                    self.note_activity()
+                self.publish_state(state, polled_at)
+                self.check_idle()
                 
-                # Wait before next update
-                time.sleep(UPDATE_INTERVAL / 1000.0)
+                # Load album art if track changed (in the background)
+                if state.track_id != last_track:
+                    art_source = None
+                    if state.source == "spotify" and state.art_url:
+                        url = state.art_url
+                        art_source = (url, lambda: download_art(url))
+                    elif state.source == "mpd":
+                        art_source = self.art_source_for_song(mpd_status.song)
+                    self.art_loader.request(*(art_source or (None, None)))
+                    last_track = state.track_id
+                
+                # Prefetch art for the next queued song
+                next_song_id = mpd_status.next_song_id if mpd_status else None
+                if next_song_id != last_next_song:
+                    last_next_song = next_song_id
+                    if next_song_id is not None:
+                        self.prefetch_next_art(next_song_id)
+                
+                METRICS.observe("update_loop", (time.perf_counter() - tick_start) * 1000)
+                
+                # Wait for next timed poll or an earlier change event
+                self.wake_event.wait(self.next_poll_delay())
                 
             except Exception as e:
-                log_debug(f"Update loop error: {e}")
+                log_error(f"Update loop error: {e}")
                 time.sleep(1)
     
     def cleanup(self):
         """Cleanup before exit"""
         self.running = False
-        log_debug("Display shutting down")
+        self.wake_event.set()
+        if self.mpd_events:
+            self.mpd_events.stop()
+        self.spotmeta.stop()
+        self.commands.stop()
+        if self.metrics_server:
+            self.metrics_server.stop()
+        if self.push_server:
+            self.push_server.stop()
+        self.art_loader.shutdown()
+        self.mpd.close()
+        self.mpd_art.close()
+        log_info("Display shutting down")
+
+def fit_text(draw, text, font, width):
+    """Shorten text with an ellipsis until it fits in width pixels"""
+    if draw.textlength(text, font=font) <= width:
+        return text
+    while text and draw.textlength(text + "…", font=font) > width:
+        text = text[:-1]
+    return text + "…"
+
+class FramebufferDisplay(MoodeDisplay):
+    """MoodeDisplay drawn with Pillow straight to the framebuffer (no X/Tk)
+    
+    Uses the same state handling as the Tk display; only the window,
+    widgets and drawing are replaced. Frames are built by FrameComposer,
+    taps come from TouchInput and callbacks run on a FrameLoop. The
+    radio browser needs Tk and is not available here.
+    """
+    
+    make_image = None  # The art loader hands over plain Pillow images
+    
+    def __init__(self, root, output):
+        self.output = output
+        super().__init__(root)
+    
+    def setup_window(self):
+        pass
+    
+    def create_radio_browser(self):
+        return None
+    
+    def show_radio_browser(self):
+        log_info("Radio browser is not available with the framebuffer backend")
+    
+    def create_widgets(self):
+        """Set up the composer, static buttons and touch input"""
+        self.composer = FrameComposer(self.output)
+        self.progress = ProgressEngine()
+        self.progress_after_id = None
+        self.shown_background = None
+        self.fonts = {}
+        self.touch_targets = {}  # name -> (box, action)
+        
+        self.progress_y = SCREEN_HEIGHT - 150
+        self.button_y = SCREEN_HEIGHT - 100
+        self.vol_x = SCREEN_WIDTH - 180
+        self.vol_y = SCREEN_HEIGHT - 50
+        center_x = SCREEN_WIDTH // 2
+        
+        self.button("prev", center_x - 105, self.button_y, (64, 56),
+                    self.draw_skip_icon, -1, self.prev_track)
+        self.button("next", center_x + 105, self.button_y, (64, 56),
+                    self.draw_skip_icon, 1, self.next_track)
+        
+        self.touch = TouchInput(
+            lambda x, y: self.root.after(0, self.handle_tap, x, y),
+            on_swipe=lambda direction: self.root.after(0, self.handle_swipe, direction))
+        self.touch.start()
+    
+    def font(self, size, bold=False):
+        if (size, bold) not in self.fonts:
+            ImageFont = lazy_import("PIL.ImageFont")
+            try:
+                self.fonts[size, bold] = ImageFont.truetype(FB_FONT_BOLD if bold else FB_FONT, size)
+            except OSError:
+                self.fonts[size, bold] = ImageFont.load_default()
+        return self.fonts[size, bold]
+    
+    def text(self, name, text, box, size, color=TEXT_COLOR, bold=False, align="center"):
+        font = self.font(size, bold)
+        
+        def paint(draw, x, y, state):
+            width = box[2] - box[0]
+            shown = fit_text(draw, state[0], font, width)
+            if align == "center":
+                x += (width - draw.textlength(shown, font=font)) / 2
+            elif align == "right":
+                x += width - draw.textlength(shown, font=font)
+            draw.text((x, y + (box[3] - box[1]) / 2), shown, font=font,
+                      fill=state[1], anchor="lm")
+        
+        self.composer.element(name, box, (text, color), paint)
+    
+    def button(self, name, center_x, center_y, size, icon, state, action):
+        width, height = size
+        box = (center_x - width // 2, center_y - height // 2,
+               center_x + width // 2, center_y + height // 2)
+        
+        def paint(draw, x, y, state):
+            draw.rounded_rectangle((x, y, x + width - 1, y + height - 1), radius=8,
+                                   fill=BUTTON_BG)
+            icon(draw, x + width // 2, y + height // 2, state)
+        
+        self.composer.element(name, box, state, paint)
+        self.touch_targets[name] = (box, action)
+    
+    def hide(self, name):
+        self.composer.remove(name)
+        self.touch_targets.pop(name, None)
+    
+    @staticmethod
+    def draw_skip_icon(draw, x, y, direction):
+        tip = x + 7 * direction  # Triangle points the way it skips, bar at the tip
+        draw.polygon([(x - 11 * direction, y - 11), (x - 11 * direction, y + 11), (tip, y)],
+                     fill=TEXT_COLOR)
+        bar = tip + 4 * direction
+        draw.rectangle((min(tip, bar), y - 11, max(tip, bar), y + 11), fill=TEXT_COLOR)
+    
+    @staticmethod
+    def draw_play_icon(draw, x, y, playing):
+        if playing:
+            draw.rectangle((x - 9, y - 12, x - 3, y + 12), fill=TEXT_COLOR)
+            draw.rectangle((x + 3, y - 12, x + 9, y + 12), fill=TEXT_COLOR)
+        else:
+            draw.polygon([(x - 8, y - 13), (x - 8, y + 13), (x + 13, y)], fill=TEXT_COLOR)
+    
+    @staticmethod
+    def draw_volume_icon(draw, x, y, sign):
+        draw.rectangle((x - 10, y - 2, x + 10, y + 2), fill=TEXT_COLOR)
+        if sign > 0:
+            draw.rectangle((x - 2, y - 10, x + 2, y + 10), fill=TEXT_COLOR)
+    
+    @staticmethod
+    def draw_mute_icon(draw, x, y, muted):
+        draw.polygon([(x - 13, y - 5), (x - 7, y - 5), (x + 1, y - 12), (x + 1, y + 12),
+                      (x - 7, y + 5), (x - 13, y + 5)], fill=TEXT_COLOR)
+        if muted:
+            draw.line((x + 5, y - 6, x + 13, y + 6), fill=TEXT_COLOR, width=3)
+            draw.line((x + 5, y + 6, x + 13, y - 6), fill=TEXT_COLOR, width=3)
+        else:
+            draw.arc((x - 4, y - 9, x + 9, y + 9), -50, 50, fill=TEXT_COLOR, width=2)
+            draw.arc((x - 4, y - 15, x + 15, y + 15), -50, 50, fill=TEXT_COLOR, width=2)
+    
+    def handle_tap(self, x, y):
+        """Frame loop: run the action of the button under the tap"""
+        was_idle = self.screen_idle
+        self.note_activity()
+        if was_idle:
+            return  # The tap only wakes the screen
+        for name, (box, action) in list(self.touch_targets.items()):
+            if box[0] <= x < box[2] and box[1] <= y < box[3]:
+                log_debug("Tap: %s", name)
+                action()
+                return
+    
+    def handle_swipe(self, direction):
+        """Frame loop: a sideways swipe switches players"""
+        was_idle = self.screen_idle
+        self.note_activity()
+        if not was_idle:
+            self.switch_player(direction)
+    
+    def update_display(self):
+        """Compose the frame and write the parts that changed"""
+        if self.screen_idle:
+            return
+        start = time.perf_counter()
+        state = self.state
+        try:
+            if self.album_art_image is not self.shown_background:
+                self.composer.set_background(self.album_art_image)
+                self.shown_background = self.album_art_image
+            
+            width = SCREEN_WIDTH
+            if state.title:
+                self.text("title", state.title, (20, 40, width - 20, 80), 28, bold=True)
+                self.text("artist", state.artist, (20, 80, width - 20, 110), 21)
+                self.text("album", state.album, (20, 112, width - 20, 138), 18, "#CCCCCC")
+            else:
+                self.text("title", "No Track Playing", (20, 40, width - 20, 80), 28, bold=True)
+                self.hide("artist")
+                self.hide("album")
+            
+            dot = ACCENT_COLOR if state.playing else "#666666"
+            self.composer.element("status", (25, 25, 36, 36), dot,
+                                  lambda draw, x, y, fill: draw.ellipse(
+                                      (x, y, x + 10, y + 10), fill=fill))
+            self.button("play", width // 2, self.button_y, (64, 56), self.draw_play_icon,
+                        state.playing, self.toggle_play)
+            
+            if self.players:
+                # Player name (multi-player mode): tap or swipe to switch
+                box = (width - 260, 12, width - 20, 40)
+                self.text("player", f"{state.player} ›", box, 16, "#CCCCCC", align="right")
+                self.touch_targets["player"] = (box, lambda: self.switch_player(1))
+            
+            self.draw_progress()
+            
+            # Volume controls (hidden during Spotify, like the Tk display)
+            if state.source != "spotify":
+                volume = "Muted" if state.muted else f"Vol: {state.volume}"
+                self.button("vol_down", self.vol_x - 60, self.vol_y, (48, 44),
+                            self.draw_volume_icon, -1, self.volume_down)
+                self.text("volume", volume, (self.vol_x - 40, self.vol_y - 15,
+                                             self.vol_x + 60, self.vol_y + 15), 20, bold=True)
+                self.button("vol_up", self.vol_x + 80, self.vol_y, (48, 44),
+                            self.draw_volume_icon, 1, self.volume_up)
+                self.button("mute", self.vol_x + 140, self.vol_y, (48, 44),
+                            self.draw_mute_icon, state.muted, self.toggle_mute)
+            else:
+                for name in ("vol_down", "volume", "vol_up", "mute"):
+                    self.hide(name)
+            
+            self.composer.flush()
+        except Exception as e:
+            log_error(f"Display update error: {e}")
+        
+        self.schedule_progress()
+        METRICS.observe("update_display", (time.perf_counter() - start) * 1000)
+        self.frame_drawn()
+    
+    def draw_progress(self):
+        """Progress bar and time labels from the interpolated position"""
+        y = self.progress_y
+        bar = (80, y + 10, SCREEN_WIDTH - 80, y + 18)
+        duration = int(self.progress.duration)
+        elapsed = self.progress.position() if duration > 0 else 0
+        width = round((bar[2] - bar[0]) * elapsed / duration) if duration > 0 else 0
+        
+        def paint(draw, x, y, filled):
+            draw.rectangle((x, y, x + bar[2] - bar[0] - 1, y + 7), fill="#333333")
+            if filled:
+                draw.rectangle((x, y, x + filled - 1, y + 7), fill=ACCENT_COLOR)
+        
+        self.composer.element("progress", bar, width, paint)
+        
+        elapsed = int(elapsed)
+        self.text("elapsed", f"{elapsed // 60}:{elapsed % 60:02d}",
+                  (10, y + 2, 74, y + 26), 16, align="right")
+        self.text("duration", f"{duration // 60}:{duration % 60:02d}",
+                  (SCREEN_WIDTH - 74, y + 2, SCREEN_WIDTH - 10, y + 26), 16, align="left")
+    
+    def animate_progress(self):
+        """Frame loop timer: advance the progress bar (no I/O)"""
+        self.progress_after_id = None
+        try:
+            self.draw_progress()
+            self.composer.flush()
+        except Exception as e:
+            log_error(f"Progress update error: {e}")
+        self.schedule_progress()
+    
+    def enter_idle_screen(self, mode):
+        level = SCREEN_DIM_LEVEL if mode == "dim" else 0
+        if self.backlight.set_level(level):
+            return
+        # No backlight control - darken or clear the framebuffer itself
+        frame = self.composer.frame
+        if mode == "dim":
+            ImageEnhance = lazy_import("PIL.ImageEnhance")
+            idle = ImageEnhance.Brightness(frame).enhance(SCREEN_DIM_LEVEL)
+        else:
+            idle = Image.new("RGB", frame.size, "#000000")
+        self.output.write(idle, [(0, 0) + frame.size])
+    
+    def leave_idle_screen(self):
+        self.backlight.restore()
+        self.composer.dirty.append((0, 0) + self.composer.size)
+    
+    def cleanup(self):
+        super().cleanup()
+        self.touch.stop()
+        self.output.close()
+
+def _benchmark_pipeline(pipeline, images, runs, results):
+    """Child process for benchmark_art: time one pipeline, report peak RSS"""
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    for _ in range(runs):
+        for data in images:
+            process_background(data, pipeline=pipeline)
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    results.put((elapsed * 1000 / (runs * len(images)), (peak - baseline) / 1024))
+
+def benchmark_art(paths, runs=ART_BENCHMARK_RUNS):
+    """Compare background pipelines: ms per image and peak memory
+    
+    Returns False if a pipeline's process died (e.g. killed for memory).
+    """
+    images = []
+    for path in paths:
+        with open(path, 'rb') as f:
+            images.append(f.read())
+    if not images:
+        # Typical cover sizes: Spotify 640x640, local files often larger
+        for size in (640, 1000):
+            out = BytesIO()
+            Image.effect_noise((size, size), 64).convert('RGB').save(
+                out, format="JPEG", quality=90)
+            images.append(out.getvalue())
+    
+    print(f"Album art pipelines: {len(images)} image(s) x {runs} runs, "
+          f"target {SCREEN_WIDTH}x{SCREEN_HEIGHT}")
+    
+    # Each pipeline runs in a fresh process so peak RSS is its own
+    ctx = lazy_import("multiprocessing").get_context("fork")
+    ok = True
+    for pipeline in ("quality", "fast"):
+        results = ctx.Queue()
+        proc = ctx.Process(target=_benchmark_pipeline,
+                           args=(pipeline, images, runs, results))
+        proc.start()
+        result = None
+        while result is None:
+            try:
+                result = results.get(timeout=1)
+            except queue.Empty:
+                if not proc.is_alive():
+                    try:
+                        result = results.get(timeout=0.1)  # Sent just before exiting
+                    except queue.Empty:
+                        pass
+                    break
+        proc.join()
+        if result is None:
+            # Exception (traceback printed by the child) or a signal
+            print(f"  {pipeline:8s} failed (exit code {proc.exitcode})")
+            ok = False
+            continue
+        ms_per_image, peak_mb = result
+        print(f"  {pipeline:8s} {ms_per_image:8.1f} ms/image   "
+              f"peak +{peak_mb:.1f} MB")
+    return ok
+
+def parse_player(spec):
+    """--player NAME=HOST[:PORT] (or NAME=/path/to/socket) -> MPD_PLAYERS entry"""
+    name, sep, address = spec.partition("=")
+    if not sep or not name or not address:
+        raise argparse.ArgumentTypeError(f"expected NAME=HOST[:PORT], got {spec!r}")
+    if address.startswith("/") or ":" not in address:
+        return (name, address, None)
+    host, _, port = address.rpartition(":")
+    try:
+        return (name, host, int(port))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"bad port in {spec!r}")
 
 def main():
+    global MPD_PLAYERS
+    parser = argparse.ArgumentParser(description="Moode Audio touchscreen display")
+    parser.add_argument("--benchmark-art", nargs="*", metavar="IMAGE",
+                        help="benchmark album art pipelines (synthetic covers "
+                             "if no images given) and exit")
+    parser.add_argument("--framebuffer", nargs="?", const=FB_DEVICE, metavar="DEVICE",
+                        help="draw with Pillow straight to the framebuffer "
+                             f"(default {FB_DEVICE}) instead of a Tk window")
+    parser.add_argument("--output-image", metavar="FILE",
+                        help="framebuffer backend writing frames to a PNG (or raw "
+                             "RGB) file instead of a screen, for testing")
+    parser.add_argument("--player", action="append", type=parse_player,
+                        metavar="NAME=HOST[:PORT]",
+                        help="monitor this moOde player; repeat for several and "
+                             "swipe to switch (overrides MPD_PLAYERS)")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="print time to first frame with per-phase import and "
+                             "initialisation costs once startup has finished")
+    args = parser.parse_args()
+    if args.profile_startup:
+        STARTUP.echo = True
+    if args.player:
+        MPD_PLAYERS = args.player
+    
+    if args.benchmark_art is not None:
+        if not benchmark_art(args.benchmark_art):
+            sys.exit(1)
+        return
+    
     log_debug("="*50)
-    log_debug("Moode Display starting...")
+    log_info("Moode Display starting...")
+    
+    if args.framebuffer or args.output_image or RENDER_BACKEND == "framebuffer":
+        with STARTUP.phase("open framebuffer"):
+            if args.output_image:
+                output = ImageFileOutput(args.output_image)
+            else:
+                output = FramebufferOutput(args.framebuffer)
+        loop = FrameLoop()
+        app = FramebufferDisplay(loop, output)
+        signal.signal(signal.SIGTERM, lambda signum, frame: loop.quit())
+        try:
+            loop.mainloop()
+        except KeyboardInterrupt:
+            log_info("Display stopped by user")
+        app.cleanup()
+        return
     
-    root = tk.Tk()
+    with STARTUP.phase("Tk window"):
+        root = tk.Tk()
     app = MoodeDisplay(root)
     
     # Handle window close
@@ -946,7 +4916,7 @@ def main():
         root.mainloop()
     except KeyboardInterrupt:
         app.cleanup()
-        log_debug("Display stopped by user")
+        log_info("Display stopped by user")
 
 if __name__ == "__main__":
     main()
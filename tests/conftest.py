@@ -0,0 +1,55 @@
+"""Shared fixtures: the display configured against a stand-in MPD server"""
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+import moode_display as md
+from fake_mpd import FakeMPDServer, FakeMPDState
+
+@pytest.fixture
+def mpd_state():
+    songs = [{"file": f"Album/{n:02d}.flac", "Artist": "Artist", "Title": f"Track {n}",
+              "Album": "Album", "duration": 240} for n in range(5)]
+    return FakeMPDState(songs)
+
+@pytest.fixture
+def mpd_server(mpd_state):
+    server = FakeMPDServer(mpd_state).start()
+    yield server
+    server.stop()
+
+@pytest.fixture
+def backlight(tmp_path):
+    """Writable stand-in for /sys/class/backlight/<device>"""
+    directory = tmp_path / "backlight"
+    directory.mkdir()
+    (directory / "brightness").write_text("200")
+    (directory / "max_brightness").write_text("255")
+    return directory
+
+@pytest.fixture
+def display_config(tmp_path, monkeypatch, mpd_server, backlight):
+    """Module settings for a display that touches nothing outside tmp_path"""
+    settings = {
+        "LOG_FILE": str(tmp_path / "display.log"),
+        "ART_CACHE_DIR": str(tmp_path / "art"),
+        "SPOTMETA_FILE": str(tmp_path / "spotmeta.txt"),
+        "DB_PATH": str(tmp_path / "moode-sqlite3.db"),
+        "STATION_INDEX_PATH": str(tmp_path / "stations.db"),
+        "BACKLIGHT_DIR": str(backlight),
+        "MPD_HOST": "127.0.0.1",
+        "MPD_PORT": mpd_server.port,
+        "MPD_SOCKET": "",
+        "MPD_PLAYERS": [],
+        "METRICS_PORT": 0,
+        "PUSH_PORT": 0,
+    }
+    for name, value in settings.items():
+        monkeypatch.setattr(md, name, value)
+    return md
@@ -0,0 +1,73 @@
+"""Album art loader: one fetch per source, whoever asks first"""
+
+import threading
+import time
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+import moode_display as md
+
+@pytest.fixture
+def loader(display_config):
+    cache = md.AlbumArtCache()
+    loader = md.AlbumArtLoader(cache, lambda: None)
+    yield loader
+    loader.shutdown()
+
+def cover():
+    out = BytesIO()
+    Image.new("RGB", (300, 300), "#336699").save(out, format="JPEG")
+    return out.getvalue()
+
+class SlowFetch:
+    """Counts calls; blocks until released so jobs overlap"""
+    
+    def __init__(self):
+        self.calls = 0
+        self.release = threading.Event()
+    
+    def __call__(self):
+        self.calls += 1
+        self.release.wait(5)
+        return cover()
+
+def drain_until_shown(loader, timeout=5):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        changed, image = loader.drain()
+        if changed:
+            return image
+        time.sleep(0.01)
+    raise AssertionError("art never delivered")
+
+def test_prefetch_of_requested_source_is_skipped(loader):
+    fetch = SlowFetch()
+    loader.request("mpd:Album", fetch)
+    loader.prefetch("mpd:Album", fetch)
+    time.sleep(0.1)  # Let a duplicate job reach fetch()
+    fetch.release.set()
+    assert drain_until_shown(loader) is not None
+    assert fetch.calls == 1
+    assert loader.cache.misses == 1
+
+def test_request_joins_running_prefetch(loader):
+    fetch = SlowFetch()
+    loader.prefetch("mpd:Album", fetch)
+    loader.request("mpd:Album", fetch)
+    time.sleep(0.1)
+    fetch.release.set()
+    assert drain_until_shown(loader) is not None
+    assert fetch.calls == 1
+    assert loader.shown == loader.cache.key("mpd:Album")
+
+def test_joined_request_superseded_by_newer_one(loader):
+    fetch = SlowFetch()
+    loader.prefetch("mpd:Album", fetch)
+    loader.request("mpd:Album", fetch)
+    loader.request(None, None)
+    fetch.release.set()
+    assert drain_until_shown(loader) is None
+    time.sleep(0.1)
+    assert loader.drain() == (False, None)
@@ -0,0 +1,47 @@
+"""Album art cache disk tier: eviction and statistics"""
+
+import threading
+
+import moode_display as md
+
+def fill(cache, count, size):
+    for n in range(count):
+        cache.put_original(f"source {n}", bytes(size))
+
+def test_eviction_keeps_disk_under_budget(display_config, tmp_path):
+    cache = md.AlbumArtCache(str(tmp_path / "cache"), max_bytes=10000)
+    fill(cache, 8, 3000)
+    on_disk = sum(size for _, size, _ in cache._disk_files())
+    assert on_disk <= 10000
+    assert cache.disk_bytes == on_disk
+    assert cache.get_original("source 7") is not None  # Newest kept
+
+def test_eviction_scans_without_the_lock(display_config, tmp_path, monkeypatch):
+    cache = md.AlbumArtCache(str(tmp_path / "cache"), max_bytes=10000)
+    scan = cache._disk_files
+    held = []
+    
+    def watched_scan():
+        held.append(cache.lock.locked())
+        return scan()
+    
+    monkeypatch.setattr(cache, "_disk_files", watched_scan)
+    fill(cache, 8, 3000)
+    assert held and not any(held)
+
+def test_counters_from_many_threads(display_config, tmp_path):
+    cache = md.AlbumArtCache(str(tmp_path / "cache"))
+    cache.put_original("source", b"data")
+    
+    def worker():
+        for _ in range(500):
+            cache.count_miss()
+            cache.get_original("source")
+    
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert cache.misses == 2000
+    assert cache.original_hits == 2000
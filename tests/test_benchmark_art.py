@@ -0,0 +1,43 @@
+"""--benchmark-art reports a pipeline whose process dies instead of hanging"""
+
+import os
+import signal
+from io import BytesIO
+
+from PIL import Image
+
+import moode_display as md
+
+def cover(tmp_path):
+    path = tmp_path / "cover.jpg"
+    out = BytesIO()
+    Image.new("RGB", (200, 200), "#884422").save(out, format="JPEG")
+    path.write_bytes(out.getvalue())
+    return str(path)
+
+def test_all_pipelines_reported(display_config, tmp_path, capsys):
+    assert md.benchmark_art([cover(tmp_path)], runs=1)
+    out = capsys.readouterr().out
+    assert "quality" in out and "fast" in out and "failed" not in out
+
+def test_crashing_pipeline_is_reported(display_config, tmp_path, monkeypatch, capsys):
+    process = md.process_background
+    
+    def crash_quality(data, pipeline=None):
+        if pipeline == "quality":
+            raise MemoryError("simulated")
+        return process(data, pipeline=pipeline)
+    
+    monkeypatch.setattr(md, "process_background", crash_quality)
+    assert not md.benchmark_art([cover(tmp_path)], runs=1)
+    out = capsys.readouterr().out
+    assert "quality  failed (exit code 1)" in out
+    assert "ms/image" in out  # fast still measured
+
+def test_killed_pipeline_is_reported(display_config, tmp_path, monkeypatch, capsys):
+    def killed(data, pipeline=None):
+        os.kill(os.getpid(), signal.SIGKILL)  # Like the OOM killer
+    
+    monkeypatch.setattr(md, "process_background", killed)
+    assert not md.benchmark_art([cover(tmp_path)], runs=1)
+    assert capsys.readouterr().out.count("failed (exit code -9)") == 2
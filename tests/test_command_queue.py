@@ -0,0 +1,47 @@
+"""MPD command queue: how coalesced skips are sent"""
+
+import pytest
+
+import moode_display as md
+
+class StatusClient:
+    """Answers status from a dict; records command lists"""
+    
+    def __init__(self, **status):
+        self.status = {"song": "3", "playlistlength": "10", "random": "0", "consume": "0"}
+        self.status.update(status)
+        self.sent = []
+    
+    def command(self, name, *args):
+        assert name == "status"
+        return list(self.status.items())
+    
+    def command_list(self, commands):
+        self.sent.append(commands)
+
+def queue_for(client):
+    return md.MPDCommandQueue(client, on_done=lambda: None)
+
+def test_single_skip_needs_no_status():
+    client = StatusClient()
+    client.command = None  # Must not be called
+    assert queue_for(client).skip_commands(1) == [("next",)]
+
+def test_sequential_skips_become_one_jump():
+    client = StatusClient()
+    assert queue_for(client).skip_commands(3) == [("play", 6)]
+    assert queue_for(client).skip_commands(-5) == [("play", 0)]
+
+@pytest.mark.parametrize("mode", [{"random": "1"}, {"consume": "1"}, {"consume": "oneshot"}])
+def test_skips_stay_next_previous_with_random_or_consume(mode):
+    client = StatusClient(**mode)
+    assert queue_for(client).skip_commands(3) == [("next",)] * 3
+    assert queue_for(client).skip_commands(-2) == [("previous",)] * 2
+
+def test_coalesced_skips_are_one_command_list():
+    client = StatusClient(random="1")
+    queue = queue_for(client)
+    queue.skip(1)
+    queue.skip(1)
+    queue.send(queue.pending)
+    assert client.sent == [[("next",), ("next",)]]
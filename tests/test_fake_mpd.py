@@ -0,0 +1,63 @@
+"""Stand-in MPD server (benchmarks/fake_mpd.py) protocol behaviour"""
+
+import os
+import socket
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "benchmarks"))
+
+from fake_mpd import FakeMPDServer, FakeMPDState
+
+SONGS = [{"file": f"Album/{n:02d}.flac", "Artist": "Artist", "Title": f"Track {n}",
+          "Album": "Album", "duration": 240} for n in range(5)]
+
+@pytest.fixture
+def server():
+    server = FakeMPDServer(FakeMPDState(list(SONGS))).start()
+    yield server
+    server.stop()
+
+def connect(server):
+    conn = socket.create_connection(("127.0.0.1", server.port), timeout=2)
+    reader = conn.makefile("rb")
+    assert reader.readline().startswith(b"OK MPD")
+    return conn, reader
+
+def response(reader):
+    lines = []
+    while True:
+        line = reader.readline().decode().rstrip("\n")
+        if line == "OK" or line.startswith("ACK"):
+            return lines, line
+        lines.append(line)
+
+def test_idle_reports_change_made_between_idles(server):
+    conn, reader = connect(server)
+    conn.sendall(b"next\n")
+    assert response(reader) == ([], "OK")
+    conn.sendall(b"idle player mixer\n")
+    assert response(reader) == (["changed: player"], "OK")
+    conn.close()
+
+def test_idle_reports_change_from_other_client_between_idles(server):
+    watcher, watcher_reader = connect(server)
+    control, control_reader = connect(server)
+    control.sendall(b"setvol 20\n")
+    assert response(control_reader) == ([], "OK")
+    watcher.sendall(b"idle\n")
+    assert response(watcher_reader) == (["changed: mixer"], "OK")
+    watcher.close()
+    control.close()
+
+def test_idle_does_not_repeat_reported_changes(server):
+    conn, reader = connect(server)
+    conn.sendall(b"next\n")
+    response(reader)
+    conn.sendall(b"idle\n")
+    assert response(reader) == (["changed: player"], "OK")
+    conn.sendall(b"idle\n")
+    conn.sendall(b"noidle\n")
+    assert response(reader) == ([], "OK")
+    conn.close()
@@ -0,0 +1,101 @@
+"""Idle screen: the tap that wakes a blanked/dimmed screen does nothing else"""
+
+import time
+import tkinter as tk
+from types import SimpleNamespace
+
+import pytest
+
+@pytest.fixture
+def dim_after_idle(display_config, monkeypatch, mpd_state):
+    md = display_config
+    monkeypatch.setattr(md, "SCREEN_IDLE_MODE", "dim")
+    monkeypatch.setattr(md, "SCREEN_IDLE_TIMEOUT", 1)
+    mpd_state.set_state("stop")
+    return md
+
+def wait_for(condition, step, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        step()
+
+def test_tap_on_dimmed_framebuffer_only_wakes(dim_after_idle, tmp_path, mpd_state, backlight):
+    md = dim_after_idle
+    loop = md.FrameLoop()
+    app = md.FramebufferDisplay(loop, md.ImageFileOutput(str(tmp_path / "frame.png")))
+    result = {}
+    
+    def step():
+        loop.after(50, loop.quit)
+        loop.mainloop()
+    
+    try:
+        wait_for(lambda: app.screen_idle, step)
+        result["dimmed"] = (backlight / "brightness").read_text()
+        box, _ = app.touch_targets["play"]
+        app.handle_tap((box[0] + box[2]) // 2, (box[1] + box[3]) // 2)
+        wait_for(lambda: not app.screen_idle, step)
+        for _ in range(10):
+            step()  # Time for a (wrongly) pressed button to reach MPD
+    finally:
+        app.cleanup()
+    
+    assert result["dimmed"] == "51"
+    assert (backlight / "brightness").read_text() == "200"
+    assert not app.state.playing
+    assert mpd_state.state == "stop"
+
+def test_tap_on_dimmed_tk_screen_only_wakes(dim_after_idle, mpd_state, backlight):
+    md = dim_after_idle
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        pytest.skip(f"No display for Tk: {e}")
+    app = md.MoodeDisplay(root)
+    
+    def step():
+        root.update()
+        time.sleep(0.02)
+    
+    try:
+        wait_for(lambda: app.screen_idle, step)
+        assert (backlight / "brightness").read_text() == "51"
+        assert app.idle_cover is not None and root.grab_current() is app.idle_cover
+        app.btn_play.event_generate("<ButtonPress-1>")
+        app.btn_play.event_generate("<ButtonRelease-1>")
+        wait_for(lambda: not app.screen_idle, step)
+        for _ in range(25):
+            step()
+    finally:
+        app.cleanup()
+        root.destroy()
+    
+    assert (backlight / "brightness").read_text() == "200"
+    assert not app.state.playing
+    assert mpd_state.state == "stop"
+
+def touch_handlers(md, screen_idle):
+    """Stand-in display for the Tk press/release handlers"""
+    app = SimpleNamespace(screen_idle=screen_idle, idle_cover=None, swipe_origin=None,
+                          radio_browser=None, activity=[], switched=[])
+    app.note_activity = lambda: app.activity.append(True)
+    app.switch_player = app.switched.append
+    press = lambda x: md.MoodeDisplay.touch_start(
+        app, SimpleNamespace(num=1, widget=None, x_root=x, y_root=200))
+    release = lambda x: md.MoodeDisplay.swipe_end(app, SimpleNamespace(x_root=x, y_root=200))
+    return app, press, release
+
+def test_waking_touch_that_moves_sideways_does_not_switch_player(display_config):
+    app, press, release = touch_handlers(display_config, screen_idle=True)
+    press(600)
+    release(100)
+    assert app.activity == [True]
+    assert app.switched == []
+
+def test_swipe_on_awake_screen_switches_player(display_config):
+    app, press, release = touch_handlers(display_config, screen_idle=False)
+    press(600)
+    release(100)
+    assert app.activity == [True]
+    assert app.switched == [1]
@@ -0,0 +1,60 @@
+"""Multi-player mode: PlayerMonitor recovery and MultiPlayer commands"""
+
+import time
+
+import pytest
+
+import moode_display as md
+
+@pytest.fixture
+def players(display_config, monkeypatch, mpd_server):
+    monkeypatch.setattr(md, "MPD_RECONNECT_DELAY", 0.1)
+    players = md.MultiPlayer([("Room", "127.0.0.1", mpd_server.port)], lambda monitor: None)
+    yield players
+    players.stop()
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+def test_monitor_reconnects_after_unexpected_error(players, monkeypatch):
+    parse = md.MPDStatus
+    failures = []
+    
+    def bad_response_once(status, song):
+        if not failures:
+            failures.append(True)
+            raise ValueError("malformed response")
+        return parse(status, song)
+    
+    monkeypatch.setattr(md, "MPDStatus", bad_response_once)
+    players.start()
+    wait_for(lambda: players.current.status is not None)
+    assert failures
+    assert players.connected
+    assert players.status_snapshot().state == "play"
+
+def test_timed_out_command_is_not_run_later(players, monkeypatch, mpd_state):
+    slow_list = md.AsyncMPDConnection.command_list
+    
+    async def slow_ping(conn, commands):
+        if commands[0][0] == "ping":
+            await md.lazy_import("asyncio").sleep(0.5)
+        return await slow_list(conn, commands)
+    
+    monkeypatch.setattr(md.AsyncMPDConnection, "command_list", slow_ping)
+    players.start()
+    wait_for(lambda: players.connected)
+    monkeypatch.setattr(md, "MPD_TIMEOUT", 0.1)
+    with pytest.raises(Exception):
+        players.command_list([("ping",)])
+    with pytest.raises(Exception):
+        players.command_list([("setvol", "10")])  # Queued behind the ping
+    time.sleep(0.8)
+    assert mpd_state.volume == 50
+    
+    monkeypatch.setattr(md, "MPD_TIMEOUT", 2)
+    players.command_list([("setvol", "30")])
+    assert mpd_state.volume == 30
@@ -0,0 +1,40 @@
+"""Station search index: picks up moOde edits still in the WAL"""
+
+import os
+import sqlite3
+
+import moode_display as md
+
+def make_db(path):
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA wal_autocheckpoint=0")  # Keep edits in the -wal file
+    conn.execute("CREATE TABLE cfg_radio (id INTEGER PRIMARY KEY, station TEXT, "
+                 "name TEXT, type TEXT, logo TEXT, genre TEXT, broadcaster TEXT, "
+                 "language TEXT, country TEXT, region TEXT, bitrate TEXT, format TEXT)")
+    conn.execute("INSERT INTO cfg_radio VALUES (1, 'http://a', 'Jazz Radio', 'r', 'local', "
+                 "'Jazz', '', 'English', 'France', '', '128', 'MP3')")
+    conn.commit()
+    return conn
+
+def test_sync_sees_station_added_in_wal(display_config, tmp_path):
+    db = str(tmp_path / "moode-sqlite3.db")
+    writer = make_db(db)
+    search = md.StationSearch(db, str(tmp_path / "stations.db"))
+    try:
+        search.sync()
+        assert search.query("Blues")[1] == 0
+        
+        db_mtime = os.stat(db).st_mtime_ns
+        writer.execute("INSERT INTO cfg_radio VALUES (2, 'http://b', 'Blues Radio', 'r', "
+                       "'local', 'Blues', '', 'English', 'Spain', '', '128', 'MP3')")
+        writer.commit()
+        os.utime(db + "-wal", ns=(db_mtime + 10**9, db_mtime + 10**9))
+        assert os.stat(db).st_mtime_ns == db_mtime  # Only the WAL changed
+        
+        search.sync()
+        stations, total = search.query("Blues")
+        assert total == 1
+    finally:
+        search.close()
+        writer.close()